@@ -5,11 +5,16 @@
 功能：提供图形化界面，简化测试数据生成操作
 """
 
+import time
+
+# 记录进程启动后的时间基准，用于统计首帧耗时
+_STARTUP_T0 = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
 import sys
-import threading
+import multiprocessing
 
 # 添加父目录到路径，以便导入模块
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -23,21 +28,12 @@ def main():
     try:
         print("启动数据生成器...")
 
-        # 启动更新检查（在后台线程中）
+        # 创建更新检查器（检查本身在首帧绘制后于后台线程中进行）
+        update_checker = None
         try:
             update_checker = UpdateChecker()
-
-            # 延迟2秒后检查更新，避免影响程序启动速度
-            def delayed_update_check():
-                import time
-                time.sleep(2)
-                update_checker.start_update_check()
-
-            update_thread = threading.Thread(target=delayed_update_check, daemon=True)
-            update_thread.start()
-            print("更新检查已启动")
         except Exception as e:
-            print(f"启动更新检查失败: {e}")
+            print(f"创建更新检查器失败: {e}")
 
         root = tk.Tk()
         app = MainWindow(root)
@@ -47,7 +43,7 @@ def main():
             if hasattr(app, 'menubar'):
                 # 创建帮助菜单
                 help_menu = tk.Menu(app.menubar, tearoff=0)
-                help_menu.add_command(label="检查更新", command=lambda: update_checker.manual_check_update())
+                help_menu.add_command(label="检查更新", command=lambda: update_checker.manual_check_update(root))
                 help_menu.add_separator()
                 help_menu.add_command(label="版本更新工具", command=open_version_updater)
                 help_menu.add_command(label="配置GitHub", command=open_config_setup)
@@ -56,6 +52,17 @@ def main():
             print(f"添加更新菜单失败: {e}")
 
         print("界面初始化完成")
+
+        # 首帧绘制后再启动更新检查；检查间隔内直接使用缓存结果，不访问网络
+        profiling = bool(os.environ.get('TKTOOL_STARTUP_PROFILE'))
+        if update_checker is not None and not profiling:
+            root.after_idle(update_checker.start_update_check)
+            print("更新检查已启动")
+
+        # 设置 TKTOOL_STARTUP_PROFILE=1 时，首帧绘制后输出耗时并退出（供 scripts/startup_benchmark.py 使用）
+        if profiling:
+            root.after_idle(lambda: report_first_frame(root))
+
         root.mainloop()
         print("程序正常退出")
     except Exception as e:
@@ -64,6 +71,14 @@ def main():
         traceback.print_exc()
 
 
+def report_first_frame(root):
+    """输出从启动到首帧绘制完成的耗时，然后关闭窗口"""
+    root.update_idletasks()
+    elapsed_ms = (time.perf_counter() - _STARTUP_T0) * 1000
+    print(f"STARTUP_FIRST_FRAME_MS={elapsed_ms:.1f}")
+    root.destroy()
+
+
 def open_version_updater():
     """打开版本更新工具"""
     try:
@@ -85,4 +100,10 @@ def open_config_setup():
 
 
 if __name__ == "__main__":
+    # 打包后对拍的工作进程需要由此启动
+    multiprocessing.freeze_support()
+    # 打包后 Python 解题代码的子进程也由此启动
+    if len(sys.argv) > 2 and sys.argv[1] == '--solution-host':
+        from core.solution_host import run
+        sys.exit(run(*sys.argv[2:4]))
     main()
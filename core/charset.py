@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+字符集
+功能：把 'a-z'、'0-9'、'一-龥' 这类字符集定义解析为码点区间，
+随机取字符时按前缀和二分定位，不需要展开成完整的字符串
+"""
+
+import random
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Optional
+
+# 字符总数不超过该值时缓存展开后的字符串，用 random.choices 批量抽取更快
+SMALL_ALPHABET_SIZE = 1024
+
+
+class Charset:
+    """由码点区间组成的字符集
+
+    区间按起点排序；重复出现的字符各自计数（与展开后的字符串中出现多次一致）。
+    """
+
+    __slots__ = ('definition', 'starts', 'cumulative', 'size', '_alphabet')
+
+    def __init__(self, definition: str, intervals: List[tuple]):
+        intervals = sorted(intervals)
+        self.definition = definition
+        self.starts = [start for start, _ in intervals]
+        self.cumulative = []  # 第 i 个区间及之前的字符总数
+        total = 0
+        for start, end in intervals:
+            total += end - start + 1
+            self.cumulative.append(total)
+        self.size = total
+        self._alphabet = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def char_at(self, index: int) -> str:
+        """返回第 index 个字符（0 <= index < size）"""
+        interval = bisect_right(self.cumulative, index)
+        offset = index - (self.cumulative[interval - 1] if interval else 0)
+        return chr(self.starts[interval] + offset)
+
+    def small_alphabet(self) -> Optional[str]:
+        """字符较少时返回展开后的字符串（只展开一次），否则返回None"""
+        if self._alphabet is None and self.size <= SMALL_ALPHABET_SIZE:
+            self._alphabet = self.expand()
+        return self._alphabet
+
+    def expand(self) -> str:
+        """展开为完整的字符串"""
+        return ''.join(self.char_at(index) for index in range(self.size))
+
+    def random_char(self, rng: random.Random) -> str:
+        """等概率随机取一个字符"""
+        return self.char_at(rng.randrange(self.size))
+
+    def random_chars(self, rng: random.Random, count: int) -> List[str]:
+        """批量随机取 count 个字符"""
+        alphabet = self.small_alphabet()
+        if alphabet is not None:
+            return rng.choices(alphabet, k=count)
+
+        rand = rng.random
+        size = self.size
+        if len(self.starts) == 1:
+            base = self.starts[0]
+            return [chr(base + int(rand() * size)) for _ in range(count)]
+        char_at = self.char_at
+        return [char_at(int(rand() * size)) for _ in range(count)]
+
+    def random_string(self, rng: random.Random, length: int) -> str:
+        """生成长度为 length 的随机字符串"""
+        return ''.join(self.random_chars(rng, length))
+
+
+@lru_cache(maxsize=256)
+def parse_charset(definition: str) -> Charset:
+    """解析字符集定义，相同定义只解析一次
+
+    Args:
+        definition: 字符集定义，如 'a-z', 'A-Z', '0-9', 'abc123', '一-龥'
+
+    Returns:
+        字符集对象；结束字符小于起始字符的范围不含任何字符
+    """
+    intervals = []
+    i = 0
+
+    while i < len(definition):
+        if i + 2 < len(definition) and definition[i + 1] == '-':
+            # 处理范围，如 'a-z'
+            start_code = ord(definition[i])
+            end_code = ord(definition[i + 2])
+            if start_code <= end_code:
+                intervals.append((start_code, end_code))
+            i += 3
+        else:
+            # 单个字符
+            code = ord(definition[i])
+            intervals.append((code, code))
+            i += 1
+
+    return Charset(definition, intervals)
@@ -8,9 +8,142 @@
 import os
 import sys
 import json
+import stat
+import atexit
+import tempfile
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from core.preview_limits import PREVIEW_CHAR_BUDGET, PREVIEW_LINE_BUDGET
+
+# 保存配置后延迟写盘的时间（秒），期间的多次修改合并为一次写入
+FLUSH_DELAY = 0.5
+# 新建配置文件时使用的权限
+NEW_FILE_MODE = 0o644
+
+
+class _ConfigStore:
+    """单个配置文件的共享缓存，负责延迟合并写入和原子替换"""
+
+    def __init__(self, config_file: Path):
+        self.config_file = config_file
+        self.lock = threading.Lock()
+        self.data = None  # 缓存的配置，None表示尚未加载
+        self.mtime_ns = None  # 缓存对应的文件修改时间，用于发现外部修改
+        self.dirty = False
+        self.timer = None
+        self.error = None  # 后台写盘失败的错误，由下一次保存报告
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """读取配置，文件未变化时直接返回缓存；文件不存在返回None"""
+        with self.lock:
+            if self.dirty:
+                return dict(self.data)
+
+            try:
+                mtime_ns = self.config_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                self.data, self.mtime_ns = None, None
+                return None
+
+            if self.data is None or mtime_ns != self.mtime_ns:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    self.data = json.load(f)
+                self.mtime_ns = mtime_ns
+            return dict(self.data)
+
+    def update(self, config: Dict[str, Any], delay: float = FLUSH_DELAY):
+        """更新内存中的配置，并在延迟后由后台线程写盘
+
+        Raises:
+            Exception: 上一次后台写盘失败时重新抛出该错误；本次的配置仍会在延迟后重新写盘
+        """
+        with self.lock:
+            self.data = dict(config)
+            self.dirty = True
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(delay, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+            error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    def flush(self) -> bool:
+        """立即把未写入的配置写盘（先写临时文件再替换，中途退出不会留下截断的文件）
+
+        写盘失败时记录错误并返回 False，后台线程中的失败由下一次 update 抛出。
+        """
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.dirty:
+                return True
+
+            temp_path = None
+            try:
+                fd, temp_path = tempfile.mkstemp(prefix=self.config_file.name + '.', suffix='.tmp',
+                                                 dir=str(self.config_file.parent))
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self.data, f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                # mkstemp 创建的文件权限为 0600，替换前改为原文件的权限
+                os.chmod(temp_path, _file_mode(self.config_file))
+                os.replace(temp_path, self.config_file)
+                self.mtime_ns = self.config_file.stat().st_mtime_ns
+                self.dirty = False
+                self.error = None
+                return True
+            except Exception as e:
+                print(f"保存配置失败: {e}")
+                self.error = e
+                if temp_path and os.path.exists(temp_path):
+                    try:
+                        os.remove(temp_path)
+                    except OSError:
+                        pass
+                return False
+
+
+def _file_mode(path: Path) -> int:
+    """配置文件应有的权限：已存在时沿用原文件的权限，否则为 0644
+
+    写盘在后台线程中进行，不能通过修改进程级的 umask 来读取它。
+    """
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return NEW_FILE_MODE
+
+
+_stores: Dict[str, _ConfigStore] = {}
+_stores_lock = threading.Lock()
+
+
+def _get_store(config_file: Path) -> _ConfigStore:
+    """获取配置文件对应的共享缓存，多个ConfigManager实例共用"""
+    key = os.path.abspath(str(config_file))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _ConfigStore(Path(key))
+            _stores[key] = store
+        return store
+
+
+def flush_all() -> bool:
+    """把所有未写入的配置写盘，程序退出时自动调用"""
+    with _stores_lock:
+        stores = list(_stores.values())
+    return all([store.flush() for store in stores])
+
+
+atexit.register(flush_all)
+
 
 class ConfigManager:
     """配置管理器"""
@@ -33,7 +166,16 @@ class ConfigManager:
             'test_count': '10',
             'no_duplicate': False,
             'delete_temp_files': False,
-            'output_dir': './test_data'
+            'output_dir': './test_data',
+            'budget_enabled': False,  # 按总规模分配（见 core.size_budget）
+            'budget_variable': '',
+            'budget_total': '',
+            'budget_max_case': False,
+            'multi_case_enabled': False,  # 每个文件包含多组数据，首行为组数 T
+            'multi_case_count': '100',
+            'multi_case_header': True,
+            'preview_char_budget': PREVIEW_CHAR_BUDGET,  # 预览时每组最多显示的字符数
+            'preview_line_budget': PREVIEW_LINE_BUDGET  # 预览时每组最多显示的行数
         }
 
     def load_config(self) -> Dict[str, Any]:
@@ -43,9 +185,8 @@ class ConfigManager:
             配置字典
         """
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+            config = _get_store(self.config_file).load()
+            if config is not None:
                 # 合并默认配置，确保所有必需的键都存在
                 merged_config = self.default_config.copy()
                 merged_config.update(config)
@@ -58,23 +199,33 @@ class ConfigManager:
     def save_config(self, config: Dict[str, Any]) -> bool:
         """保存配置
         
+        配置先更新到内存缓存，由后台线程在短暂延迟后写盘，不阻塞界面线程。
+        需要立即落盘并确认结果时调用 flush()。
+        
         Args:
             config: 要保存的配置字典
             
         Returns:
-            是否保存成功
+            是否保存成功；上一次后台写盘失败时返回 False（本次配置仍会重新写盘）
         """
         try:
             # 确保配置目录存在
             self.config_dir.mkdir(exist_ok=True)
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            _get_store(self.config_file).update(config)
             return True
         except Exception as e:
             print(f"保存配置失败: {e}")
             return False
 
+    def flush(self) -> bool:
+        """立即把未写入的配置写盘
+        
+        Returns:
+            是否写入成功，失败原因已打印
+        """
+        return _get_store(self.config_file).flush()
+
     def get_config_value(self, key: str, default=None) -> Any:
         """获取单个配置值
         
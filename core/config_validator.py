@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+配置静态检查
+功能：不生成任何数据，只根据变量配置检查类型、范围、字符集、引用和表达式，
+并按各字段的上界估算每组数据的值个数、输出大小和生成耗时
+"""
+
+import ast
+from typing import List, Dict, Any, Optional
+
+from core.generation_plan import plan_variable, PlannedVariable, Reference
+from core.structured_generators import STRUCTURED_SOURCES, TREE_SHAPES, TREE_FORMATS, GRAPH_TYPES
+
+# 各数据类型可用的来源类型，与界面中的下拉选项一致
+SUPPORTED_SOURCES = {
+    "整数": ["数据范围", "选择列表", "来自代码"] + STRUCTURED_SOURCES,
+    "浮点数": ["数据范围", "选择列表", "来自代码"],
+    "字符": ["选择列表", "字符集合", "来自代码"],
+    "字符串": ["数据范围", "选择列表", "字符集合", "来自代码"],
+}
+
+# 分隔符名称与实际字符，数据生成器也使用这张表
+SEPARATORS = {"无": "", "换行": "\n", "空格": " ", "制表符": "\t", "逗号": ",", "分号": ";"}
+
+# 生成每个值（结构化来源为每一项，字符串为每个字符）的大致耗时，单位为秒
+SECONDS_PER_VALUE = {
+    "整数": 1.5e-6,
+    "浮点数": 2.5e-6,
+    "选择列表": 0.4e-6,
+    "来自代码": 5e-5,
+    "排列": 1.3e-6,
+    "树": 1.5e-6,
+    "图": 5e-6,
+}
+SECONDS_PER_CHAR = 0.8e-6
+
+MAX_CODE_POINT = 0x10FFFF
+SURROGATES = (0xD800, 0xDFFF)
+
+
+def validate_configs(configs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """静态检查一组变量配置并估算每组数据的规模
+
+    引用其他变量的字段按被引用变量可能取到的最大值估算，所以结果是每组数据的上界；
+    只有能确定一定会失败的配置才报告为错误，可能出问题的配置报告为警告。
+
+    Args:
+        configs: 变量配置列表
+
+    Returns:
+        检查结果字典：
+            valid: 是否没有错误
+            variables: 每个变量的结果，含 name、errors、warnings，
+                以及估算的 values（值个数）、bytes（字节数）、seconds（耗时），无法估算时为None
+            estimated_values / estimated_bytes / estimated_seconds: 所有能估算的变量之和
+            unestimated: 无法估算输出大小的变量名
+    """
+    all_names = {config.get('name', '') for config in configs if config.get('name', '')}
+    defined = {}
+    seen_names = set()
+    planned = []  # 每个变量的生成计划，解析失败时为None
+    upper_slots = [None] * len(configs)  # 各变量单个值的上界，供后续引用估算
+    results = []
+
+    for index, config in enumerate(configs):
+        name = config.get('name', '') or f"#{index + 1}"
+        result = {'name': name, 'errors': [], 'warnings': [], 'values': None, 'bytes': None, 'seconds': None}
+        results.append(result)
+
+        _check_fields(config, result, seen_names)
+
+        variable = None
+        if not result['errors']:
+            try:
+                variable = plan_variable(index, config, defined, all_names)
+            except ValueError as e:
+                result['errors'].append(str(e))
+        planned.append(variable)
+
+        if config.get('name', ''):
+            defined[config['name']] = index
+            seen_names.add(config['name'])
+
+        if variable is None:
+            continue
+
+        _check_references(variable, planned, result)
+        _check_planned(variable, result)
+        _estimate_variable(variable, upper_slots, result)
+
+    counted = [result for result in results if result['values'] is not None]
+    return {
+        'valid': not any(result['errors'] for result in results),
+        'variables': results,
+        'estimated_values': sum(result['values'] for result in counted),
+        'estimated_bytes': sum(result['bytes'] for result in counted if result['bytes'] is not None),
+        'estimated_seconds': sum(result['seconds'] for result in counted),
+        'unestimated': [result['name'] for result in results if result['bytes'] is None],
+    }
+
+
+def format_size(size: int) -> str:
+    """把字节数格式化为便于阅读的大小"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _check_fields(config: Dict[str, Any], result: Dict[str, Any], seen_names: set):
+    """检查不涉及引用的字段：名称、类型组合、分隔符、字符集和自定义代码"""
+    errors, warnings = result['errors'], result['warnings']
+    name = config.get('name', '')
+    data_type = config.get('data_type')
+    source_type = config.get('source_type')
+
+    if name in seen_names:
+        warnings.append(f"变量名 {name} 重复，后面的变量只能引用最近的同名定义")
+    elif name and not name.isidentifier():
+        warnings.append(f"变量名 {name} 不是合法的标识符，不能被其他变量引用")
+
+    if data_type not in SUPPORTED_SOURCES:
+        errors.append(f"未知的数据类型: {data_type}")
+    elif source_type not in SUPPORTED_SOURCES[data_type]:
+        errors.append(f"{data_type}类型不支持来源: {source_type}")
+
+    if config.get('separator') not in SEPARATORS:
+        warnings.append(f"未知的分隔符 {config.get('separator')}，将使用空格")
+
+    if source_type == "字符集合":
+        for start, end in _reversed_ranges(str(config.get('charset', ''))):
+            warnings.append(f"字符集中的范围 {start}-{end} 结束字符小于起始字符，不含任何字符")
+    elif source_type == "来自代码":
+        error = _check_custom_code(config.get('custom_code', ''))
+        if error:
+            errors.append(error)
+    elif source_type == "树":
+        if config.get('tree_shape', "随机") not in TREE_SHAPES:
+            errors.append(f"未知的树形态: {config.get('tree_shape')}")
+        if config.get('tree_format', "边列表") not in TREE_FORMATS:
+            warnings.append(f"未知的树输出格式 {config.get('tree_format')}，将输出边列表")
+    elif source_type == "图":
+        if config.get('graph_type', "简单图") not in GRAPH_TYPES:
+            warnings.append(f"未知的图类型 {config.get('graph_type')}，将生成简单图")
+
+
+def _check_custom_code(code: str) -> Optional[str]:
+    """只编译不执行：检查语法并确认定义了生成函数"""
+    if not str(code).strip():
+        return "自定义代码不能为空"
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return f"自定义代码第 {e.lineno} 行语法错误: {e.msg}"
+
+    functions = [node.name for node in tree.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    if not any(function.startswith('generate') for function in functions):
+        return "代码中未找到生成函数，请确保定义了generate_data函数"
+    return None
+
+
+def _reversed_ranges(definition: str) -> List[tuple]:
+    """找出字符集定义中结束字符小于起始字符的范围（按与 parse_charset 相同的规则扫描）"""
+    reversed_ranges = []
+    i = 0
+    while i < len(definition):
+        if i + 2 < len(definition) and definition[i + 1] == '-':
+            if definition[i] > definition[i + 2]:
+                reversed_ranges.append((definition[i], definition[i + 2]))
+            i += 3
+        else:
+            i += 1
+    return reversed_ranges
+
+
+def _produces_single_value(variable: PlannedVariable) -> Optional[bool]:
+    """变量每组是否只生成一个值；循环次数引用其他变量时无法确定，返回None"""
+    if variable.config.get('source_type') in STRUCTURED_SOURCES:
+        return False
+    if not variable.loop_count.is_constant:
+        return None
+    return variable.loop_count.constant == 1
+
+
+def _check_references(variable: PlannedVariable, planned: List[Optional[PlannedVariable]], result: Dict[str, Any]):
+    """被引用的变量必须每组只生成一个值"""
+    for dependency in sorted(set(variable.dependencies)):
+        target = planned[dependency]
+        if target is not None and _produces_single_value(target) is False:
+            result['errors'].append(f"引用的变量 {target.name} 每组生成多个值，不能作为数量或范围被引用")
+
+
+def _check_planned(variable: PlannedVariable, result: Dict[str, Any]):
+    """检查各字段为常量时就能确定的错误"""
+    errors, warnings = result['errors'], result['warnings']
+    config = variable.config
+    source_type = config.get('source_type')
+    data_type = config.get('data_type')
+
+    loop_count = _constant(variable.loop_count)
+    if loop_count is not None and loop_count < 0:
+        errors.append(f"循环次数不能为负数: {loop_count}")
+
+    if source_type == "数据范围":
+        low, high = _constant(variable.min_value), _constant(variable.max_value)
+        if low is not None and high is not None:
+            if config.get('distinct') and data_type == "整数":
+                size = abs(int(high) - int(low)) + 1
+                if loop_count is not None and loop_count > size:
+                    errors.append(f"需要 {loop_count} 个不重复的值，但范围 [{low}, {high}] 只有 {size} 个整数")
+            elif low > high:
+                warnings.append(f"最小值 {low} 大于最大值 {high}，生成时会交换")
+            elif low == high:
+                warnings.append(f"最小值等于最大值，生成时范围为 [{low}, {low + 1}]")
+
+            if data_type == "字符串":
+                low, high = sorted((int(low), int(high)))
+                if low < 0 or high > MAX_CODE_POINT:
+                    errors.append(f"字符串的码点范围必须在 0 到 {MAX_CODE_POINT} 之间: [{low}, {high}]")
+                elif low <= SURROGATES[1] and high >= SURROGATES[0]:
+                    warnings.append("码点范围包含代理区 U+D800-U+DFFF，这些字符无法写入文件")
+
+    elif source_type in STRUCTURED_SOURCES:
+        n = _constant(variable.node_count)
+        if n is not None and n < 1:
+            errors.append(f"节点数必须为正数: {n}")
+        elif source_type == "图":
+            m = _constant(variable.edge_count)
+            if n is not None and m is not None:
+                error = _check_graph_size(int(n), int(m), config.get('graph_type', "简单图"))
+                if error:
+                    errors.append(error)
+
+
+def _check_graph_size(n: int, m: int, graph_type: str) -> Optional[str]:
+    """检查 n 个节点、m 条边的图能否生成"""
+    max_edges = n * (n - 1) // 2
+    if m < 0:
+        return f"边数不能为负数: {m}"
+    if m > max_edges:
+        return f"{n} 个节点的简单图最多有 {max_edges} 条边，无法生成 {m} 条"
+    if graph_type == "连通图" and m < n - 1:
+        return f"{n} 个节点的连通图至少需要 {n - 1} 条边，当前只有 {m} 条"
+    return None
+
+
+def _constant(reference: Optional[Reference]):
+    """常量引用返回其值，否则返回None"""
+    if reference is None or not reference.is_constant:
+        return None
+    return reference.constant
+
+
+def _upper(reference: Reference, upper_slots: List[Any]):
+    """按被引用变量的上界求值，无法估算时返回None"""
+    if reference.is_constant:
+        return reference.constant
+    try:
+        return reference.resolve(upper_slots)
+    except (ValueError, TypeError, ArithmeticError):
+        return None
+
+
+def _utf8_width(code_point: int) -> int:
+    """码点编码为 UTF-8 后的字节数"""
+    if code_point < 0x80:
+        return 1
+    if code_point < 0x800:
+        return 2
+    if code_point < 0x10000:
+        return 3
+    return 4
+
+
+def _estimate_variable(variable: PlannedVariable, upper_slots: List[Any], result: Dict[str, Any]):
+    """估算变量每组最多生成的值个数、字节数和耗时，并记录其单个值的上界供后续变量引用"""
+    config = variable.config
+    source_type = config.get('source_type')
+    data_type = config.get('data_type')
+    errors = result['errors']
+
+    loop_count = _upper(variable.loop_count, upper_slots)
+    if loop_count is None:
+        return
+    loop_count = max(0, int(loop_count))
+
+    item_bytes = None  # 每个值的最大字节数（不含分隔符）
+    values = loop_count
+    seconds_per_value = SECONDS_PER_VALUE.get(source_type, SECONDS_PER_VALUE.get(data_type, 0))
+    upper_value = None
+
+    if source_type == "数据范围":
+        low, high = _upper(variable.min_value, upper_slots), _upper(variable.max_value, upper_slots)
+        if low is None or high is None:
+            return
+        low, high = sorted((low, high))
+        if low == high and not config.get('distinct'):
+            high = low + 1
+        digits = max(len(str(int(low))), len(str(int(high))))
+        if data_type == "整数":
+            item_bytes, upper_value = digits, int(high)
+            if config.get('distinct') and loop_count > int(high) - int(low) + 1 and not errors:
+                result['warnings'].append(f"按上界估算，循环次数可能超过范围 [{low}, {high}] 中的整数个数")
+        elif data_type == "浮点数":
+            item_bytes, upper_value = digits + 3, float(high)
+        else:
+            length = _upper(variable.length_range[1], upper_slots)
+            if length is None or not 0 <= high <= MAX_CODE_POINT:
+                return
+            item_bytes = int(length) * _utf8_width(int(high))
+            seconds_per_value = int(length) * SECONDS_PER_CHAR
+
+    elif source_type == "选择列表":
+        item_bytes = max(len(str(choice).encode('utf-8')) for choice in variable.choices)
+        numbers = [choice for choice in variable.choices if isinstance(choice, (int, float))]
+        upper_value = max(numbers) if len(numbers) == len(variable.choices) else None
+
+    elif source_type == "字符集合":
+        width = _utf8_width(max(map(ord, variable.charset.definition)))
+        length = _upper(variable.length_range[1], upper_slots) if variable.length_range else 1
+        if length is None:
+            return
+        item_bytes = int(length) * width
+        seconds_per_value = int(length) * SECONDS_PER_CHAR
+
+    elif source_type in STRUCTURED_SOURCES:
+        n = _upper(variable.node_count, upper_slots)
+        if n is None:
+            return
+        n = max(1, int(n))
+        digits = len(str(n))
+        if source_type == "排列":
+            per_structure, item_bytes = n, digits
+        elif source_type == "树":
+            parents = config.get('tree_format', "边列表") == "父节点数组"
+            per_structure, item_bytes = n - 1, digits if parents else 2 * digits + 1
+        else:
+            m = _upper(variable.edge_count, upper_slots)
+            if m is None:
+                return
+            per_structure, item_bytes = max(0, int(m)), 2 * digits + 1
+        values = loop_count * per_structure
+
+    if loop_count == 1 and source_type not in STRUCTURED_SOURCES:
+        upper_slots[variable.index] = upper_value
+
+    result['values'] = values
+    result['seconds'] = values * seconds_per_value
+    if item_bytes is not None:
+        separator = SEPARATORS.get(config.get('separator'), " ")
+        result['bytes'] = values * (item_bytes + len(separator))
@@ -7,7 +7,22 @@
 
 import random
 import string
-from typing import List, Dict, Any, Union
+import hashlib
+import math
+from typing import List, Dict, Any, Union, Optional, Iterable, Iterator
+
+from core import structured_generators
+from core.structured_generators import STRUCTURED_SOURCES
+from core.charset import parse_charset
+from core.output_builder import OutputBuilder
+from core.generation_plan import build_plan, parse_choices, GenerationPlan, PlannedVariable
+from core.config_validator import validate_configs, SEPARATORS
+from core.preview_limits import PREVIEW_CHAR_BUDGET, PREVIEW_LINE_BUDGET, PREVIEW_STRUCTURE_LIMIT
+
+# 不重复模式下，取值空间不超过 请求组数 × 该倍数 时改为直接枚举抽样，避免大量重复重试
+ENUMERATION_FACTOR = 4
+# 取值空间超过 2**该值 时视为无限，不再精确计算
+MAX_CARDINALITY_BITS = 64
 
 
 class DataGeneratorCore:
@@ -31,250 +46,588 @@ class DataGeneratorCore:
         Returns:
             生成的测试数据列表，每个元素是一组完整的测试数据
         """
+        return self._generate_groups(configs, count, no_duplicate, as_bytes=False)
+
+    def generate_test_bytes(self, configs: List[Dict[str, Any]], count: int,
+                            no_duplicate: bool = False) -> List[bytearray]:
+        """生成测试数据，每组直接以 UTF-8 字节形式拼接，适合直接写入文件
+        
+        Args:
+            configs: 变量配置列表
+            count: 生成数据组数
+            no_duplicate: 是否避免生成重复数据
+            
+        Returns:
+            生成的测试数据列表，每个元素是一组完整测试数据的字节
+        """
+        return self._generate_groups(configs, count, no_duplicate, as_bytes=True)
+
+    def iter_test_bytes(self, case_configs: Iterable[List[Dict[str, Any]]]) -> Iterator[bytearray]:
+        """逐组生成数据的字节，每组可以使用不同的配置，生成一组交出一组，不在内存中累积
+
+        用于一个文件中写入多组数据；相邻的组使用同一个配置对象时只解析一次引用关系。
+
+        Args:
+            case_configs: 每组的变量配置列表
+
+        Returns:
+            依次产生每组数据字节的迭代器
+        """
+        plan, planned = None, None
+        for configs in case_configs:
+            if configs is not planned:
+                plan, planned = build_plan(configs), configs
+            yield self._generate_single_group(configs, plan=plan, as_bytes=True)
+
+    def _generate_groups(self, configs: List[Dict[str, Any]], count: int, no_duplicate: bool,
+                         as_bytes: bool) -> List[Union[str, bytearray]]:
+        """生成多组数据，as_bytes 为 True 时每组为字节，否则为字符串"""
+        # 引用关系只解析一次，无效引用在生成前报错
+        plan = build_plan(configs)
+
+        if not no_duplicate:
+            return [self._generate_single_group(configs, plan=plan, as_bytes=as_bytes) for _ in range(count)]
+
+        # 先估算取值空间，空间不足时立即发现，空间较小时直接枚举抽样
+        cardinality = self.estimate_cardinality(configs, plan)
+        if cardinality is not None and cardinality < count:
+            print(f"警告: 当前配置最多只有 {cardinality} 个不重复的数据组，少于请求的 {count} 个")
+
+        if cardinality is not None and cardinality <= count * ENUMERATION_FACTOR:
+            test_data = self._sample_distinct_groups(configs, min(count, cardinality), cardinality, as_bytes, plan)
+        else:
+            test_data = self._generate_distinct_by_rejection(configs, count, plan, as_bytes)
+
+        # 如果无法生成足够的不重复数据，给出警告
+        if len(test_data) < count and (cardinality is None or cardinality >= count):
+            print(f"警告: 只能生成 {len(test_data)} 个不重复的数据组，少于请求的 {count} 个")
+
+        return test_data
+
+    def _generate_distinct_by_rejection(self, configs: List[Dict[str, Any]], count: int,
+                                        plan: Optional[GenerationPlan] = None,
+                                        as_bytes: bool = False) -> List[Union[str, bytearray]]:
+        """随机生成并丢弃重复的数据组
+        
+        只保存每组数据的128位摘要用于去重，摘要在拼接数据时计算。
+        """
         test_data = []
-        generated_set = set() if no_duplicate else None
+        seen_digests = set()
         max_attempts = count * 10  # 最大尝试次数，避免无限循环
         attempts = 0
 
         while len(test_data) < count and attempts < max_attempts:
-            data_group = self._generate_single_group(configs)
+            hasher = hashlib.blake2b(digest_size=16)
+            data_group = self._generate_single_group(configs, hasher, plan, as_bytes)
+            digest = hasher.digest()
 
-            if no_duplicate:
-                if data_group not in generated_set:
-                    generated_set.add(data_group)
-                    test_data.append(data_group)
-            else:
+            if digest not in seen_digests:
+                seen_digests.add(digest)
                 test_data.append(data_group)
 
             attempts += 1
 
-        # 如果无法生成足够的不重复数据，给出警告
-        if no_duplicate and len(test_data) < count:
-            print(f"警告: 只能生成 {len(test_data)} 个不重复的数据组，少于请求的 {count} 个")
+        return test_data
+
+    def _sample_distinct_groups(self, configs: List[Dict[str, Any]], count: int, cardinality: int,
+                                as_bytes: bool = False,
+                                plan: Optional[GenerationPlan] = None) -> List[Union[str, bytearray]]:
+        """在取值空间中不放回地抽取编号，再把编号解码为数据组"""
+        if plan is None:
+            plan = build_plan(configs)
+        domains = [self._value_domain(variable) for variable in plan.variables]
+        loop_counts = [int(variable.loop_count.constant) for variable in plan.variables]
+
+        test_data = []
+        seen_digests = set()
+        for index in self.random.sample(range(cardinality), count):
+            value_lists = []
+            for domain, loop_count in zip(domains, loop_counts):
+                values = []
+                for _ in range(loop_count):
+                    index, digit = divmod(index, domain.size)
+                    values.append(domain.decode(digit))
+                value_lists.append(values)
+
+            hasher = hashlib.blake2b(digest_size=16)
+            data_group = self._join_group(configs, value_lists, hasher, as_bytes)
+            # 值不同但拼接结果相同的极端情况（如字符串中含分隔符）仍按摘要去重
+            digest = hasher.digest()
+            if digest not in seen_digests:
+                seen_digests.add(digest)
+                test_data.append(data_group)
 
         return test_data
 
-    def generate_preview_data(self, configs: List[Dict[str, Any]], count: int = 3, no_duplicate: bool = False) -> List[
-        str]:
-        """生成预览数据
+    def estimate_cardinality(self, configs: List[Dict[str, Any]],
+                             plan: Optional[GenerationPlan] = None) -> Optional[int]:
+        """估算配置能生成的不同数据组数量
         
         Args:
             configs: 变量配置列表
-            count: 生成数据组数
-            no_duplicate: 是否避免生成重复数据
+            plan: 预先解析好的生成计划，不提供时根据 configs 解析（配置无效时抛出 ValueError）
             
         Returns:
-            生成的预览数据列表
+            不同数据组的数量；包含变量引用、自定义代码、浮点数、不重复范围，或空间超过 2**64 时返回None（视为无限）
         """
-        return self.generate_test_data(configs, count, no_duplicate)
+        if plan is None:
+            plan = build_plan(configs)
+
+        # 无分隔符时不同取值可能拼接出相同文本，无法精确计算
+        total_slots = 0
+        has_empty_separator = False
+
+        cardinality = 1
+        log_cardinality = 0.0
+        for variable in plan.variables:
+            config = variable.config
+            domain = self._value_domain(variable)
+            if domain is None or self._is_distinct_range(config) or not variable.loop_count.is_constant:
+                return None
+
+            loop_count = int(variable.loop_count.constant)
+            total_slots += loop_count
+            if self._get_separator(config['separator']) == '':
+                has_empty_separator = True
+
+            if domain.size == 0:
+                return 0
+            log_cardinality += loop_count * math.log2(domain.size)
+            if log_cardinality > MAX_CARDINALITY_BITS:
+                return None
+            cardinality *= domain.size ** loop_count
 
-    def _generate_single_group(self, configs: List[Dict[str, Any]]) -> str:
-        """生成单组数据
+        if has_empty_separator and total_slots > 1:
+            return None
+        return cardinality
+
+    def _value_domain(self, variable: PlannedVariable) -> Optional['_ValueDomain']:
+        """获取单个值的可枚举取值空间，引用了其他变量或无法枚举时返回None"""
+        config = variable.config
+        source_type = config.get('source_type')
+        data_type = config.get('data_type')
+
+        if source_type == "数据范围":
+            if data_type == "浮点数" or not (variable.min_value.is_constant and variable.max_value.is_constant):
+                return None
+            # 与 _generate_planned_values 保持一致的边界调整
+            min_val, max_val = self._normalize_bounds(variable.min_value.constant, variable.max_value.constant)
+            low, high = int(min_val), int(max_val)
+
+            if data_type == "整数":
+                return _ValueDomain(high - low + 1, lambda i: low + i)
+            if data_type == "字符串":
+                alphabet = ''.join(chr(code) for code in range(low, high + 1))
+                return self._string_domain(alphabet, variable)
+            return None
+
+        if source_type == "选择列表":
+            if variable.choice_weights is not None:
+                return None  # 枚举抽样无法保持权重
+            values = list(dict.fromkeys(variable.choices))
+            return _ValueDomain(len(values), values.__getitem__)
+
+        if source_type == "字符集合":
+            alphabet = ''.join(dict.fromkeys(variable.charset.expand()))
+            if data_type == "字符":
+                return _ValueDomain(len(alphabet), alphabet.__getitem__)
+            if data_type == "字符串":
+                return self._string_domain(alphabet, variable)
+            return None
+
+        return None
+
+    def _string_domain(self, alphabet: str, variable: PlannedVariable) -> Optional['_ValueDomain']:
+        """字符串的取值空间：各可能长度下 |字符集|^长度 之和"""
+        if variable.length_range is None:
+            return None
+        min_ref, max_ref = variable.length_range
+        if not (min_ref.is_constant and max_ref.is_constant):
+            return None
+        min_len, max_len = int(min_ref.constant), int(max_ref.constant)
+        if min_len > max_len:
+            return None
+        if max_len * math.log2(max(len(alphabet), 2)) > MAX_CARDINALITY_BITS:
+            return None
+
+        base = len(alphabet)
+        counts = [base ** length for length in range(min_len, max_len + 1)]
+
+        def decode(index):
+            length = min_len
+            for length_count in counts:
+                if index < length_count:
+                    break
+                index -= length_count
+                length += 1
+            chars = []
+            for _ in range(length):
+                index, digit = divmod(index, base)
+                chars.append(alphabet[digit])
+            return ''.join(chars)
+
+        return _ValueDomain(sum(counts), decode)
+
+    def generate_preview_cases(self, configs: List[Dict[str, Any]], count: int = 3,
+                               char_budget: int = PREVIEW_CHAR_BUDGET,
+                               line_budget: int = PREVIEW_LINE_BUDGET) -> List[Dict[str, Any]]:
+        """生成截断的预览数据
+        
+        每组数据只生成能显示在预算内的值，其余的值只计数并估算大小，
+        因此预览耗时与循环次数无关。
         
         Args:
             configs: 变量配置列表
+            count: 生成数据组数
+            char_budget: 每组最多显示的字符数
+            line_budget: 每组最多显示的行数
             
         Returns:
-            单组测试数据字符串
+            每组的预览信息：text（截断后的文本）、total_values（值总数）、shown_values（显示的值数）、
+            estimated_bytes（完整数据的估计字节数）、variables（各变量的统计）
         """
-        parts = []
-        variable_values = {}  # 存储已生成的变量值，用于动态引用
+        plan = build_plan(configs)
+        return [self._preview_single_group(plan, char_budget, line_budget) for _ in range(count)]
 
-        for config_index, config in enumerate(configs):
-            loop_count = self._resolve_loop_count(config, variable_values)
+    def _preview_single_group(self, plan: GenerationPlan, char_budget: int, line_budget: int) -> Dict[str, Any]:
+        """按预算生成一组预览数据"""
+        slots = [None] * len(plan.variables)
+        parts = []
+        used_chars = 0
+        used_lines = 0
+        estimated_bytes = 0
+        total_values = 0
+        shown_values = 0
+        variable_stats = []
+        last_index = len(plan.variables) - 1
+
+        for variable in plan.variables:
+            config = variable.config
+            loop_count = int(variable.loop_count.resolve(slots))
             separator = self._get_separator(config['separator'])
 
-            # 生成循环次数个值
-            generated_values = []
-            for i in range(loop_count):
-                value = self._generate_single_value(config, variable_values)
-                generated_values.append(value)
-
-                # 添加值
-                parts.append(str(value))
+            # 每个值至少占一个字符加一个分隔符；换行分隔时每个值占一行
+            value_budget = max(0, char_budget - used_chars) // 2 + 1
+            if separator == '\n':
+                value_budget = min(value_budget, max(1, line_budget - used_lines))
 
-                # 判断是否需要添加分隔符
-                # 规则：每个值后面都添加分隔符，除了整个数据组的最后一个值
-                is_last_value_in_loop = (i == loop_count - 1)
-                is_last_config = (config_index == len(configs) - 1)
-                is_very_last_value = is_last_value_in_loop and is_last_config
-
-                if not is_very_last_value:
+            values, total, item_size = self._preview_values(variable, loop_count, slots, value_budget)
+            if total == 1 and len(values) == 1:
+                slots[variable.index] = values[0]
+            else:
+                slots[variable.index] = values
+
+            # 在预算内拼接，超出部分只计数
+            shown = []
+            for value in values:
+                text = str(value)
+                if used_chars + len(text) > char_budget or used_lines >= line_budget:
+                    break
+                shown.append(text)
+                used_chars += len(text) + len(separator)
+                used_lines += text.count('\n') + (separator == '\n')
+            if not shown and values:
+                # 单个值超出预算时（如很长的字符串）只显示开头
+                text = str(values[0])
+                head = text[:max(20, char_budget - used_chars)]
+                shown.append(head + (f"…(共 {len(text)} 个字符)" if len(head) < len(text) else ''))
+                used_chars += len(shown[0]) + len(separator)
+
+            hidden = total - len(shown)
+            part = separator.join(shown)
+            if hidden > 0:
+                part += f"{separator if shown else ''}... (还有 {hidden} 个值)"
+            if part:
+                parts.append(part)
+                if variable.index != last_index:
                     parts.append(separator)
 
-            # 存储变量值供后续引用
-            var_name = config.get('name', '')
-            if var_name:
-                if len(generated_values) == 1:
-                    variable_values[var_name] = generated_values[0]
-                else:
-                    variable_values[var_name] = generated_values
-
-        return ''.join(parts)
+            # 按已生成样本的平均长度估算完整大小
+            if values:
+                sample = values[:200]
+                item_size = sum(len(str(value).encode('utf-8')) for value in sample) / len(sample)
+            if item_size:
+                estimated_bytes += int(total * (item_size + len(separator)))
+
+            total_values += total
+            shown_values += len(shown)
+            variable_stats.append(self._preview_stats(variable, values, total))
+
+        return {
+            'text': ''.join(parts),
+            'total_values': total_values,
+            'shown_values': shown_values,
+            'estimated_bytes': estimated_bytes,
+            'variables': variable_stats,
+        }
 
-    def _resolve_loop_count(self, config: Dict[str, Any], variable_values: Dict[str, Any]) -> int:
-        """解析循环次数，支持引用变量
+    def _preview_values(self, variable: PlannedVariable, loop_count: int, slots: List[Any],
+                        value_budget: int):
+        """生成一个变量的前若干个值
+        
+        Returns:
+            (值列表, 完整的值总数, 未生成样本时每个值的估计字节数)
+        """
+        config = variable.config
+        source_type = config['source_type']
+        limit = min(loop_count, value_budget)
+
+        if source_type in STRUCTURED_SOURCES:
+            n = int(variable.node_count.resolve(slots))
+            m = int(variable.edge_count.resolve(slots)) if variable.edge_count is not None else 0
+            if source_type == "图":
+                items_per_structure = m
+            elif source_type == "树":
+                items_per_structure = n - 1
+            else:
+                items_per_structure = n
+            total = items_per_structure * loop_count
+            if max(n, m) > PREVIEW_STRUCTURE_LIMIT:
+                # 规模太大时不实际生成，只检查参数并按编号位数估算大小
+                if n < 1:
+                    raise ValueError(f"变量 {config.get('name', '')} 的节点数必须为正数: {n}")
+                single_number = source_type == "排列" or config.get('tree_format') == "父节点数组"
+                item_size = len(str(n)) if single_number else 2 * len(str(n)) + 1
+                return [], total, item_size
+
+            values = []
+            for _ in range(loop_count):
+                if len(values) >= value_budget:
+                    break
+                values.extend(self._build_structure(config, n, m))
+            return values[:value_budget], total, None
+
+        if self._is_distinct_range(config):
+            min_val = int(variable.min_value.resolve(slots))
+            max_val = int(variable.max_value.resolve(slots))
+            # 先按完整数量检查范围是否足够，再只抽取要显示的部分
+            if loop_count > abs(max_val - min_val) + 1:
+                self._sample_distinct_in_bounds(config, min_val, max_val, loop_count)
+            return self._sample_distinct_in_bounds(config, min_val, max_val, limit), loop_count, None
+
+        return self._generate_planned_values(variable, limit, slots), loop_count, None
+
+    def _preview_stats(self, variable: PlannedVariable, values: List[Any], total: int) -> Dict[str, Any]:
+        """统计一个变量的值总数，以及数值样本的最小值和最大值"""
+        stats = {'name': variable.name, 'total': total, 'sampled': len(values)}
+        numbers = [value for value in values if isinstance(value, (int, float))]
+        if numbers:
+            stats['min'] = min(numbers)
+            stats['max'] = max(numbers)
+        return stats
+
+    def _generate_single_group(self, configs: List[Dict[str, Any]], hasher=None,
+                               plan: Optional[GenerationPlan] = None,
+                               as_bytes: bool = False) -> Union[str, bytearray]:
+        """生成单组数据
         
         Args:
-            config: 变量配置
-            variable_values: 已生成的变量值字典
+            configs: 变量配置列表
+            hasher: 可选的哈希对象，用拼接结果更新
+            plan: 预先解析好的生成计划，不提供时根据 configs 解析
+            as_bytes: 是否直接拼接为字节
             
         Returns:
-            解析后的循环次数
+            单组测试数据字符串（as_bytes 为 True 时为字节）
         """
-        loop_count = config.get('loop_count', 1)
+        if plan is None:
+            plan = build_plan(configs)
 
-        # 如果loop_count是字符串，尝试解析为变量引用
-        if isinstance(loop_count, str):
-            loop_count_str = loop_count.strip()
+        value_lists = []
+        slots = [None] * len(plan.variables)  # 已生成的变量值，按位置供后续变量引用
 
-            # 检查是否是数字
-            if loop_count_str.isdigit():
-                return int(loop_count_str)
+        for variable in plan.variables:
+            loop_count = int(variable.loop_count.resolve(slots))
 
-            # 检查是否是变量引用
-            if loop_count_str in variable_values:
-                ref_value = variable_values[loop_count_str]
-                if isinstance(ref_value, (int, float)):
-                    return int(ref_value)
-                elif isinstance(ref_value, str) and ref_value.isdigit():
-                    return int(ref_value)
-
-            # 如果无法解析，返回默认值1
-            return 1
+            # 生成循环次数个值
+            generated_values = self._generate_planned_values(variable, loop_count, slots)
+            value_lists.append(generated_values)
 
-        # 如果是数字，直接返回
-        if isinstance(loop_count, (int, float)):
-            return int(loop_count)
+            # 存储变量值供后续引用
+            if len(generated_values) == 1:
+                slots[variable.index] = generated_values[0]
+            else:
+                slots[variable.index] = generated_values
 
-        return 1
+        return self._join_group(configs, value_lists, hasher, as_bytes)
 
-    def _resolve_range_value(self, value: Union[str, int, float], variable_values: Dict[str, Any]) -> Union[int, float]:
-        """解析范围值，支持变量引用
+    def _generate_planned_values(self, variable: PlannedVariable, loop_count: int, slots: List[Any]) -> List[Any]:
+        """按生成计划生成一个变量的全部循环值
         
         Args:
-            value: 范围值（可能是数字或变量名）
-            variable_values: 已生成的变量值字典
+            variable: 变量的生成计划
+            loop_count: 循环次数
+            slots: 本组中已生成的变量值
             
         Returns:
-            解析后的数值
+            生成的值列表
         """
-        # 如果是数字，直接返回
-        if isinstance(value, (int, float)):
-            return value
-
-        # 如果是字符串，尝试解析
-        if isinstance(value, str):
-            value_str = value.strip()
-
-            # 检查是否是数字字符串
-            try:
-                if '.' in value_str:
-                    return float(value_str)
-                else:
-                    return int(value_str)
-            except ValueError:
-                pass
-
-            # 检查是否是变量引用
-            if value_str in variable_values:
-                ref_value = variable_values[value_str]
-                if isinstance(ref_value, (int, float)):
-                    return ref_value
-                elif isinstance(ref_value, str):
-                    try:
-                        if '.' in ref_value:
-                            return float(ref_value)
-                        else:
-                            return int(ref_value)
-                    except ValueError:
-                        pass
-
-            # 如果无法解析，尝试转换为数字，失败则返回0
-            try:
-                return int(value_str)
-            except ValueError:
-                return 0
-
-        return 0
-
-    def _generate_single_value(self, config: Dict[str, Any], variable_values: Dict[str, Any] = None) -> Union[
-        int, float, str]:
-        """生成单个值
-        
-        Args:
-            config: 变量配置
-            variable_values: 已生成的变量值字典
-            
-        Returns:
-            生成的值
-        """
-        if variable_values is None:
-            variable_values = {}
-
-        data_type = config['data_type']
+        config = variable.config
         source_type = config['source_type']
+        data_type = config['data_type']
+        rng = self.random
 
         if source_type == "数据范围":
-            return self._generate_from_range(config, variable_values)
-        elif source_type == "选择列表":
-            return self._generate_from_choices(config)
-        elif source_type == "字符集合":
-            return self._generate_from_charset(config, variable_values)
-        elif source_type == "来自代码":
-            return self._generate_from_code(config)
-        else:
-            raise ValueError(f"未知的数据源类型: {source_type}")
+            min_val = variable.min_value.resolve(slots)
+            max_val = variable.max_value.resolve(slots)
+            if self._is_distinct_range(config):
+                return self._sample_distinct_in_bounds(config, int(min_val), int(max_val), loop_count)
+
+            min_val, max_val = self._normalize_bounds(min_val, max_val)
+            if data_type == "整数":
+                low, high = int(min_val), int(max_val)
+                return [rng.randint(low, high) for _ in range(loop_count)]
+            elif data_type == "浮点数":
+                low, high = float(min_val), float(max_val)
+                return [round(rng.uniform(low, high), 2) for _ in range(loop_count)]
+            elif data_type == "字符串":
+                # 对于字符串，范围表示ASCII码范围
+                low, high = int(min_val), int(max_val)
+                return [''.join(chr(rng.randint(low, high)) for _ in range(self._planned_length(variable, slots)))
+                        for _ in range(loop_count)]
+            raise ValueError(f"数据范围不支持数据类型: {data_type}")
 
-    def _generate_from_range(self, config: Dict[str, Any], variable_values: Dict[str, Any] = None) -> Union[
-        int, float, str]:
-        """从数据范围生成值"""
-        if variable_values is None:
-            variable_values = {}
+        if source_type == "选择列表":
+            # 带权重时用预先算好的累积权重批量抽取
+            return rng.choices(variable.choices, cum_weights=variable.choice_weights, k=loop_count)
+
+        if source_type == "字符集合":
+            charset = variable.charset
+            if data_type == "字符":
+                return charset.random_chars(rng, loop_count)
+            elif data_type == "字符串":
+                return [charset.random_string(rng, self._planned_length(variable, slots))
+                        for _ in range(loop_count)]
+            raise ValueError(f"字符集合不支持数据类型: {data_type}")
 
-        data_type = config['data_type']
-        min_val = self._resolve_range_value(config['min_value'], variable_values)
-        max_val = self._resolve_range_value(config['max_value'], variable_values)
+        if source_type == "来自代码":
+            return [self._generate_from_code(config) for _ in range(loop_count)]
 
-        # 确保 max_val > min_val
+        if source_type in STRUCTURED_SOURCES:
+            # 结构化来源每次循环生成一个完整结构，结构中的每一项作为一个值输出
+            n = int(variable.node_count.resolve(slots))
+            m = int(variable.edge_count.resolve(slots)) if variable.edge_count is not None else 0
+            generated_values = []
+            for _ in range(loop_count):
+                generated_values.extend(self._build_structure(config, n, m))
+            return generated_values
+
+        raise ValueError(f"未知的数据源类型: {source_type}")
+
+    def _planned_length(self, variable: PlannedVariable, slots: List[Any]) -> int:
+        """按生成计划取字符串长度，随机长度时在范围内随机"""
+        min_ref, max_ref = variable.length_range
+        min_len = int(min_ref.resolve(slots))
+        if min_ref is max_ref:
+            if min_len < 0:
+                raise ValueError(f"长度不能为负数: {min_len}")
+            return min_len
+
+        max_len = int(max_ref.resolve(slots))
+        if min_len < 0 or max_len < 0:
+            raise ValueError(f"长度不能为负数: {min_len},{max_len}")
+        if min_len > max_len:
+            raise ValueError(f"最小长度不能大于最大长度: {min_len},{max_len}")
+        return self.random.randint(min_len, max_len)
+
+    def _normalize_bounds(self, min_val: Union[int, float], max_val: Union[int, float]):
+        """确保 max_val > min_val：相等时最大值加1，颠倒时交换"""
         if max_val <= min_val:
-            # 如果最大值不大于最小值，交换它们或调整
             if max_val == min_val:
                 max_val = min_val + 1  # 至少保证有1的差距
             else:
                 min_val, max_val = max_val, min_val
+        return min_val, max_val
 
-        if data_type == "整数":
-            return self.random.randint(int(min_val), int(max_val))
-        elif data_type == "浮点数":
-            return round(self.random.uniform(float(min_val), float(max_val)), 2)
-        elif data_type == "字符串":
-            # 对于字符串，范围表示ASCII码范围
-            length = self._parse_string_length(config.get('string_length', '10'), variable_values)
-            result = []
-            for _ in range(length):
-                char_code = self.random.randint(int(min_val), int(max_val))
-                result.append(chr(char_code))
-            return ''.join(result)
+    def _join_group(self, configs: List[Dict[str, Any]], value_lists: List[List[Any]], hasher=None,
+                    as_bytes: bool = False) -> Union[str, bytearray]:
+        """按分隔符规则把各变量的值拼接为一组数据
+        
+        规则：每个值后面都添加分隔符，除了整个数据组的最后一个值
+        
+        Args:
+            configs: 变量配置列表
+            value_lists: 每个变量生成的值列表
+            hasher: 可选的哈希对象，拼接时逐段更新，不再对整组数据重新计算
+            as_bytes: 是否直接拼接为 UTF-8 字节
+            
+        Returns:
+            单组测试数据字符串（as_bytes 为 True 时为字节）
+        """
+        if as_bytes:
+            builder = OutputBuilder(hasher)
         else:
-            raise ValueError(f"数据范围不支持数据类型: {data_type}")
+            parts = []
+        last_index = len(configs) - 1
 
-    def _generate_from_choices(self, config: Dict[str, Any]) -> Union[int, float, str]:
-        """从选择列表生成值"""
-        choices = config['choices']
-        if not choices:
-            raise ValueError("选择列表不能为空")
+        for config_index, (config, values) in enumerate(zip(configs, value_lists)):
+            if not values:
+                continue
+            separator = self._get_separator(config['separator'])
 
-        selected = self.random.choice(choices)
-        data_type = config['data_type']
+            if as_bytes:
+                separator = separator.encode('utf-8')
+                builder.write_values(values, separator, self._has_int_values(config))
+                if config_index != last_index:
+                    builder.write(separator)
+            else:
+                part = separator.join(map(str, values))
+                if config_index != last_index:
+                    part += separator
+                parts.append(part)
+                if hasher is not None:
+                    hasher.update(part.encode('utf-8'))
+
+        return builder.getvalue() if as_bytes else ''.join(parts)
+
+    def _has_int_values(self, config: Dict[str, Any]) -> bool:
+        """变量生成的值是否全部为整数（结构化来源生成的是 "u v" 形式的文本）"""
+        return config.get('data_type') == "整数" and config.get('source_type') not in STRUCTURED_SOURCES
+
+    def _is_distinct_range(self, config: Dict[str, Any]) -> bool:
+        """判断是否为不重复取值的整数范围变量"""
+        return (bool(config.get('distinct')) and config.get('source_type') == "数据范围"
+                and config.get('data_type') == "整数")
+
+    def _sample_distinct_in_bounds(self, config: Dict[str, Any], min_val: int, max_val: int, count: int) -> List[int]:
+        """在 [min_val, max_val] 中不放回地抽取 count 个整数
+        
+        random.sample 对 range 按需取值，时间和内存都只与 count 有关，与范围宽度无关；
+        count 等于范围大小时即为一个随机排列。
+        """
+        if max_val < min_val:
+            min_val, max_val = max_val, min_val
 
-        # 根据数据类型转换
-        if data_type == "整数":
-            return int(selected)
-        elif data_type == "浮点数":
-            return float(selected)
-        else:
-            return selected
+        range_size = max_val - min_val + 1
+        if count > range_size:
+            raise ValueError(f"变量 {config.get('name', '')} 需要 {count} 个不重复的值，"
+                             f"但范围 [{min_val}, {max_val}] 只有 {range_size} 个整数")
+
+        return self.random.sample(range(min_val, max_val + 1), count)
+
+    def _build_structure(self, config: Dict[str, Any], n: int, m: int = 0) -> List[str]:
+        """按已解析的节点数 n 和边数 m 生成一个树、图或排列"""
+        source_type = config['source_type']
+        if n < 1:
+            raise ValueError(f"变量 {config.get('name', '')} 的节点数必须为正数: {n}")
+
+        if source_type == "排列":
+            return [str(value) for value in structured_generators.random_permutation(self.random, n)]
+
+        if source_type == "树":
+            shape = config.get('tree_shape', "随机")
+            edges = structured_generators.shaped_tree_edges(self.random, n, shape)
+            if config.get('relabel', shape != "随机"):
+                edges = structured_generators.relabel_edges(self.random, n, edges)
+            if config.get('tree_format', "边列表") == "父节点数组":
+                return [str(parent) for parent in structured_generators.parent_array(n, edges)]
+            return [f"{u} {v}" for u, v in edges]
+
+        if source_type == "图":
+            edges = structured_generators.random_graph_edges(self.random, n, m, config.get('graph_type', "简单图"))
+            return [f"{u} {v}" for u, v in edges]
+
+        raise ValueError(f"未知的数据源类型: {source_type}")
 
     def _generate_from_code(self, config: Dict[str, Any]) -> Any:
         """从自定义代码生成值"""
@@ -348,135 +701,6 @@ class DataGeneratorCore:
         except Exception as e:
             raise ValueError(f"执行自定义代码时出错: {str(e)}")
 
-    def _generate_from_charset(self, config: Dict[str, Any], variable_values: Dict[str, Any] = None) -> str:
-        """从字符集合生成值"""
-        if variable_values is None:
-            variable_values = {}
-            
-        charset_def = config['charset']
-        charset = self._expand_charset(charset_def)
-
-        if not charset:
-            raise ValueError("字符集不能为空")
-
-        data_type = config['data_type']
-
-        if data_type == "字符":
-            return self.random.choice(charset)
-        elif data_type == "字符串":
-            length = self._parse_string_length(config.get('string_length', '10'), variable_values)
-            return ''.join(self.random.choices(charset, k=length))
-        else:
-            raise ValueError(f"字符集合不支持数据类型: {data_type}")
-
-    def _parse_string_length(self, length_str: str, variable_values: Dict[str, Any] = None) -> int:
-        """解析字符串长度配置
-        
-        Args:
-            length_str: 长度配置字符串，支持固定长度（如"10"）、随机长度（如"1,10"）或变量引用（如"n"、"1,n"）
-            variable_values: 已生成的变量值字典
-            
-        Returns:
-            解析后的长度值
-        """
-        if variable_values is None:
-            variable_values = {}
-            
-        length_str = str(length_str).strip()
-
-        if ',' in length_str:
-            # 随机长度格式："1,10" 或 "1,n" 或 "m,n"
-            try:
-                parts = length_str.split(',')
-                if len(parts) != 2:
-                    raise ValueError(f"随机长度格式错误，应为 'min,max'，实际为: {length_str}")
-
-                min_len = self._resolve_length_value(parts[0].strip(), variable_values)
-                max_len = self._resolve_length_value(parts[1].strip(), variable_values)
-
-                if min_len < 0 or max_len < 0:
-                    raise ValueError(f"长度不能为负数: {length_str}")
-                if min_len > max_len:
-                    raise ValueError(f"最小长度不能大于最大长度: {length_str}")
-
-                return self.random.randint(min_len, max_len)
-            except ValueError as e:
-                if "invalid literal" in str(e):
-                    raise ValueError(f"长度配置包含非数字字符: {length_str}")
-                raise e
-        else:
-            # 固定长度格式："10" 或变量引用 "n"
-            try:
-                length = self._resolve_length_value(length_str, variable_values)
-                if length < 0:
-                    raise ValueError(f"长度不能为负数: {length}")
-                return length
-            except ValueError:
-                raise ValueError(f"长度配置格式错误: {length_str}")
-    
-    def _resolve_length_value(self, value: str, variable_values: Dict[str, Any]) -> int:
-        """解析长度值，支持变量引用
-        
-        Args:
-            value: 长度值（可能是数字或变量名）
-            variable_values: 已生成的变量值字典
-            
-        Returns:
-            解析后的长度值
-        """
-        value_str = str(value).strip()
-        
-        # 检查是否是数字字符串
-        if value_str.isdigit():
-            return int(value_str)
-        
-        # 检查是否是变量引用
-        if value_str in variable_values:
-            ref_value = variable_values[value_str]
-            if isinstance(ref_value, (int, float)):
-                return int(ref_value)
-            elif isinstance(ref_value, str) and ref_value.isdigit():
-                return int(ref_value)
-        
-        # 如果无法解析，尝试转换为数字，失败则返回默认值
-        try:
-            return int(value_str)
-        except ValueError:
-            # 如果是无法识别的变量名，返回默认长度
-            return 10
-
-    def _expand_charset(self, charset_def: str) -> str:
-        """展开字符集定义
-        
-        Args:
-            charset_def: 字符集定义，如 'a-z', 'A-Z', '0-9', 'abc123'
-            
-        Returns:
-            展开后的字符集字符串
-        """
-        result = []
-        i = 0
-
-        while i < len(charset_def):
-            if i + 2 < len(charset_def) and charset_def[i + 1] == '-':
-                # 处理范围，如 'a-z'
-                start_char = charset_def[i]
-                end_char = charset_def[i + 2]
-
-                start_code = ord(start_char)
-                end_code = ord(end_char)
-
-                for code in range(start_code, end_code + 1):
-                    result.append(chr(code))
-
-                i += 3
-            else:
-                # 单个字符
-                result.append(charset_def[i])
-                i += 1
-
-        return ''.join(result)
-
     def _get_separator(self, separator_name: str) -> str:
         """获取分隔符字符
         
@@ -486,31 +710,27 @@ class DataGeneratorCore:
         Returns:
             实际的分隔符字符
         """
-        separator_map = {
-            "无": "",
-            "换行": "\n",
-            "空格": " ",
-            "制表符": "\t",
-            "逗号": ",",
-            "分号": ";"
-        }
-        return separator_map.get(separator_name, " ")
+        return SEPARATORS.get(separator_name, " ")
 
-    def validate_config(self, config: Dict[str, Any]) -> bool:
+    def validate_config(self, config: Dict[str, Any], configs: Optional[List[Dict[str, Any]]] = None) -> bool:
         """验证配置是否有效
         
         Args:
             config: 变量配置
+            configs: 包含 config 的全部变量配置；config 引用其他变量时需要传入，
+                按完整的变量列表解析引用，未传入时只检查 config 本身
             
         Returns:
             配置是否有效
         """
-        try:
-            # 尝试生成一个值来验证配置
-            self._generate_single_value(config)
-            return True
-        except Exception:
-            return False
+        # 只做静态检查，不生成数据
+        if configs is None:
+            configs = [config]
+        index = next((i for i, item in enumerate(configs) if item is config), None)
+        if index is None:
+            configs = list(configs) + [config]
+            index = len(configs) - 1
+        return not validate_configs(configs)['variables'][index]['errors']
 
     def get_config_description(self, config: Dict[str, Any]) -> str:
         """获取配置描述
@@ -558,3 +778,13 @@ class DataGeneratorCore:
         desc_parts.append(f"分隔符: {separator}")
 
         return ", ".join(desc_parts)
+
+
+class _ValueDomain:
+    """可枚举的取值空间：大小和 编号 -> 值 的解码函数"""
+
+    __slots__ = ('size', 'decode')
+
+    def __init__(self, size: int, decode):
+        self.size = size
+        self.decode = decode
@@ -6,8 +6,9 @@
 """
 
 import os
+import hashlib
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union, Iterable
 import zipfile
 from datetime import datetime
 
@@ -18,13 +19,13 @@ class FileManagerCore:
     def __init__(self):
         pass
 
-    def save_test_files(self, test_data: List[str], output_dir: str,
+    def save_test_files(self, test_data: List[Union[str, bytes, bytearray, memoryview]], output_dir: str,
                         file_prefix: str = "test", create_zip: bool = True,
                         delete_temp_files: bool = False) -> Dict[str, Any]:
         """保存测试文件
         
         Args:
-            test_data: 测试数据列表
+            test_data: 测试数据列表，每组可以是字符串或已编码的 UTF-8 字节
             output_dir: 输出目录
             file_prefix: 文件前缀
             create_zip: 是否创建zip文件
@@ -43,10 +44,7 @@ class FileManagerCore:
             filename = f"{file_prefix}{i:02d}.in"
             file_path = output_path / filename
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(data)
-                if not data.endswith('\n'):
-                    f.write('\n')
+            self.write_data_file(file_path, data)
 
             created_files.append(str(file_path))
 
@@ -74,6 +72,53 @@ class FileManagerCore:
 
         return result
 
+    def write_data_file(self, file_path: Union[str, Path], data: Union[str, bytes, bytearray, memoryview]):
+        """以二进制方式写入一个数据文件，内容末尾没有换行时补一个换行
+        
+        Args:
+            file_path: 文件路径
+            data: 文件内容，字符串按 UTF-8 编码，字节直接写入不再复制
+        """
+        if isinstance(data, str):
+            payload = data.encode('utf-8')
+        else:
+            payload = data
+        ends_with_newline = len(payload) > 0 and payload[-1] == ord('\n')
+
+        with open(file_path, 'wb') as f:
+            f.write(payload)
+            if not ends_with_newline:
+                f.write(b'\n')
+
+    def write_cases_file(self, file_path: Union[str, Path], cases: Iterable[Union[str, bytes, bytearray, memoryview]],
+                         header: Optional[str] = None) -> str:
+        """把多组数据依次写入一个文件，每组末尾没有换行时补一个换行
+
+        各组逐个写入，不需要先拼接成完整的文件内容。
+
+        Args:
+            file_path: 文件路径
+            cases: 各组数据，可以是生成器
+            header: 写在第一行的内容（如组数 T），None 时不写
+
+        Returns:
+            文件内容的 SHA-256
+        """
+        hasher = hashlib.sha256()
+        with open(file_path, 'wb') as f:
+            if header is not None:
+                line = f"{header}\n".encode('utf-8')
+                f.write(line)
+                hasher.update(line)
+            for data in cases:
+                payload = data.encode('utf-8') if isinstance(data, str) else data
+                f.write(payload)
+                hasher.update(payload)
+                if len(payload) == 0 or payload[-1] != ord('\n'):
+                    f.write(b'\n')
+                    hasher.update(b'\n')
+        return hasher.hexdigest()
+
     def create_zip_file(self, file_paths: List[str], output_dir: Path,
                         prefix: str = "test") -> str:
         """创建zip文件
@@ -86,9 +131,7 @@ class FileManagerCore:
         Returns:
             zip文件路径
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        zip_filename = f"{prefix}_data_{timestamp}.zip"
-        zip_path = output_dir / zip_filename
+        zip_path = self.new_zip_path(output_dir, prefix)
 
         with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
             for file_path in file_paths:
@@ -98,7 +141,12 @@ class FileManagerCore:
 
         return str(zip_path)
 
-    def save_with_solutions(self, test_data: List[str], solutions: List[str],
+    def new_zip_path(self, output_dir: Path, prefix: str = "test") -> Path:
+        """按当前时间命名的zip文件路径"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return Path(output_dir) / f"{prefix}_data_{timestamp}.zip"
+
+    def save_with_solutions(self, test_data: List[Union[str, bytes, bytearray, memoryview]], solutions: List[str],
                             output_dir: str, file_prefix: str = "test",
                             delete_temp_files: bool = False) -> Dict[str, Any]:
         """保存测试数据和解答
@@ -127,10 +175,7 @@ class FileManagerCore:
             in_filename = f"{file_prefix}{i:02d}.in"
             in_file_path = output_path / in_filename
 
-            with open(in_file_path, 'w', encoding='utf-8') as f:
-                f.write(data)
-                if not data.endswith('\n'):
-                    f.write('\n')
+            self.write_data_file(in_file_path, data)
 
             created_files.append(str(in_file_path))
 
@@ -138,13 +183,66 @@ class FileManagerCore:
             out_filename = f"{file_prefix}{i:02d}.out"
             out_file_path = output_path / out_filename
 
-            with open(out_file_path, 'w', encoding='utf-8') as f:
-                f.write(solution)
-                if not solution.endswith('\n'):
-                    f.write('\n')
+            self.write_data_file(out_file_path, solution)
 
             created_files.append(str(out_file_path))
 
+        return self._finish_solution_pack(created_files, output_path, file_prefix, delete_temp_files)
+
+    def save_with_solution_process(self, test_data: List[Union[str, bytes, bytearray, memoryview]], solution,
+                                   output_dir: str, file_prefix: str = "test",
+                                   delete_temp_files: bool = False, output_cache=None,
+                                   checkpoint: bool = False) -> Dict[str, Any]:
+        """保存测试数据，并在子进程中运行解题程序直接生成 .out 文件
+        
+        程序从 .in 文件读取标准输入，标准输出分块写入 .out 文件，解答不在内存中累积。
+        提供输出缓存时，同一程序在相同输入上的结果直接从缓存复制。
+        写入 .in、运行解答和写入zip由 core.pipeline.PackPipeline 流水线同时进行。
+        
+        Args:
+            test_data: 测试数据列表
+            solution: 解题程序（core.solution_runner.SolutionProcess）
+            output_dir: 输出目录
+            file_prefix: 文件前缀
+            delete_temp_files: 是否在创建zip后删除临时文件
+            output_cache: 输出缓存（core.output_cache.OutputCache），None 时每个用例都运行
+            checkpoint: 是否记录任务清单，中断后再次运行时跳过已完成的用例
+            
+        Returns:
+            保存结果信息，'outputs' 为每个 .out 文件的大小、哈希和是否命中缓存，'stats' 为流水线各阶段的统计
+        """
+        from .pipeline import PackPipeline
+
+        pipeline = PackPipeline(output_dir, file_prefix, solution=solution, output_cache=output_cache,
+                                delete_temp_files=delete_temp_files, checkpoint=checkpoint)
+        return pipeline.run_data(test_data)
+
+    def save_pack_with_solution_process(self, pack, solution, output_dir: str, file_prefix: str = "test",
+                                        delete_temp_files: bool = False, output_cache=None,
+                                        checkpoint: bool = False) -> Dict[str, Any]:
+        """为已有数据包中的 .in 文件生成 .out 文件并打包
+        
+        Args:
+            pack: 已有数据包（core.input_pack.InputPack）
+            solution: 解题程序（core.solution_runner.SolutionProcess）
+            output_dir: 输出目录，zip 中的 .in 文件解压到这里，目录中的 .out 文件写在 .in 文件旁边
+            file_prefix: zip 和任务清单的文件名前缀
+            delete_temp_files: 是否在创建zip后删除临时文件（目录中原有的 .in 文件不会删除）
+            output_cache: 输出缓存
+            checkpoint: 是否记录任务清单
+            
+        Returns:
+            保存结果信息
+        """
+        from .pipeline import PackPipeline
+
+        pipeline = PackPipeline(output_dir, file_prefix, solution=solution, output_cache=output_cache,
+                                delete_temp_files=delete_temp_files, checkpoint=checkpoint)
+        return pipeline.run_pack(pack)
+
+    def _finish_solution_pack(self, created_files: List[str], output_path: Path, file_prefix: str,
+                              delete_temp_files: bool) -> Dict[str, Any]:
+        """把 .in/.out 文件打包为zip，需要时删除临时文件"""
         # 创建zip文件
         zip_path = self.create_zip_file(created_files, output_path, file_prefix)
 
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+生成计划
+功能：在生成数据前一次性解析变量配置中的所有引用和表达式，检查依赖关系，
+生成时直接按槽位取值，不再对每个值重复解析字符串
+"""
+
+import re
+from itertools import accumulate
+from typing import List, Dict, Any, Optional, Tuple, Callable
+
+from core.structured_generators import STRUCTURED_SOURCES
+from core.expression import compile_expression
+from core.charset import parse_charset
+
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_一-鿿][A-Za-z0-9_一-鿿]*$')
+# 带权重的选项，如 "0:90%"、"a:3"
+_WEIGHTED_CHOICE_RE = re.compile(r'^\s*(.*?)\s*:\s*(\d+(?:\.\d+)?)\s*%?\s*$')
+
+# 可以引用其他变量的字段及其中文说明
+REFERENCE_FIELDS = {
+    'loop_count': '循环次数',
+    'min_value': '最小值',
+    'max_value': '最大值',
+    'node_count': '节点数',
+    'edge_count': '边数',
+}
+
+
+class Reference:
+    """解析后的数值：常量、前面某个变量的槽位，或引用前面变量的表达式"""
+
+    __slots__ = ('source', 'constant', 'slot', 'target', 'evaluator', 'dependencies')
+
+    def __init__(self, source: Any, constant: Any = None, slot: Optional[int] = None, target: str = '',
+                 evaluator: Optional[Callable[[List[Any]], Any]] = None, dependencies: Tuple[int, ...] = ()):
+        self.source = source  # 原始配置值，用于报错
+        self.constant = constant
+        self.slot = slot  # 被引用变量在计划中的位置
+        self.target = target  # 被引用变量名
+        self.evaluator = evaluator  # 表达式编译后的取值函数
+        self.dependencies = (slot,) if slot is not None else tuple(dependencies)  # 引用的变量位置
+
+    @property
+    def is_constant(self) -> bool:
+        return self.slot is None and self.evaluator is None
+
+    def resolve(self, slots: List[Any]) -> Any:
+        """取出数值，slots 为本组数据中已生成的各变量值"""
+        if self.slot is None:
+            if self.evaluator is not None:
+                return self.evaluator(slots)
+            return self.constant
+        value = slots[self.slot]
+        if type(value) is int or type(value) is float:
+            return value
+        return _coerce_slot_value(value, self.target)
+
+
+class PlannedVariable:
+    """单个变量的生成计划"""
+
+    __slots__ = ('index', 'name', 'config', 'loop_count', 'min_value', 'max_value',
+                 'length_range', 'node_count', 'edge_count', 'choices', 'choice_weights', 'charset', 'dependencies')
+
+    def __init__(self, index: int, name: str, config: Dict[str, Any]):
+        self.index = index
+        self.name = name
+        self.config = config
+        self.loop_count = None
+        self.min_value = None
+        self.max_value = None
+        self.length_range = None  # (最小长度, 最大长度)，固定长度时两者相同
+        self.node_count = None
+        self.edge_count = None
+        self.choices = None  # 已按数据类型转换的选择列表
+        self.choice_weights = None  # 带权重时为累积权重，均匀选择时为None
+        self.charset = None  # 解析后的字符集
+        self.dependencies = []  # 引用的变量位置
+
+
+class GenerationPlan:
+    """一组变量配置的生成计划，变量按定义顺序排列"""
+
+    def __init__(self, configs: List[Dict[str, Any]], variables: List[PlannedVariable]):
+        self.configs = configs
+        self.variables = variables
+
+
+def build_plan(configs: List[Dict[str, Any]]) -> GenerationPlan:
+    """解析配置中的引用并检查依赖关系
+
+    数据按变量定义顺序输出，所以定义顺序本身就是生成顺序：
+    每个变量只能引用在它前面定义的变量，引用后面的变量或未定义的名字都会报错。
+
+    Args:
+        configs: 变量配置列表
+
+    Returns:
+        生成计划
+
+    Raises:
+        ValueError: 引用无效时
+    """
+    all_names = {config.get('name', '') for config in configs if config.get('name', '')}
+    defined = {}  # 变量名 -> 位置，同名变量以最近的定义为准
+    variables = []
+
+    for index, config in enumerate(configs):
+        variables.append(plan_variable(index, config, defined, all_names))
+        if config.get('name', ''):
+            defined[config['name']] = index
+
+    return GenerationPlan(configs, variables)
+
+
+def plan_variable(index: int, config: Dict[str, Any], defined: Dict[str, int], all_names) -> PlannedVariable:
+    """解析单个变量配置中的引用、选择列表和字符集
+
+    Args:
+        index: 变量在配置列表中的位置
+        config: 变量配置
+        defined: 当前变量之前已定义的变量名及其位置
+        all_names: 所有变量名
+
+    Returns:
+        单个变量的生成计划
+
+    Raises:
+        ValueError: 配置无效时
+    """
+    name = config.get('name', '') or f"#{index + 1}"
+    variable = PlannedVariable(index, name, config)
+
+    def parse(field, default):
+        value = config.get(field)
+        if value is None or str(value).strip() == '':
+            value = default
+        reference = parse_reference(value, name, REFERENCE_FIELDS[field], defined, all_names)
+        variable.dependencies.extend(reference.dependencies)
+        return reference
+
+    variable.loop_count = parse('loop_count', 1)
+
+    source_type = config.get('source_type')
+    data_type = config.get('data_type')
+    if source_type == "数据范围":
+        variable.min_value = parse('min_value', 0)
+        variable.max_value = parse('max_value', 0)
+    elif source_type == "选择列表":
+        variable.choices, variable.choice_weights = parse_choices(config.get('choices') or [], data_type, name,
+                                                                  weighted=bool(config.get('weighted')))
+    elif source_type == "字符集合":
+        variable.charset = parse_charset(str(config.get('charset', '')))
+        if not variable.charset.size:
+            raise ValueError("字符集不能为空")
+    elif source_type in STRUCTURED_SOURCES:
+        variable.node_count = parse('node_count', 1)
+        if source_type == "图":
+            variable.edge_count = parse('edge_count', 0)
+
+    if data_type == "字符串" and source_type in ("数据范围", "字符集合"):
+        variable.length_range = parse_length(config.get('string_length', '10'), name, defined, all_names)
+        for reference in set(variable.length_range):
+            variable.dependencies.extend(reference.dependencies)
+
+    return variable
+
+
+def parse_reference(value: Any, owner: str, label: str, defined: Dict[str, int], all_names) -> Reference:
+    """把配置值解析为常量、对前面变量的引用或算术表达式
+
+    Args:
+        value: 配置值，数字、数字字符串、变量名或表达式（如 n-1、2*n、max(1, n//2)、10**9）
+        owner: 当前变量名，用于报错
+        label: 字段说明，用于报错
+        defined: 当前变量之前已定义的变量名及其位置
+        all_names: 所有变量名
+    """
+    if isinstance(value, bool):
+        raise ValueError(f"变量 {owner} 的{label}不是有效的数字或变量名: {value}")
+    if isinstance(value, (int, float)):
+        return Reference(value, constant=value)
+
+    text = str(value).strip()
+    number = _parse_number(text)
+    if number is not None:
+        return Reference(value, constant=number)
+
+    def lookup(name):
+        if name in defined:
+            return Reference(name, slot=defined[name], target=name).resolve
+        if name in all_names:
+            raise ValueError(f"变量 {owner} 的{label}引用了在它之后定义的变量 {name}，只能引用前面的变量")
+        raise ValueError(f"变量 {owner} 的{label}引用了未定义的变量 {name}")
+
+    if _IDENTIFIER_RE.match(text):
+        lookup(text)
+        return Reference(value, slot=defined[text], target=text)
+
+    try:
+        evaluator, names = compile_expression(text, lookup)
+    except ValueError as e:
+        if str(e).startswith(f"变量 {owner} 的"):
+            raise
+        raise ValueError(f"变量 {owner} 的{label}不是有效的数字、变量名或表达式: {value}（{e}）")
+
+    if not names:
+        return Reference(value, constant=evaluator(None))
+
+    def evaluate(slots):
+        try:
+            return evaluator(slots)
+        except (ValueError, TypeError, ArithmeticError) as e:
+            raise ValueError(f"变量 {owner} 的{label}计算出错: {value}（{e}）")
+
+    return Reference(value, evaluator=evaluate, dependencies=tuple(sorted({defined[name] for name in names})))
+
+
+def parse_length(value: Any, owner: str, defined: Dict[str, int], all_names) -> Tuple[Reference, Reference]:
+    """解析字符串长度配置：固定长度 "10"、"n"、"n-1" 或随机长度 "1,10"、"1,n"、"1,2*n"
+
+    Returns:
+        (最小长度, 最大长度)，固定长度时两者为同一个引用
+    """
+    text = str(value).strip()
+    parts = [part.strip() for part in _split_top_level(text)]
+    if len(parts) > 2:
+        raise ValueError(f"随机长度格式错误，应为 'min,max'，实际为: {text}")
+
+    references = [parse_reference(part, owner, "字符串长度", defined, all_names) for part in parts]
+    for reference in references:
+        if reference.is_constant and reference.constant < 0:
+            raise ValueError(f"长度不能为负数: {text}")
+    if len(references) == 2 and references[0].is_constant and references[1].is_constant:
+        if references[0].constant > references[1].constant:
+            raise ValueError(f"最小长度不能大于最大长度: {text}")
+
+    return references[0], references[-1]
+
+
+def _split_top_level(text: str) -> List[str]:
+    """按不在括号内的逗号切分，如 "max(1,n//2),n" 切分为两部分"""
+    parts = []
+    depth = 0
+    start = 0
+    for position, char in enumerate(text):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(text[start:position])
+            start = position + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _parse_number(text: str) -> Optional[Any]:
+    """解析数字字符串，含小数点时为浮点数，不是数字时返回None"""
+    try:
+        return float(text) if '.' in text else int(text)
+    except ValueError:
+        return None
+
+
+def parse_choices(choices: List[Any], data_type: str, owner: str = '',
+                  weighted: bool = False) -> Tuple[List[Any], Optional[List[float]]]:
+    """解析选择列表，按数据类型一次性转换选项
+
+    配置中勾选了按权重选择（weighted 为 True）时，每个选项都写成 "值:权重"
+    （如 "0:90%", "1:10%" 或 "a:3", "b:1"），权重可以带百分号，只需相对大小，不要求总和为100。
+    未勾选时选项按原样使用，"12:30" 这类选项不会被当作权重。
+
+    Args:
+        choices: 选项列表
+        data_type: 数据类型
+        owner: 变量名，用于报错
+        weighted: 是否按 "值:权重" 解析选项
+
+    Returns:
+        (选项值列表, 累积权重列表)；不带权重时累积权重为None
+    """
+    if not choices:
+        raise ValueError("选择列表不能为空")
+
+    cum_weights = None
+    if weighted:
+        matches = [_WEIGHTED_CHOICE_RE.match(str(choice)) for choice in choices]
+        for choice, match in zip(choices, matches):
+            if not match:
+                raise ValueError(f"变量 {owner} 的选项 {choice} 不是 值:权重 格式")
+        choices = [match.group(1) for match in matches]
+        weights = [float(match.group(2)) for match in matches]
+        if sum(weights) <= 0:
+            raise ValueError(f"变量 {owner} 的选择列表权重之和必须大于0")
+        cum_weights = list(accumulate(weights))
+
+    try:
+        if data_type == "整数":
+            values = [int(choice) for choice in choices]
+        elif data_type == "浮点数":
+            values = [float(choice) for choice in choices]
+        else:
+            values = list(choices)
+    except (TypeError, ValueError):
+        raise ValueError(f"变量 {owner} 的选择列表中有不是{data_type}的选项")
+    return values, cum_weights
+
+
+def _coerce_slot_value(value: Any, target: str) -> Any:
+    """被引用变量的值不是数字时（如选择列表中的字符串）转换为数字"""
+    if isinstance(value, str):
+        number = _parse_number(value.strip())
+        if number is not None:
+            return number
+        raise ValueError(f"变量 {target} 的值 {value!r} 不是数字，不能被引用")
+    if isinstance(value, list):
+        raise ValueError(f"变量 {target} 生成了多个值，不能作为数量或范围被引用")
+    raise ValueError(f"变量 {target} 的值 {value!r} 不能被引用")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+已有测试数据包的读取
+功能：扫描目录或zip中的 .in 文件，只记录文件名，用到时才读取或解压，
+用于为其他工具生成的或旧的数据包重新生成 .out 文件
+"""
+
+import re
+import shutil
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import List, Optional, Union
+
+# 解压时每次复制的字节数
+COPY_CHUNK = 1 << 20
+# 示例数据最多读取的字节数，大文件只显示开头
+EXAMPLE_BYTES = 64 * 1024
+
+
+def natural_key(name: str):
+    """按文件名中的数字大小排序，test2.in 排在 test10.in 之前"""
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', name)]
+
+
+class InputPack:
+    """目录或zip中的一组 .in 文件"""
+
+    def __init__(self, source: Union[str, Path], names: Optional[List[str]] = None):
+        """
+        Args:
+            source: 目录或zip文件路径
+            names: 只使用目录中的这些 .in 文件（相对路径），如刚生成的数据；
+                   这些文件属于本任务，打包后可以删除。None 时扫描整个目录，原有的 .in 文件不会删除
+
+        Raises:
+            ValueError: 路径不存在、不是zip文件或其中没有 .in 文件时
+        """
+        self.source = Path(source)
+        self.keep_inputs = names is None
+        if names is not None and self.source.is_dir():
+            self.is_zip = False
+        elif self.source.is_dir():
+            self.is_zip = False
+            names = [path.relative_to(self.source).as_posix() for path in self.source.rglob('*.in')
+                     if path.is_file()]
+        elif self.source.is_file() and zipfile.is_zipfile(self.source):
+            self.is_zip = True
+            self.keep_inputs = False  # 解压出的文件不是原文件
+            with zipfile.ZipFile(self.source) as zipf:
+                names = [info.filename for info in zipf.infolist()
+                         if not info.is_dir() and info.filename.endswith('.in')]
+        else:
+            raise ValueError(f"不是目录或zip文件：{self.source}")
+        if not names:
+            raise ValueError(f"{self.source} 中没有找到 .in 文件")
+        self.names = sorted(names, key=natural_key)
+        self.zipf = None  # materialize 复用的zip句柄
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def default_output_dir(self) -> Path:
+        """默认输出目录：目录中的 .out 文件写在 .in 文件旁边，zip 解压到旁边的 <名称>_out 目录"""
+        if self.is_zip:
+            return self.source.with_name(f"{self.source.stem}_out")
+        return self.source
+
+    def read_text(self, name: str, limit: int = EXAMPLE_BYTES) -> str:
+        """读取一个 .in 文件的开头，用于显示示例"""
+        if self.is_zip:
+            with zipfile.ZipFile(self.source) as zipf, zipf.open(name) as f:
+                data = f.read(limit)
+        else:
+            with open(self.source / name, 'rb') as f:
+                data = f.read(limit)
+        return data.decode('utf-8', errors='replace')
+
+    def read_examples(self, count: int) -> List[str]:
+        """读取前 count 个 .in 文件的开头作为示例"""
+        return [self.read_text(name) for name in self.names[:count]]
+
+    def local_path(self, name: str, target_dir: Union[str, Path]) -> Path:
+        """.in 文件在磁盘上的路径：目录中为原路径，zip 中为解压到 target_dir 下的路径"""
+        if not self.is_zip:
+            return self.source / name
+        # 只保留路径中的普通部分，防止 ../ 写到目标目录之外
+        parts = [part for part in PurePosixPath(name).parts if part not in ('..', '/', '')]
+        return Path(target_dir).joinpath(*parts)
+
+    def materialize(self, name: str, target_dir: Union[str, Path]) -> Path:
+        """得到可以作为标准输入打开的文件路径
+
+        目录中的文件直接返回原路径；zip 中的文件逐块解压到 target_dir 下，不整体读入内存。
+        """
+        target = self.local_path(name, target_dir)
+        if not self.is_zip:
+            return target
+        if self.zipf is None:
+            self.zipf = zipfile.ZipFile(self.source)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self.zipf.open(name) as source, open(target, 'wb') as f:
+            shutil.copyfileobj(source, f, COPY_CHUNK)
+        return target
+
+    def close(self):
+        """关闭 materialize 打开的zip文件"""
+        if self.zipf is not None:
+            self.zipf.close()
+            self.zipf = None
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试数据包任务清单
+功能：在输出目录中记录每组数据的随机种子、输入哈希和输出状态，定期写入磁盘；
+任务中断（程序崩溃或被关闭）后再次运行同一任务时，按哈希校验已有文件，跳过已完成的用例
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Union
+
+from .output_cache import hash_file
+
+MANIFEST_VERSION = 1
+# 两次写入清单的最短间隔（秒），任务结束或出错时总会写入
+CHECKPOINT_INTERVAL = 2.0
+
+
+def manifest_path(output_dir: str, file_prefix: str = "test") -> Path:
+    """任务清单的路径"""
+    return Path(output_dir) / f"{file_prefix}_job.json"
+
+
+def payload_digest(data: Union[str, bytes, bytearray, memoryview]) -> str:
+    """与 FileManagerCore.write_data_file 写出的文件内容一致的 SHA-256（末尾没有换行时补一个）"""
+    payload = data.encode('utf-8') if isinstance(data, str) else data
+    hasher = hashlib.sha256(payload)
+    if len(payload) == 0 or payload[-1] != ord('\n'):
+        hasher.update(b'\n')
+    return hasher.hexdigest()
+
+
+def _normalize(value: Any) -> Any:
+    """转换为 JSON 读回后的形式，便于与清单中的记录比较"""
+    return json.loads(json.dumps(value, ensure_ascii=False))
+
+
+def read_manifest(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """读取任务清单，文件不存在或已损坏时返回None"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+        return None
+    return data
+
+
+def find_resumable_job(output_dir: str, configs, count: int, no_duplicate: bool,
+                       file_prefix: str = "test", budget: Optional[Dict[str, Any]] = None,
+                       multi_case: Optional[Dict[str, Any]] = None) -> Optional[Tuple[int, int]]:
+    """查找输出目录中配置相同、尚未完成的生成任务
+
+    Returns:
+        (随机种子, 已生成的组数)，没有可继续的任务时返回None
+    """
+    data = read_manifest(manifest_path(output_dir, file_prefix))
+    if not data or data.get('completed'):
+        return None
+    job = data.get('job', {})
+    if (job.get('mode') != 'generated' or job.get('configs') != _normalize(configs)
+            or job.get('count') != count or job.get('no_duplicate') != no_duplicate
+            or job.get('budget') != (_normalize(budget) if budget else None)
+            or job.get('multi_case') != (_normalize(multi_case) if multi_case else None)):
+        return None
+    return job['seed'], len(data.get('cases', {}))
+
+
+class JobManifest:
+    """任务清单：每组数据的种子、输入哈希和输出哈希"""
+
+    def __init__(self, path: Union[str, Path], job: Dict[str, Any], solution_key: Optional[str] = None):
+        """读取已有的清单；任务参数不同时从头开始，解题程序不同时只保留输入记录
+
+        Args:
+            path: 清单文件路径
+            job: 任务参数（生成方式、配置、组数、种子等），用于判断是否为同一任务
+            solution_key: 解题程序的键（SolutionProcess.key），没有解题程序时为None
+        """
+        self.path = Path(path)
+        self.job = _normalize(job)
+        self.solution_key = solution_key
+        self.cases = {}
+        self.zip_file = None
+        self.lock = threading.Lock()
+        self.last_saved = 0.0
+
+        data = read_manifest(self.path)
+        if data and data.get('job') == self.job:
+            self.cases = {int(index): case for index, case in data.get('cases', {}).items()}
+            self.zip_file = data.get('zip_file') if not data.get('completed') else None
+            if data.get('solution') != solution_key:
+                for case in self.cases.values():
+                    case.pop('out_sha256', None)
+                    case.pop('out_size', None)
+
+    def input_valid(self, index: int, in_path: Union[str, Path]) -> bool:
+        """清单中有该组输入，且文件内容的哈希一致"""
+        case = self.cases.get(index)
+        if not case or not os.path.exists(in_path):
+            return False
+        return hash_file(str(in_path)) == case['in_sha256']
+
+    def output_valid(self, index: int, out_path: Union[str, Path]) -> bool:
+        """清单中记录了该组的输出，且文件内容的哈希一致"""
+        case = self.cases.get(index)
+        if not case or 'out_sha256' not in case or not os.path.exists(out_path):
+            return False
+        return hash_file(str(out_path)) == case['out_sha256']
+
+    def output_info(self, index: int) -> Dict[str, Any]:
+        """已完成用例的输出大小和哈希"""
+        case = self.cases[index]
+        return {'size': case['out_size'], 'sha256': case['out_sha256']}
+
+    def next_seed(self, default: int) -> int:
+        """清单中用过的最大种子之后的种子，用于不重复模式继续生成"""
+        seeds = [case['seed'] for case in self.cases.values() if case.get('seed') is not None]
+        return max(seeds) + 1 if seeds else default
+
+    def record_input(self, index: int, seed: Optional[int], in_sha256: str):
+        """记录一组新写入的输入，该组原有的输出记录作废"""
+        with self.lock:
+            self.cases[index] = {'seed': seed, 'in_sha256': in_sha256}
+        self.save()
+
+    def record_output(self, index: int, out_sha256: str, out_size: int):
+        """记录一组已生成的输出"""
+        with self.lock:
+            self.cases[index].update(out_sha256=out_sha256, out_size=out_size)
+        self.save()
+
+    def save(self, force: bool = False, completed: bool = False):
+        """写入清单：先写临时文件再替换，中途崩溃也不会留下损坏的清单"""
+        with self.lock:
+            now = time.monotonic()
+            if not force and now - self.last_saved < CHECKPOINT_INTERVAL:
+                return
+            self.last_saved = now
+            data = {
+                'version': MANIFEST_VERSION,
+                'job': self.job,
+                'solution': self.solution_key,
+                'completed': completed,
+                'zip_file': self.zip_file,
+                'cases': {str(index): case for index, case in sorted(self.cases.items())},
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f"{self.path.name}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+字节输出构建器
+功能：把生成的值直接编码为 UTF-8 字节追加到 bytearray 中，
+避免先拼接字符串再整体编码带来的多次复制
+"""
+
+from typing import Any, List, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+_FORMAT_INT = b'%d'.__mod__
+
+
+def encode_values(values: List[Any], separator: bytes, as_int: bool = False) -> bytes:
+    """把一个变量的全部值编码为字节并用分隔符连接
+
+    Args:
+        values: 值列表
+        separator: 已编码的分隔符
+        as_int: 值是否全部为整数，是时走整数快速路径
+
+    Returns:
+        编码后的字节串
+    """
+    if as_int:
+        return separator.join(map(_FORMAT_INT, values))
+    if values and type(values[0]) is str:
+        return separator.join([value.encode('utf-8') for value in values])
+    return separator.join([str(value).encode('utf-8') for value in values])
+
+
+class OutputBuilder:
+    """按字节拼接一组测试数据，可选地在写入的同时计算哈希"""
+
+    __slots__ = ('buffer', 'hasher')
+
+    def __init__(self, hasher=None):
+        """
+        Args:
+            hasher: 可选的哈希对象，每次写入的字节都会同时更新到其中
+        """
+        self.buffer = bytearray()
+        self.hasher = hasher
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def write(self, data: BytesLike):
+        """追加已编码的字节"""
+        self.buffer += data
+        if self.hasher is not None:
+            self.hasher.update(data)
+
+    def write_text(self, text: str):
+        """追加文本，按 UTF-8 编码"""
+        self.write(text.encode('utf-8'))
+
+    def write_values(self, values: List[Any], separator: bytes, as_int: bool = False):
+        """追加一个变量的全部值，值之间用分隔符连接"""
+        self.write(encode_values(values, separator, as_int))
+
+    def getvalue(self) -> bytearray:
+        """返回拼接结果（不复制）"""
+        return self.buffer
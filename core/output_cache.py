@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+解题输出缓存
+功能：按 解题程序 + 输入内容 的哈希把 .out 结果保存在磁盘上，重新生成测试数据时
+只对新增或改动过的输入运行解题程序；缓存总大小超过上限时删除最久未使用的结果
+"""
+
+import os
+import shutil
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .solution_runner import default_cache_dir
+
+# 输出缓存的默认大小上限（字节）
+OUTPUT_CACHE_LIMIT = 1024 * 1024 * 1024
+# 计算哈希和复制文件时每次读取的字节数
+READ_CHUNK = 1 << 20
+
+
+def hash_file(path: str, hasher=None) -> str:
+    """分块计算文件内容的 SHA-256"""
+    hasher = hasher or hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class OutputCache:
+    """以内容哈希为键的 .out 结果缓存，按文件访问时间做 LRU 淘汰"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = OUTPUT_CACHE_LIMIT):
+        """
+        Args:
+            cache_dir: 缓存目录，默认为编译缓存旁边的 cache/outputs
+            max_bytes: 缓存总大小上限（字节）
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir().parent / 'outputs'
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.total_bytes = None  # 第一次写入时扫描目录得到
+
+    def entry_key(self, solution_key: str, in_path: str) -> str:
+        """缓存键：解题程序的键和输入文件内容的哈希"""
+        hasher = hashlib.sha256()
+        hasher.update(solution_key.encode('utf-8'))
+        hasher.update(b'\0')
+        return hash_file(in_path, hasher)
+
+    def entry_path(self, key: str) -> Path:
+        """缓存文件路径，按哈希前两位分目录"""
+        return self.cache_dir / key[:2] / f"{key}.out"
+
+    def fetch(self, key: str, out_path: str) -> Optional[Dict[str, Any]]:
+        """缓存中有结果时复制到 out_path
+
+        Returns:
+            {'size': 输出字节数, 'sha256': 输出内容的哈希}，未命中时返回None
+        """
+        path = self.entry_path(key)
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with open(path, 'rb') as source, open(out_path, 'wb') as target:
+                for chunk in iter(lambda: source.read(READ_CHUNK), b''):
+                    target.write(chunk)
+                    hasher.update(chunk)
+                    size += len(chunk)
+            # 更新访问时间，作为 LRU 的依据
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return {'size': size, 'sha256': hasher.hexdigest()}
+
+    def store(self, key: str, out_path: str):
+        """把运行得到的 .out 文件存入缓存，超过上限时淘汰最久未使用的结果"""
+        path = self.entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        shutil.copyfile(out_path, temp_path)
+        size = temp_path.stat().st_size
+        with self.lock:
+            if self.total_bytes is None:
+                self.total_bytes = self.size()
+            if path.exists():
+                self.total_bytes -= path.stat().st_size
+            os.replace(temp_path, path)
+            self.total_bytes += size
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def size(self) -> int:
+        """缓存目录中结果文件的总大小"""
+        return sum(path.stat().st_size for path in self.cache_dir.glob('*/*.out'))
+
+    def clear(self):
+        """清空缓存"""
+        with self.lock:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self.total_bytes = 0
+
+    def _evict(self):
+        """按访问时间从旧到新删除结果，直到总大小不超过上限的90%"""
+        entries = []
+        for path in self.cache_dir.glob('*/*.out'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except FileNotFoundError:
+                pass
+        self.total_bytes = total
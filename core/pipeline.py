@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试数据包的流水线生成
+功能：生成数据、运行解题程序、写入zip三个阶段同时进行，阶段之间用有界队列连接，
+任何时候在内存中等待的只有少量文件路径；同时统计各阶段的忙碌程度，找出瓶颈。
+启用任务清单时，中断后再次运行同一任务会校验已有文件并跳过已完成的用例
+"""
+
+import os
+import time
+import itertools
+import queue
+import random
+import zipfile
+import threading
+import multiprocessing
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Callable, Union
+
+from .data_generator_core import DataGeneratorCore, ENUMERATION_FACTOR
+from .file_manager_core import FileManagerCore
+from .generation_plan import build_plan
+from .job_manifest import JobManifest, manifest_path, payload_digest
+from .output_cache import hash_file
+from .size_budget import budget_configs, budget_sizes, fix_variable
+
+# 阶段之间队列的容量（组数）
+QUEUE_SIZE = 16
+# 用例数少于该值时在当前进程中生成，省去启动工作进程的开销
+PARALLEL_THRESHOLD = 8
+# 不重复模式下最多尝试的次数（相对于用例数的倍数）
+MAX_ATTEMPT_FACTOR = 10
+# 等待队列时检查是否需要停止的间隔（秒）
+WAIT_INTERVAL = 0.1
+
+STAGE_NAMES = {'generate': "生成数据", 'solve': "运行解答", 'archive': "写入zip"}
+
+# 工作进程中复用的生成器
+_worker_generator = None
+
+
+def _generate_case_file(task):
+    """在工作进程中用给定种子生成一个数据文件，只把文件哈希和用时传回主进程
+
+    task 为 (配置, 种子, 路径, 多组布局)，多组布局为 None 时文件中只有一组数据，
+    否则为 {'cases': 组数, 'header': 是否在第一行写组数, 'variable': 规模变量, 'sizes': 各组的规模}，
+    各组逐个生成并写入文件。
+    """
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = DataGeneratorCore()
+
+    configs, seed, path, layout = task
+    start = time.perf_counter()
+    _worker_generator.set_seed(seed)
+    if layout is None:
+        data = _worker_generator.generate_test_bytes(configs, 1)[0]
+        FileManagerCore().write_data_file(path, data)
+        digest = payload_digest(data)
+    else:
+        if layout.get('sizes') is None:
+            case_configs = itertools.repeat(configs, layout['cases'])
+        else:
+            case_configs = (fix_variable(configs, layout['variable'], size) for size in layout['sizes'])
+        header = str(layout['cases']) if layout['header'] else None
+        digest = FileManagerCore().write_cases_file(path, _worker_generator.iter_test_bytes(case_configs), header)
+    return seed, path, digest, time.perf_counter() - start
+
+
+class _Stopped(Exception):
+    """流水线中某个阶段出错后，其他阶段以此退出"""
+
+
+class PackPipeline:
+    """测试数据包流水线：生成 → 运行解答 → 打包"""
+
+    def __init__(self, output_dir: str, file_prefix: str = "test", solution=None, output_cache=None,
+                 solve_workers: Optional[int] = None, queue_size: int = QUEUE_SIZE,
+                 create_zip: bool = True, delete_temp_files: bool = False, checkpoint: bool = False):
+        """
+        Args:
+            output_dir: 输出目录
+            file_prefix: 文件前缀
+            solution: 解题程序（core.solution_runner.SolutionProcess），None 时只生成 .in 文件
+            output_cache: 输出缓存（core.output_cache.OutputCache）
+            solve_workers: 同时运行解答的进程数，默认为CPU核数
+            queue_size: 阶段之间队列的容量
+            create_zip: 是否创建zip文件
+            delete_temp_files: 是否在文件写入zip后删除（启用任务清单时在任务完成后删除）
+            checkpoint: 是否在输出目录中维护任务清单（见 core.job_manifest），用于中断后继续
+        """
+        self.output_path = Path(output_dir)
+        self.file_prefix = file_prefix
+        self.solution = solution
+        self.output_cache = output_cache
+        self.solve_workers = max(1, solve_workers or os.cpu_count() or 1)
+        self.queue_size = max(1, queue_size)
+        self.create_zip = create_zip
+        self.delete_temp_files = delete_temp_files
+        self.checkpoint = checkpoint
+        self.manifest = None
+        self.keep_inputs = False  # 原有的 .in 文件不属于本任务，不删除
+        self.archive_root = self.output_path  # zip 中的文件名相对于该目录
+        self.file_manager = FileManagerCore()
+        self.lock = threading.Lock()  # 保护多个解答线程共同更新的统计
+
+    def run_generated(self, configs: List[Dict[str, Any]], count: int, workers: Optional[int] = None,
+                      seed: Optional[int] = None, no_duplicate: bool = False,
+                      budget: Optional[Dict[str, Any]] = None,
+                      multi_case: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """按配置生成 count 组数据，生成的同时运行解答并写入zip
+
+        第 i 组数据的随机种子为 seed + i - 1，相同的种子和配置得到相同的数据包；
+        不重复模式下重复的数据组会换一个种子重新生成，编号按完成顺序分配。
+        指定总规模时先按种子把总和分配到各组（见 core.size_budget），每组的规模变量固定为分到的值。
+        指定多组模式时 count 为文件数，每个文件包含 T 组独立生成的数据，总规模按每个文件分配。
+
+        Args:
+            configs: 变量配置列表
+            count: 数据组数（多组模式下为文件数）
+            workers: 生成数据的进程数，默认为CPU核数
+            seed: 起始随机种子，默认随机选取
+            no_duplicate: 是否避免生成重复数据
+            budget: 总规模 {'variable': 变量名, 'total': 总和, 'max_case': 是否包含一个最大用例}
+            multi_case: 每个文件多组数据 {'cases': 每个文件的组数 T, 'header': 是否在第一行写 T}
+
+        Returns:
+            保存结果信息，'stats' 为各阶段的统计，指定总规模时 'sizes' 为各组规模变量的值
+            （多组模式下为每个文件中各组的值）
+        """
+        # 引用关系无效时在启动工作进程前报错
+        build_plan(configs)
+        if budget and no_duplicate:
+            raise ValueError("总规模模式不能与不重复数据同时使用")
+        if multi_case:
+            if no_duplicate:
+                raise ValueError("每个文件多组数据时不能与不重复数据同时使用")
+            if not isinstance(multi_case.get('cases'), int) or multi_case['cases'] < 1:
+                raise ValueError(f"每个文件的组数必须为正整数: {multi_case.get('cases')}")
+        generator = DataGeneratorCore()
+        if no_duplicate:
+            # 取值空间较小时由生成器枚举抽样，随机生成很难凑齐不重复的数据
+            cardinality = generator.estimate_cardinality(configs)
+            if cardinality is not None and cardinality <= count * ENUMERATION_FACTOR:
+                if seed is not None:
+                    generator.set_seed(seed)
+                return self.run_data(generator.generate_test_bytes(configs, count, no_duplicate))
+
+        workers = max(1, workers or os.cpu_count() or 1)
+        if count * (multi_case['cases'] if multi_case else 1) < PARALLEL_THRESHOLD:
+            workers = 1
+        seed = random.randrange(1 << 30) if seed is None else seed
+        sizes, case_configs, layouts = None, None, None
+        # 分配只取决于种子，中断后继续时得到相同的分配
+        if multi_case:
+            layout = {'cases': multi_case['cases'], 'header': multi_case.get('header', True),
+                      'variable': None, 'sizes': None}
+            if budget:
+                rng = random.Random(seed)
+                sizes = [budget_sizes(configs, layout['cases'], budget, rng) for _ in range(count)]
+                layouts = [dict(layout, variable=budget['variable'], sizes=file_sizes) for file_sizes in sizes]
+            else:
+                layouts = [layout] * count
+        elif budget:
+            sizes, case_configs = budget_configs(configs, count, budget, random.Random(seed))
+        job = {'mode': 'generated', 'configs': configs, 'count': count, 'seed': seed, 'no_duplicate': no_duplicate}
+        if budget:
+            job['budget'] = budget
+        if multi_case:
+            job['multi_case'] = multi_case
+        result = self._run(lambda emit, stats: self._generate(configs, count, workers, seed, no_duplicate,
+                                                               emit, stats, case_configs, layouts), workers, job)
+        result['seed'] = seed
+        if sizes is not None:
+            result['sizes'] = sizes
+        return result
+
+    def run_data(self, test_data: List[Union[str, bytes, bytearray, memoryview]]) -> Dict[str, Any]:
+        """写入已有的测试数据，写入的同时运行解答并写入zip
+
+        Returns:
+            保存结果信息，'stats' 为各阶段的统计
+        """
+        job = {'mode': 'data', 'count': len(test_data)}
+        return self._run(lambda emit, stats: self._write(test_data, emit, stats), 1, job)
+
+    def run_pack(self, pack) -> Dict[str, Any]:
+        """为已有数据包（core.input_pack.InputPack）中的 .in 文件运行解答并写入zip
+
+        目录中的 .in 文件原地使用，.out 写在旁边，原有的 .in 文件不会被删除；
+        zip 中的文件在处理到时才逐个解压到输出目录。
+
+        Returns:
+            保存结果信息，'stats' 为各阶段的统计
+        """
+        self.keep_inputs = pack.keep_inputs
+        self.archive_root = self.output_path if pack.is_zip else pack.source
+        job = {'mode': 'pack', 'source': str(pack.source.resolve()), 'names': pack.names}
+        try:
+            return self._run(lambda emit, stats: self._import(pack, emit, stats), 1, job)
+        finally:
+            pack.close()
+
+    def _case_path(self, index: int, suffix: str) -> Path:
+        return self.output_path / f"{self.file_prefix}{index:02d}{suffix}"
+
+    def _run(self, produce: Callable, generate_workers: int, job: Dict[str, Any]) -> Dict[str, Any]:
+        """启动解答和打包线程，在当前线程中生产数据，等待全部完成后汇总结果"""
+        self.output_path.mkdir(parents=True, exist_ok=True)
+        self.stop = threading.Event()
+        self.errors = []
+        if self.checkpoint:
+            self.manifest = JobManifest(manifest_path(self.output_path, self.file_prefix), job,
+                                        self.solution.key if self.solution else None)
+            # 上次中断时写了一半的zip已经不完整，重新打包
+            if self.manifest.zip_file:
+                Path(self.manifest.zip_file).unlink(missing_ok=True)
+        stats = {
+            'generate': {'workers': generate_workers, 'items': 0, 'busy': 0.0, 'blocked': 0.0, 'resumed': 0},
+            'solve': {'workers': self.solve_workers if self.solution else 0, 'items': 0, 'busy': 0.0,
+                      'blocked': 0.0, 'resumed': 0},
+            'archive': {'workers': 1, 'items': 0, 'busy': 0.0, 'blocked': 0.0, 'resumed': 0},
+        }
+        archive_queue = queue.Queue(self.queue_size)
+        solve_queue = queue.Queue(self.queue_size) if self.solution else None
+        outputs = {}
+        archived = {'created_files': [], 'deleted_files': [], 'zip_file': None}
+        start = time.perf_counter()
+
+        solve_threads = []
+        if self.solution:
+            for _ in range(self.solve_workers):
+                thread = threading.Thread(target=self._guard,
+                                          args=(self._solve, solve_queue, archive_queue, outputs, stats['solve']),
+                                          daemon=True)
+                thread.start()
+                solve_threads.append(thread)
+        archive_thread = threading.Thread(target=self._guard,
+                                          args=(self._archive, archive_queue, archived, stats['archive']),
+                                          daemon=True)
+        archive_thread.start()
+
+        def emit(index: int, in_path: str):
+            """把写好的 .in 文件交给下一阶段；清单中已有有效输出的用例跳过解答"""
+            files = [str(in_path)]
+            target_queue = archive_queue
+            if self.solution:
+                out_path = Path(in_path).with_suffix(".out")
+                if self.manifest and self.manifest.output_valid(index, out_path):
+                    outputs[index] = dict(self.manifest.output_info(index), cached=False, resumed=True)
+                    files.append(str(out_path))
+                    stats['solve']['resumed'] += 1
+                else:
+                    target_queue = solve_queue
+            waited = time.perf_counter()
+            self._put(target_queue, (index, files))
+            stats['generate']['blocked'] += time.perf_counter() - waited
+            stats['generate']['items'] += 1
+
+        try:
+            produce(emit, stats['generate'])
+        except _Stopped:
+            pass
+        except Exception as e:
+            self._fail(str(e))
+        finally:
+            # 生产结束或出错后依次关闭各阶段
+            for _ in solve_threads:
+                self._put_final(solve_queue)
+            for thread in solve_threads:
+                thread.join()
+            self._put_final(archive_queue)
+            archive_thread.join()
+
+        elapsed = time.perf_counter() - start
+        if self.errors:
+            if archived['zip_file']:
+                Path(archived['zip_file']).unlink(missing_ok=True)
+            if self.manifest:
+                self.manifest.zip_file = None
+                self.manifest.save(force=True)
+            raise ValueError(self.errors[0])
+
+        if self.manifest:
+            self.manifest.save(force=True, completed=True)
+            # 任务完成前保留文件，中断后才能继续
+            if self.delete_temp_files and self.create_zip:
+                for file_path in archived['created_files']:
+                    if not self._removable(file_path):
+                        continue
+                    try:
+                        Path(file_path).unlink()
+                        archived['deleted_files'].append(file_path)
+                    except Exception:
+                        pass
+
+        for stage in stats.values():
+            capacity = stage['workers'] * elapsed
+            stage['utilization'] = stage['busy'] / capacity if capacity else 0.0
+        active = {name: stage for name, stage in stats.items() if stage['workers']}
+
+        created_files = sorted(archived['created_files'])
+        result = {
+            'output_dir': str(self.output_path),
+            'created_files': created_files,
+            'file_count': len(created_files),
+            'resumed_cases': stats['solve' if self.solution else 'generate']['resumed'],
+            'stats': {
+                'elapsed': elapsed,
+                'stages': stats,
+                'bottleneck': max(active, key=lambda name: active[name]['utilization']),
+            },
+        }
+        if archived['zip_file']:
+            result['zip_file'] = archived['zip_file']
+        if self.delete_temp_files and self.create_zip:
+            result['deleted_temp_files'] = archived['deleted_files']
+        if self.solution:
+            result['outputs'] = [outputs[index] for index in sorted(outputs)]
+            result['cache_hits'] = sum(1 for output in result['outputs'] if output['cached'])
+            result['cache_misses'] = sum(1 for output in result['outputs']
+                                         if not output['cached'] and not output['resumed'])
+        return result
+
+    def _guard(self, target: Callable, *args):
+        """运行一个阶段，出错时记录并通知其他阶段停止"""
+        try:
+            target(*args)
+        except _Stopped:
+            pass
+        except Exception as e:
+            self._fail(str(e))
+
+    def _fail(self, message: str):
+        self.errors.append(message)
+        self.stop.set()
+
+    def _put(self, target_queue: queue.Queue, item):
+        """放入有界队列，队列满时等待下游；流水线停止时抛出 _Stopped"""
+        while True:
+            if self.stop.is_set():
+                raise _Stopped()
+            try:
+                target_queue.put(item, timeout=WAIT_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def _put_final(self, target_queue: queue.Queue):
+        """放入结束标记；流水线已停止时下游会自行退出，不再等待"""
+        try:
+            self._put(target_queue, None)
+        except _Stopped:
+            pass
+
+    def _get(self, source_queue: queue.Queue):
+        """从队列取出一项；流水线停止时抛出 _Stopped"""
+        while True:
+            if self.stop.is_set():
+                raise _Stopped()
+            try:
+                return source_queue.get(timeout=WAIT_INTERVAL)
+            except queue.Empty:
+                continue
+
+    def _write(self, test_data, emit: Callable, stats: Dict[str, Any]):
+        """生产阶段：把已有数据逐组写入 .in 文件，清单中内容相同的文件不再重写"""
+        for index, data in enumerate(test_data, 1):
+            start = time.perf_counter()
+            in_path = self._case_path(index, ".in")
+            if self.manifest is None:
+                self.file_manager.write_data_file(in_path, data)
+            else:
+                digest = payload_digest(data)
+                case = self.manifest.cases.get(index)
+                if case and case['in_sha256'] == digest and self.manifest.input_valid(index, in_path):
+                    stats['resumed'] += 1
+                else:
+                    self.file_manager.write_data_file(in_path, data)
+                    self.manifest.record_input(index, None, digest)
+            stats['busy'] += time.perf_counter() - start
+            emit(index, in_path)
+
+    def _import(self, pack, emit: Callable, stats: Dict[str, Any]):
+        """生产阶段：依次取出数据包中的 .in 文件，清单中内容相同的不再解压"""
+        for index, name in enumerate(pack.names, 1):
+            start = time.perf_counter()
+            in_path = pack.local_path(name, self.output_path)
+            case = self.manifest.cases.get(index) if self.manifest else None
+            if case and self.manifest.input_valid(index, in_path):
+                stats['resumed'] += 1
+            else:
+                in_path = pack.materialize(name, self.output_path)
+                if self.manifest:
+                    self.manifest.record_input(index, None, hash_file(str(in_path)))
+            stats['busy'] += time.perf_counter() - start
+            emit(index, in_path)
+
+    def _removable(self, file_path: str) -> bool:
+        """打包后可以删除的文件：本任务写出的文件"""
+        return not (self.keep_inputs and file_path.endswith('.in'))
+
+    def _generate(self, configs: List[Dict[str, Any]], count: int, workers: int, seed: int,
+                  no_duplicate: bool, emit: Callable, stats: Dict[str, Any],
+                  case_configs: Optional[List[List[Dict[str, Any]]]] = None,
+                  layouts: Optional[List[Dict[str, Any]]] = None):
+        """生产阶段：在工作进程中生成数据并写入 .in 文件
+
+        同时提交的任务数有上限，下游来不及处理时生成也随之暂停。
+        清单中已有且校验通过的输入直接交给下一阶段，只生成缺少的用例。
+        case_configs 为每组单独的配置（总规模模式），否则各组都用 configs；
+        layouts 为每个文件的多组布局（见 _generate_case_file），None 时每个文件一组数据。
+        """
+        free = []  # 还需要生成的编号
+        seen_digests = set()
+        for index in range(1, count + 1):
+            in_path = self._case_path(index, ".in")
+            if self.manifest and self.manifest.input_valid(index, in_path):
+                seen_digests.add(self.manifest.cases[index]['in_sha256'])
+                stats['resumed'] += 1
+                emit(index, in_path)
+            else:
+                free.append(index)
+        needed = len(free)
+        if needed == 0:
+            return
+
+        if no_duplicate:
+            # 先写入临时文件，确认不重复后再按完成顺序编号
+            first_seed = self.manifest.next_seed(seed) if self.manifest else seed
+            tasks = ((configs, first_seed + attempt,
+                      self.output_path / f".{self.file_prefix}.{first_seed + attempt}.in.tmp", None)
+                     for attempt in range(needed * MAX_ATTEMPT_FACTOR))
+        else:
+            # 编号由种子决定：第 i 组的种子为 seed + i - 1
+            tasks = ((case_configs[index - 1] if case_configs else configs, seed + index - 1,
+                      self._case_path(index, ".in"), layouts[index - 1] if layouts else None) for index in free)
+        accepted = 0
+
+        def accept(task_seed: int, path: str, digest: str):
+            nonlocal accepted
+            if no_duplicate:
+                if digest in seen_digests:
+                    Path(path).unlink(missing_ok=True)
+                    return
+                seen_digests.add(digest)
+                index = free[accepted]
+                final_path = self._case_path(index, ".in")
+                os.replace(path, final_path)
+                path = final_path
+            else:
+                index = task_seed - seed + 1
+            accepted += 1
+            if self.manifest:
+                self.manifest.record_input(index, task_seed, digest)
+            emit(index, path)
+
+        if workers == 1:
+            for task in tasks:
+                if accepted >= needed:
+                    break
+                if self.stop.is_set():
+                    raise _Stopped()
+                task_seed, path, digest, seconds = _generate_case_file(task)
+                stats['busy'] += seconds
+                accept(task_seed, path, digest)
+            self._warn_short(accepted, needed)
+            return
+
+        results = queue.Queue()
+        pool = multiprocessing.Pool(workers)
+        max_pending = workers + self.queue_size
+        pending = 0
+        try:
+            while accepted < needed:
+                while pending < max_pending and accepted + pending < needed + workers:
+                    task = next(tasks, None)
+                    if task is None:
+                        break
+                    pool.apply_async(_generate_case_file, (task,),
+                                     callback=results.put, error_callback=results.put)
+                    pending += 1
+                if pending == 0:
+                    break
+                result = self._get(results)
+                pending -= 1
+                if isinstance(result, BaseException):
+                    raise ValueError(f"生成数据时出错：{str(result)}")
+                task_seed, path, digest, seconds = result
+                stats['busy'] += seconds
+                if accepted >= needed:
+                    Path(path).unlink(missing_ok=True)
+                    continue
+                accept(task_seed, path, digest)
+        finally:
+            pool.terminate()
+            pool.join()
+            if no_duplicate:
+                for leftover in self.output_path.glob(f".{self.file_prefix}.*.in.tmp"):
+                    leftover.unlink(missing_ok=True)
+        self._warn_short(accepted, needed)
+
+    def _warn_short(self, accepted: int, needed: int):
+        if accepted < needed:
+            print(f"警告: 只能再生成 {accepted} 个不重复的数据组，少于需要的 {needed} 个")
+
+    def _solve(self, solve_queue: queue.Queue, archive_queue: queue.Queue, outputs: Dict[int, Any],
+               stats: Dict[str, Any]):
+        """解答阶段：从 .in 文件运行解题程序生成 .out 文件"""
+        while True:
+            item = self._get(solve_queue)
+            if item is None:
+                return
+            index, files = item
+            in_path = files[0]
+            out_path = str(Path(in_path).with_suffix(".out"))
+            start = time.perf_counter()
+            try:
+                output = self.solution.run_cached(in_path, out_path, self.output_cache)
+            except Exception as e:
+                raise ValueError(f"运行 {os.path.basename(in_path)} 时出错：{str(e)}")
+            outputs[index] = dict(output, resumed=False)
+            if self.manifest:
+                self.manifest.record_output(index, output['sha256'], output['size'])
+            busy = time.perf_counter() - start
+
+            waited = time.perf_counter()
+            self._put(archive_queue, (index, files + [out_path]))
+            with self.lock:
+                stats['busy'] += busy
+                stats['items'] += 1
+                stats['blocked'] += time.perf_counter() - waited
+
+    def _archive(self, archive_queue: queue.Queue, archived: Dict[str, Any], stats: Dict[str, Any]):
+        """打包阶段：文件一完成就写入zip，需要时随即删除（启用任务清单时留到任务完成后删除）"""
+        zipf = None
+        if self.create_zip:
+            zip_path = self.file_manager.new_zip_path(self.output_path, self.file_prefix)
+            archived['zip_file'] = str(zip_path)
+            zipf = zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED)
+            if self.manifest:
+                self.manifest.zip_file = str(zip_path)
+                self.manifest.save(force=True)
+        try:
+            while True:
+                item = self._get(archive_queue)
+                if item is None:
+                    return
+                _, files = item
+                start = time.perf_counter()
+                for file_path in files:
+                    archived['created_files'].append(file_path)
+                    if zipf is None:
+                        continue
+                    zipf.write(file_path, Path(file_path).relative_to(self.archive_root).as_posix())
+                    if self.delete_temp_files and self.manifest is None and self._removable(file_path):
+                        try:
+                            Path(file_path).unlink()
+                            archived['deleted_files'].append(file_path)
+                        except Exception:
+                            pass
+                stats['busy'] += time.perf_counter() - start
+                stats['items'] += 1
+        finally:
+            if zipf is not None:
+                zipf.close()
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    """各阶段统计的文字摘要"""
+    lines = [f"总用时 {stats['elapsed']:.2f} 秒"]
+    for name, stage in stats['stages'].items():
+        if not stage['workers']:
+            continue
+        lines.append(f"{STAGE_NAMES[name]}：{stage['items']} 组，{stage['workers']} 个并行，"
+                     f"忙碌 {stage['utilization'] * 100:.0f}%，等待下游 {stage['blocked']:.2f} 秒")
+    lines.append(f"瓶颈：{STAGE_NAMES[stats['bottleneck']]}")
+    return "\n".join(lines)
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+预览限制
+功能：预览数据时的显示预算，供数据生成器和用户配置的默认值共用
+"""
+
+# 预览时每组数据最多显示的字符数和行数
+PREVIEW_CHAR_BUDGET = 2000
+PREVIEW_LINE_BUDGET = 40
+# 预览时节点数或边数超过该值的树、图、排列不实际生成，只给出规模估算
+PREVIEW_STRUCTURE_LIMIT = 5000
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+总规模分配
+功能：评测常要求所有测试用例中某个规模变量（如 n）的总和不超过一个上限（如 2·10^5）。
+生成前把总和随机拆分到各个用例（可以固定包含一个取最大值的用例），
+再把每个用例中该变量固定为分到的值，其他变量的循环次数等引用随之确定，一次生成就得到准确的总和
+一个文件包含多组数据（首行为组数 T）时，总和按文件计算，每个文件各自拆分到其中的 T 组
+"""
+
+import random
+from typing import List, Dict, Any, Tuple
+
+from .generation_plan import parse_reference
+
+
+def parse_total(value: Any) -> int:
+    """解析总和，支持数字和常量表达式（如 200000、2*10**5）"""
+    try:
+        total = parse_reference(value, "总规模", "总和", {}, set()).constant
+    except ValueError:
+        total = None
+    if total is None or isinstance(total, float) and not total.is_integer():
+        raise ValueError(f"总规模的总和必须是整数: {value}")
+    if total < 0:
+        raise ValueError(f"总规模的总和不能为负数: {value}")
+    return int(total)
+
+
+def budget_bounds(configs: List[Dict[str, Any]], variable: str) -> Tuple[int, int]:
+    """总规模变量的取值范围
+
+    该变量必须是只生成一个值的整数范围变量，范围上下界为常数。
+
+    Returns:
+        (最小值, 最大值)
+    """
+    config = next((config for config in configs if config.get('name') == variable), None)
+    if config is None:
+        raise ValueError(f"总规模变量 {variable} 不存在")
+    if config.get('data_type') != "整数" or config.get('source_type', "数据范围") != "数据范围":
+        raise ValueError(f"总规模变量 {variable} 必须是数据范围类型的整数")
+
+    bounds = []
+    for field, label in (('loop_count', "循环次数"), ('min_value', "最小值"), ('max_value', "最大值")):
+        try:
+            reference = parse_reference(config.get(field, 1), variable, label, {}, set())
+        except ValueError:
+            raise ValueError(f"总规模变量 {variable} 的{label}必须是常数")
+        bounds.append(reference.constant)
+    loop_count, low, high = bounds
+    if loop_count != 1:
+        raise ValueError(f"总规模变量 {variable} 的循环次数必须为1")
+    low, high = int(min(low, high)), int(max(low, high))
+    return low, high
+
+
+def allocate_sizes(total: int, count: int, low: int, high: int, rng: random.Random,
+                   max_case: bool = False) -> List[int]:
+    """把总和随机拆分为 count 个在 [low, high] 内的整数，总和恰好为 total
+
+    先给每份分配下限，剩余部分按随机切点拆分，超过上限的部分再随机分给还有余量的份。
+    max_case 为 True 时其中一份固定取 high，位置随机。
+
+    Raises:
+        ValueError: 无法拆分（总和小于 count*low 或大于 count*high）时
+    """
+    if count <= 0:
+        return []
+    if not count * low <= total <= count * high:
+        raise ValueError(f"无法把总和 {total} 分给 {count} 个用例：每个用例的取值范围为 [{low}, {high}]，"
+                         f"总和应在 {count * low} 到 {count * high} 之间")
+    if max_case:
+        if count == 1:
+            if total != high:
+                raise ValueError(f"只有1个用例时，包含最大用例要求总和等于最大值 {high}")
+            return [high]
+        rest_total = total - high
+        if not (count - 1) * low <= rest_total <= (count - 1) * high:
+            raise ValueError(f"包含一个取 {high} 的最大用例后，剩余总和 {rest_total} 无法分给其余 {count - 1} 个用例")
+        sizes = allocate_sizes(rest_total, count - 1, low, high, rng)
+        sizes.insert(rng.randrange(count), high)
+        return sizes
+
+    remainder = total - count * low
+    capacity = high - low
+    cuts = sorted(rng.randint(0, remainder) for _ in range(count - 1))
+    extras = [b - a for a, b in zip([0] + cuts, cuts + [remainder])]
+
+    # 超过上限的部分收回，再随机分给还有余量的份
+    overflow = 0
+    for i, extra in enumerate(extras):
+        if extra > capacity:
+            overflow += extra - capacity
+            extras[i] = capacity
+    order = list(range(count))
+    while overflow:
+        rng.shuffle(order)
+        for i in order:
+            give = min(capacity - extras[i], overflow, max(1, overflow // count))
+            extras[i] += give
+            overflow -= give
+            if not overflow:
+                break
+    return [low + extra for extra in extras]
+
+
+def fix_variable(configs: List[Dict[str, Any]], variable: str, value: int) -> List[Dict[str, Any]]:
+    """复制配置，把总规模变量固定为 value
+
+    改为只有一个选项的选择列表：数据范围的上下界相等时生成器会把上界加1，不能用来固定取值。
+    """
+    fixed = []
+    for config in configs:
+        if config.get('name') == variable:
+            config = dict(config, source_type="选择列表", choices=[str(value)])
+        fixed.append(config)
+    return fixed
+
+
+def budget_sizes(configs: List[Dict[str, Any]], count: int, budget: Dict[str, Any],
+                 rng: random.Random) -> List[int]:
+    """按总规模为 count 个用例分配规模变量的值
+
+    Args:
+        configs: 变量配置列表
+        count: 用例数
+        budget: {'variable': 变量名, 'total': 总和, 'max_case': 是否包含一个最大用例}
+        rng: 随机数生成器，相同种子得到相同的分配
+
+    Returns:
+        每个用例分到的值
+    """
+    low, high = budget_bounds(configs, budget['variable'])
+    return allocate_sizes(parse_total(budget['total']), count, low, high, rng, budget.get('max_case', False))
+
+
+def budget_configs(configs: List[Dict[str, Any]], count: int, budget: Dict[str, Any],
+                   rng: random.Random) -> Tuple[List[int], List[List[Dict[str, Any]]]]:
+    """按总规模为每个用例生成固定了规模变量的配置
+
+    Returns:
+        (每个用例分到的值, 每个用例的配置列表)，参数同 budget_sizes
+    """
+    sizes = budget_sizes(configs, count, budget, rng)
+    return sizes, [fix_variable(configs, budget['variable'], size) for size in sizes]
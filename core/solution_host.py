@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Python 解题代码的子进程入口
+功能：从标准输入读取测试数据作为 input_data，执行解题代码，结果直接写到标准输出。
+父进程把标准输出接到 .out 文件，解题代码 print 的内容不再先收集到内存中。
+
+用法: python solution_host.py <代码文件> [原始代码文件]
+"""
+
+import os
+import sys
+
+# 返回值按该长度（字符）分段写出，避免整体编码时再复制一份完整的字节
+WRITE_CHUNK = 1 << 20
+
+
+def has_function_definition(code: str) -> bool:
+    """与 SolutionExecutor 相同的判断：代码中是否定义了函数"""
+    return any(line.strip().startswith('def ') and not line.strip().startswith('def #')
+               for line in code.split('\n'))
+
+
+def read_code(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def run(code_path: str, original_path: str = None) -> int:
+    """执行代码文件，返回进程退出码
+
+    定义了函数的代码调用 main()；否则代码已由 SolutionExecutor.process_solution_code
+    把 print 转换为 return，包装为函数后调用。返回值不为 None 时写到标准输出。
+    转换后的代码出错时（如 print(x, end='') 转换后不是合法语句），与原来的 execute_solution_code
+    一样改为执行未转换的原始代码，print 的内容直接写到标准输出。
+
+    注意：转换后的代码以第一个执行到的 print 的内容作为整个答案返回（与原来的语义一致），
+    所以答案仍是子进程中的一个完整对象，只有原始代码的回退路径是逐个 print 写出的。
+    返回值分段编码写出，不会在子进程中再复制一份完整的字节；需要逐行输出大量数据的解答
+    应定义 main() 并直接 print。
+    """
+    sys.stdin.reconfigure(encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8', newline='\n')
+
+    code = read_code(code_path)
+    input_data = sys.stdin.read()
+    namespace = {'input_data': input_data, '__name__': '__solution__'}
+
+    if has_function_definition(code):
+        exec(compile(code, code_path, 'exec'), namespace)
+        if not callable(namespace.get('main')):
+            print("找不到main函数", file=sys.stderr)
+            return 1
+        result = namespace['main']()
+    else:
+        func_code = "def solve_function(input_data):\n" + '\n'.join('    ' + line for line in code.split('\n'))
+        stdout = sys.stdout
+        try:
+            # 转换后没有匹配到的 print 不写入结果，与原来在内存中执行时一致
+            with open(os.devnull, 'w', encoding='utf-8') as devnull:
+                sys.stdout = devnull
+                exec(compile(func_code, code_path, 'exec'), namespace)
+                result = namespace['solve_function'](input_data)
+        except Exception:
+            if original_path is None:
+                raise
+            sys.stdout = stdout
+            exec(compile(read_code(original_path), original_path, 'exec'),
+                 {'input_data': input_data, '__name__': '__solution__'})
+            sys.stdout.flush()
+            return 0
+        finally:
+            sys.stdout = stdout
+
+    if result is not None:
+        text = result if isinstance(result, str) else str(result)
+        for start in range(0, len(text), WRITE_CHUNK):
+            sys.stdout.write(text[start:start + WRITE_CHUNK])
+        sys.stdout.write('\n')
+    sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*sys.argv[1:3]))
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+解题代码的子进程运行
+功能：调用本机的 g++/clang、rustc、go、javac 等工具链编译解题代码，
+编译结果按 源码哈希 + 编译器 + 编译选项 缓存在磁盘上，所有测试用例和之后的会话都复用同一个可执行文件；
+Python 代码通过 solution_host 在子进程中运行。
+运行时从 .in 文件读取标准输入，标准输出分块写入 .out 文件，同时限制大小并计算哈希
+"""
+
+import os
+import sys
+import shutil
+import hashlib
+import tempfile
+import time
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+# 单个测试用例的最长运行时间（秒）
+RUN_TIMEOUT = 10
+# 编译的最长时间（秒）
+COMPILE_TIMEOUT = 120
+# 报错时最多显示的编译器或程序错误输出字符数
+MAX_ERROR_CHARS = 2000
+# 单个测试用例输出的大小上限（字节），超过时终止程序
+OUTPUT_LIMIT = 256 * 1024 * 1024
+# 从程序标准输出每次读取的字节数
+STREAM_CHUNK = 1 << 16
+
+# 各语言的源文件名、可选的编译器（按顺序查找）和默认编译选项
+# 命令中的 {source} 为源文件，{output} 为编译结果（可执行文件或 Java 的类目录）
+LANGUAGE_SPECS = {
+    "C++": {
+        'source': "solution.cpp",
+        'compilers': ["g++", "clang++"],
+        'flags': "-O2 -std=c++17",
+        'compile': ["{compiler}", "{flags}", "{source}", "-o", "{output}"],
+    },
+    "C": {
+        'source': "solution.c",
+        'compilers': ["gcc", "clang"],
+        'flags': "-O2 -std=c11",
+        'compile': ["{compiler}", "{flags}", "{source}", "-o", "{output}", "-lm"],
+    },
+    "Rust": {
+        'source': "solution.rs",
+        'compilers': ["rustc"],
+        'flags': "-O",
+        'compile': ["{compiler}", "{flags}", "{source}", "-o", "{output}"],
+    },
+    "Go": {
+        'source': "solution.go",
+        'compilers': ["go"],
+        'flags': "",
+        'compile': ["{compiler}", "build", "{flags}", "-o", "{output}", "{source}"],
+    },
+    "Java": {
+        'source': "Main.java",
+        'compilers': ["javac"],
+        'flags': "",
+        'compile': ["{compiler}", "{flags}", "-d", "{output}", "{source}"],
+        'run': ["java", "-cp", "{output}", "Main"],
+    },
+}
+
+COMPILED_LANGUAGES = list(LANGUAGE_SPECS)
+
+
+def default_cache_dir() -> Path:
+    """编译缓存目录：与配置目录同级的 cache/builds"""
+    if getattr(sys, 'frozen', False):
+        base_path = Path(os.path.dirname(sys.executable))
+    else:
+        base_path = Path(__file__).parent.parent
+    return base_path / 'cache' / 'builds'
+
+
+def find_compiler(language: str) -> Optional[str]:
+    """查找本机可用的编译器，找不到时返回None"""
+    for compiler in LANGUAGE_SPECS[language]['compilers']:
+        path = shutil.which(compiler)
+        if path:
+            return path
+    return None
+
+
+def available_languages() -> List[str]:
+    """本机装有工具链的编译型语言"""
+    return [language for language in COMPILED_LANGUAGES if find_compiler(language)]
+
+
+def python_host_command(code_path: str, original_path: Optional[str] = None) -> List[str]:
+    """在子进程中运行 Python 解题代码的命令；打包后由程序自身以 --solution-host 参数启动
+
+    original_path 为未经 print 转换的原始代码，转换后的代码出错时改为执行它
+    """
+    paths = [code_path] + ([original_path] if original_path else [])
+    if getattr(sys, 'frozen', False):
+        return [sys.executable, '--solution-host'] + paths
+    return [sys.executable, str(Path(__file__).with_name('solution_host.py'))] + paths
+
+
+class SolutionProcess:
+    """在子进程中运行的解题程序（编译好的可执行文件或 Python 代码）"""
+
+    def __init__(self, command: List[str], timeout: float = RUN_TIMEOUT, output_limit: int = OUTPUT_LIMIT,
+                 key: Optional[str] = None):
+        """
+        Args:
+            command: 运行命令
+            timeout: 单个测试用例的最长运行时间（秒）
+            output_limit: 单个测试用例输出的大小上限（字节）
+            key: 标识程序内容的哈希（即编译缓存键），用于输出缓存；None 时不使用输出缓存
+        """
+        self.command = command
+        self.timeout = timeout
+        self.output_limit = output_limit
+        self.key = key
+
+    def run(self, input_data: str) -> str:
+        """以字符串为标准输入运行，返回标准输出（用于测试运行和对拍）"""
+        completed = self._run(input=input_data.encode('utf-8'), stdout=subprocess.PIPE)
+        return completed.stdout.decode('utf-8', errors='replace')
+
+    def run_file(self, in_path: str, out_path: str) -> Dict[str, Any]:
+        """从 .in 文件读取标准输入，标准输出分块写入 .out 文件
+
+        输出不在内存中累积：每次读取一块就写入文件并更新哈希，超过大小上限或运行超时时终止程序。
+
+        Returns:
+            {'size': 输出字节数, 'sha256': 输出内容的哈希}
+        """
+        hasher = hashlib.sha256()
+        size = 0
+        with open(in_path, 'rb') as stdin, open(out_path, 'wb') as stdout, tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(self.command, stdin=stdin, stdout=subprocess.PIPE, stderr=stderr)
+            timed_out = threading.Event()
+
+            def kill_on_timeout():
+                timed_out.set()
+                process.kill()
+
+            timer = threading.Timer(self.timeout, kill_on_timeout)
+            timer.start()
+            try:
+                read = process.stdout.read
+                while True:
+                    chunk = read(STREAM_CHUNK)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > self.output_limit:
+                        process.kill()
+                        raise ValueError(f"输出超过 {self.output_limit // (1024 * 1024)} MB 的上限")
+                    stdout.write(chunk)
+                    hasher.update(chunk)
+                returncode = process.wait()
+            finally:
+                timer.cancel()
+                process.stdout.close()
+                process.wait()
+
+            if timed_out.is_set():
+                raise ValueError(f"运行超过 {self.timeout} 秒")
+            if returncode != 0:
+                stderr.seek(0)
+                message = stderr.read()[-MAX_ERROR_CHARS:].decode('utf-8', errors='replace')
+                raise ValueError(f"程序返回值为 {returncode}\n{message}".rstrip())
+        return {'size': size, 'sha256': hasher.hexdigest()}
+
+    def measure_file(self, in_path: str) -> Dict[str, Any]:
+        """从 .in 文件读取标准输入运行一次，丢弃输出，测量用时和内存
+
+        支持 os.wait4 的系统（Linux、macOS）上同时得到子进程的 CPU 时间和峰值内存，其他系统上为None。
+
+        Returns:
+            {'wall': 墙钟时间（秒）, 'cpu': 用户态+内核态 CPU 时间（秒）, 'rss': 峰值内存（字节）}
+        """
+        with open(in_path, 'rb') as stdin, tempfile.TemporaryFile() as stderr:
+            start = time.perf_counter()
+            process = subprocess.Popen(self.command, stdin=stdin, stdout=subprocess.DEVNULL, stderr=stderr)
+            timed_out = threading.Event()
+
+            def kill_on_timeout():
+                timed_out.set()
+                process.kill()
+
+            timer = threading.Timer(self.timeout, kill_on_timeout)
+            timer.start()
+            cpu = rss = None
+            try:
+                if hasattr(os, 'wait4'):
+                    _, status, usage = os.wait4(process.pid, 0)
+                    process.returncode = os.waitstatus_to_exitcode(status)
+                    cpu = usage.ru_utime + usage.ru_stime
+                    # Linux 上 ru_maxrss 的单位是 KB，macOS 上是字节
+                    rss = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+                else:
+                    process.wait()
+                wall = time.perf_counter() - start
+            finally:
+                timer.cancel()
+
+            if timed_out.is_set():
+                raise ValueError(f"运行超过 {self.timeout} 秒")
+            if process.returncode != 0:
+                stderr.seek(0)
+                message = stderr.read()[-MAX_ERROR_CHARS:].decode('utf-8', errors='replace')
+                raise ValueError(f"程序返回值为 {process.returncode}\n{message}".rstrip())
+        return {'wall': wall, 'cpu': cpu, 'rss': rss}
+
+    def run_cached(self, in_path: str, out_path: str, cache=None) -> Dict[str, Any]:
+        """与 run_file 相同，但先查输出缓存：相同程序、相同输入的结果直接复制，不再运行
+
+        Args:
+            in_path: 输入文件
+            out_path: 输出文件
+            cache: 输出缓存（core.output_cache.OutputCache），None 时直接运行
+
+        Returns:
+            {'size': 输出字节数, 'sha256': 输出内容的哈希, 'cached': 是否命中缓存}
+        """
+        if cache is None or self.key is None:
+            return dict(self.run_file(in_path, out_path), cached=False)
+
+        entry_key = cache.entry_key(self.key, in_path)
+        result = cache.fetch(entry_key, out_path)
+        if result is not None:
+            return dict(result, cached=True)
+        result = self.run_file(in_path, out_path)
+        cache.store(entry_key, out_path)
+        return dict(result, cached=False)
+
+    def run_files(self, pairs: List[Tuple[str, str]], workers: Optional[int] = None,
+                  cache=None) -> List[Dict[str, Any]]:
+        """并行运行多个测试用例
+
+        Args:
+            pairs: (输入文件, 输出文件) 列表
+            workers: 同时运行的进程数，默认为CPU核数
+            cache: 输出缓存，见 run_cached
+
+        Returns:
+            每个测试用例输出的大小、哈希和是否命中缓存，顺序与 pairs 相同
+        """
+        workers = max(1, workers or os.cpu_count() or 1)
+        results = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self.run_cached, in_path, out_path, cache) for in_path, out_path in pairs]
+            for (in_path, _), future in zip(pairs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    raise ValueError(f"运行 {os.path.basename(in_path)} 时出错：{str(e)}")
+        return results
+
+    def _run(self, **kwargs) -> subprocess.CompletedProcess:
+        try:
+            completed = subprocess.run(self.command, stderr=subprocess.PIPE, timeout=self.timeout, **kwargs)
+        except subprocess.TimeoutExpired:
+            raise ValueError(f"运行超过 {self.timeout} 秒")
+        if completed.returncode != 0:
+            stderr = completed.stderr.decode('utf-8', errors='replace')[-MAX_ERROR_CHARS:]
+            raise ValueError(f"程序返回值为 {completed.returncode}\n{stderr}".rstrip())
+        return completed
+
+
+class BuildCache:
+    """编译结果缓存，同样的源码和编译选项只编译一次"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: 缓存目录，默认为 default_cache_dir()
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+
+    def build_key(self, language: str, code: str, compiler: str, flags: str) -> str:
+        """缓存键：语言、编译器路径、编译选项和源码的哈希"""
+        hasher = hashlib.sha256()
+        for part in (language, compiler, flags, code):
+            hasher.update(part.encode('utf-8'))
+            hasher.update(b'\0')
+        return hasher.hexdigest()[:32]
+
+    def python_solution(self, code: str, timeout: float = RUN_TIMEOUT,
+                        original_code: Optional[str] = None) -> SolutionProcess:
+        """把已处理好的 Python 解题代码写入缓存目录，返回在子进程中运行它的程序
+
+        Args:
+            code: 经过 SolutionExecutor.process_solution_code 处理的代码
+            timeout: 运行每个测试用例的最长时间（秒）
+            original_code: 处理前的原始代码，与 code 不同时作为处理后代码出错时的备选
+        """
+        if original_code == code:
+            original_code = None
+        key = self.build_key("Python", code if original_code is None else code + "\0" + original_code,
+                             sys.executable, "")
+        build_dir = self.cache_dir / key
+        code_path = self._write_source(build_dir, 'solution.py', code)
+        original_path = None
+        if original_code is not None:
+            original_path = str(self._write_source(build_dir, 'original.py', original_code))
+        return SolutionProcess(python_host_command(str(code_path), original_path), timeout, key=key)
+
+    def _write_source(self, build_dir: Path, name: str, code: str) -> Path:
+        """把代码写入缓存目录（先写临时文件再替换），已存在时直接返回路径"""
+        path = build_dir / name
+        if not path.exists():
+            build_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = build_dir / f'{name}.{os.getpid()}.tmp'
+            temp_path.write_text(code, encoding='utf-8')
+            os.replace(temp_path, path)
+        return path
+
+    def compile(self, language: str, code: str, flags: Optional[str] = None,
+                timeout: float = RUN_TIMEOUT) -> SolutionProcess:
+        """编译解题代码，缓存中已有时直接复用
+
+        Args:
+            language: 语言，见 LANGUAGE_SPECS
+            code: 源码
+            flags: 编译选项，None 时使用该语言的默认选项
+            timeout: 运行每个测试用例的最长时间（秒）
+
+        Returns:
+            编译好的解题程序
+
+        Raises:
+            ValueError: 找不到编译器或编译失败时
+        """
+        if language not in LANGUAGE_SPECS:
+            raise ValueError(f"不支持的语言: {language}")
+        spec = LANGUAGE_SPECS[language]
+        compiler = find_compiler(language)
+        if compiler is None:
+            raise ValueError(f"未找到 {language} 编译器，请安装 {' 或 '.join(spec['compilers'])} 并加入 PATH")
+
+        flags = spec['flags'] if flags is None else flags
+        key = self.build_key(language, code, compiler, flags)
+        build_dir = self.cache_dir / key
+        output = build_dir / ('classes' if language == "Java" else 'solution.exe')
+        if not output.exists():
+            self._compile(spec, code, compiler, flags, build_dir, output.name)
+
+        command = [part.format(output=output) for part in spec.get('run', ["{output}"])]
+        return SolutionProcess(command, timeout, key=key)
+
+    def _compile(self, spec: Dict[str, Any], code: str, compiler: str, flags: str, build_dir: Path,
+                 output_name: str):
+        """在临时目录中编译，成功后整体移入缓存目录，避免留下编译了一半的文件"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        work_dir = Path(tempfile.mkdtemp(prefix='build-', dir=self.cache_dir))
+        try:
+            source = work_dir / spec['source']
+            source.write_text(code, encoding='utf-8')
+            output = work_dir / output_name
+            command = []
+            for part in spec['compile']:
+                if part == "{flags}":
+                    command.extend(flags.split())
+                else:
+                    command.append(part.format(compiler=compiler, source=source, output=output))
+
+            try:
+                completed = subprocess.run(command, cwd=work_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                           timeout=COMPILE_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                raise ValueError(f"编译超过 {COMPILE_TIMEOUT} 秒")
+            if completed.returncode != 0:
+                message = completed.stdout.decode('utf-8', errors='replace')[-MAX_ERROR_CHARS:]
+                raise ValueError(f"编译失败：\n{message}")
+
+            try:
+                os.replace(work_dir, build_dir)
+            except OSError:
+                # 其他进程已经编译好同样的代码
+                if not build_dir.exists():
+                    raise
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+结构化数据生成
+功能：线性时间生成树、图和排列，节点编号从1开始
+"""
+
+import random
+from math import isqrt
+from typing import List, Tuple
+
+# 结构化来源类型
+STRUCTURED_SOURCES = ["树", "图", "排列"]
+
+TREE_SHAPES = ["随机", "随机父节点", "链", "菊花", "毛毛虫"]
+TREE_FORMATS = ["边列表", "父节点数组"]
+GRAPH_TYPES = ["简单图", "连通图", "有向无环图"]
+
+
+def random_permutation(rng: random.Random, n: int) -> List[int]:
+    """生成 1..n 的随机排列"""
+    perm = list(range(1, n + 1))
+    rng.shuffle(perm)
+    return perm
+
+
+def prufer_tree_edges(rng: random.Random, n: int) -> List[Tuple[int, int]]:
+    """随机Prüfer序列解码为树，所有带标号的树等概率出现
+
+    使用线性解码：指针只向前移动，新产生的叶子若编号更小则立即使用。
+    """
+    if n <= 1:
+        return []
+    code = rng.choices(range(1, n + 1), k=n - 2)
+
+    degree = [1] * (n + 1)
+    for node in code:
+        degree[node] += 1
+
+    pointer = 1
+    while degree[pointer] != 1:
+        pointer += 1
+    leaf = pointer
+
+    edges = []
+    for node in code:
+        edges.append((leaf, node))
+        degree[node] -= 1
+        if degree[node] == 1 and node < pointer:
+            leaf = node
+        else:
+            pointer += 1
+            while degree[pointer] != 1:
+                pointer += 1
+            leaf = pointer
+    edges.append((leaf, n))
+    return edges
+
+
+def shaped_tree_edges(rng: random.Random, n: int, shape: str) -> List[Tuple[int, int]]:
+    """按指定形态生成树的边（编号有规律，需要时再打乱）"""
+    if shape == "随机":
+        return prufer_tree_edges(rng, n)
+    if shape == "随机父节点":
+        return [(rng.randint(1, child - 1), child) for child in range(2, n + 1)]
+    if shape == "链":
+        return [(child - 1, child) for child in range(2, n + 1)]
+    if shape == "菊花":
+        return [(1, child) for child in range(2, n + 1)]
+    if shape == "毛毛虫":
+        # 一半节点组成主干，其余节点挂在随机的主干节点上
+        spine = max(1, (n + 1) // 2)
+        edges = [(child - 1, child) for child in range(2, spine + 1)]
+        edges.extend((rng.randint(1, spine), child) for child in range(spine + 1, n + 1))
+        return edges
+    raise ValueError(f"未知的树形态: {shape}")
+
+
+def relabel_edges(rng: random.Random, n: int, edges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """随机打乱节点编号、边的顺序和每条边两端的顺序"""
+    labels = [0] + random_permutation(rng, n)
+    flips = rng.choices((False, True), k=len(edges))
+    relabeled = [(labels[v], labels[u]) if flip else (labels[u], labels[v])
+                 for (u, v), flip in zip(edges, flips)]
+    rng.shuffle(relabeled)
+    return relabeled
+
+
+def parent_array(n: int, edges: List[Tuple[int, int]], root: int = 1) -> List[int]:
+    """以 root 为根，返回节点 2..n 的父节点（root 为1时即常见的 p_2..p_n 格式）"""
+    adjacency = [[] for _ in range(n + 1)]
+    for u, v in edges:
+        adjacency[u].append(v)
+        adjacency[v].append(u)
+
+    parent = [0] * (n + 1)
+    parent[root] = root
+    queue = [root]
+    for node in queue:
+        for neighbor in adjacency[node]:
+            if parent[neighbor] == 0:
+                parent[neighbor] = node
+                queue.append(neighbor)
+    return [parent[node] for node in range(1, n + 1) if node != root]
+
+
+def pair_from_index(index: int) -> Tuple[int, int]:
+    """把 0 .. C(n,2)-1 中的编号解码为节点对 (u, v)，u < v，编号从1开始"""
+    v = (1 + isqrt(1 + 8 * index)) // 2
+    u = index - v * (v - 1) // 2
+    return u + 1, v + 1
+
+
+def pair_index(u: int, v: int) -> int:
+    """pair_from_index 的逆运算"""
+    if u > v:
+        u, v = v, u
+    return (v - 1) * (v - 2) // 2 + (u - 1)
+
+
+def random_graph_edges(rng: random.Random, n: int, m: int, graph_type: str = "简单图") -> List[Tuple[int, int]]:
+    """生成 n 个节点、m 条边的无自环无重边的图
+
+    在全部 C(n,2) 个节点对的编号中不放回地抽取 m 个再解码，
+    不需要对已生成的边做集合判重，耗时 O(n + m)。
+    """
+    max_edges = n * (n - 1) // 2
+    if m > max_edges:
+        raise ValueError(f"{n} 个节点的简单图最多有 {max_edges} 条边，无法生成 {m} 条")
+    if m < 0:
+        raise ValueError(f"边数不能为负数: {m}")
+
+    if graph_type == "连通图":
+        if m < n - 1:
+            raise ValueError(f"{n} 个节点的连通图至少需要 {n - 1} 条边，当前只有 {m} 条")
+        tree = prufer_tree_edges(rng, n)
+        tree_indices = {pair_index(u, v) for u, v in tree}
+        # 多抽 n-1 个编号，去掉与树边重合的部分后仍足够
+        extra_count = m - len(tree)
+        sampled = rng.sample(range(max_edges), min(max_edges, extra_count + len(tree)))
+        extra = [pair_from_index(index) for index in sampled if index not in tree_indices][:extra_count]
+        edges = tree + extra
+    else:
+        edges = [pair_from_index(index) for index in rng.sample(range(max_edges), m)]
+
+    if graph_type == "有向无环图":
+        # 按随机拓扑序给每条边定向
+        order = [0] + random_permutation(rng, n)
+        edges = [(u, v) if order[u] < order[v] else (v, u) for u, v in edges]
+        rng.shuffle(edges)
+        return edges
+
+    return relabel_edges(rng, n, edges)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+时间限制标定
+功能：把标程在每个测试用例上各运行多次，记录墙钟时间、CPU 时间和峰值内存，
+统计最大值和分位数并给出建议的时间限制，结果可以导出为 JSON/CSV
+"""
+
+import os
+import csv
+import json
+import math
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Callable
+
+# 每个测试用例默认运行的次数
+DEFAULT_REPEATS = 5
+# 建议时间限制 = 最慢用例的用时 × 该倍数
+SAFETY_FACTOR = 2.0
+# 建议时间限制的最小值和取整粒度（秒）
+MIN_TIME_LIMIT = 0.5
+TIME_LIMIT_STEP = 0.1
+# 报告中统计的分位数
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(values: List[float], p: float) -> float:
+    """线性插值的分位数，p 取 0-100"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * p / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def suggest_time_limit(case_time: float, factor: float = SAFETY_FACTOR) -> float:
+    """由最慢用例的用时给出建议的时间限制，按 TIME_LIMIT_STEP 向上取整"""
+    steps = math.ceil(round(case_time * factor / TIME_LIMIT_STEP, 6))
+    return max(MIN_TIME_LIMIT, round(steps * TIME_LIMIT_STEP, 3))
+
+
+def calibrate(solution, in_paths: List[str], repeats: int = DEFAULT_REPEATS, workers: int = 1,
+              progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+    """在每个输入上各运行 repeats 次标程并统计
+
+    每次运行都是单独的子进程。并行运行会互相抢占CPU和内存带宽，默认逐个运行以保证测量准确。
+    单个用例的用时取多次运行的中位数以排除偶然的抖动；有 CPU 时间时按 CPU 时间给出建议，否则按墙钟时间。
+
+    Args:
+        solution: 标程（core.solution_runner.SolutionProcess）
+        in_paths: 输入文件列表
+        repeats: 每个用例运行的次数
+        workers: 同时运行的进程数
+        progress_callback: 进度回调，参数为 (已完成次数, 总次数)
+
+    Returns:
+        标定报告，包含每个用例的测量值、汇总统计和建议的时间限制
+    """
+    if repeats < 1:
+        raise ValueError("运行次数至少为1")
+    total = len(in_paths) * repeats
+    done = 0
+    measurements = [[] for _ in in_paths]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [(index, pool.submit(solution.measure_file, in_path))
+                   for _ in range(repeats) for index, in_path in enumerate(in_paths)]
+        for index, future in futures:
+            try:
+                measurements[index].append(future.result())
+            except Exception as e:
+                raise ValueError(f"运行 {os.path.basename(in_paths[index])} 时出错：{str(e)}")
+            done += 1
+            if progress_callback:
+                progress_callback(done, total)
+
+    cases = []
+    for in_path, runs in zip(in_paths, measurements):
+        walls = [run['wall'] for run in runs]
+        cpus = [run['cpu'] for run in runs if run['cpu'] is not None]
+        rsses = [run['rss'] for run in runs if run['rss'] is not None]
+        cases.append({
+            'name': os.path.basename(in_path),
+            'wall': walls,
+            'cpu': cpus,
+            'wall_median': statistics.median(walls),
+            'wall_max': max(walls),
+            'cpu_median': statistics.median(cpus) if cpus else None,
+            'rss_max': max(rsses) if rsses else None,
+        })
+    return build_report(cases, repeats, workers)
+
+
+def build_report(cases: List[Dict[str, Any]], repeats: int, workers: int) -> Dict[str, Any]:
+    """汇总每个用例的测量值，给出最大值、分位数和建议的时间限制"""
+    wall_medians = [case['wall_median'] for case in cases]
+    cpu_medians = [case['cpu_median'] for case in cases if case['cpu_median'] is not None]
+    rsses = [case['rss_max'] for case in cases if case['rss_max'] is not None]
+    use_cpu = bool(cases) and len(cpu_medians) == len(cases)
+    slowest = max(cpu_medians if use_cpu else wall_medians, default=0.0)
+
+    summary = {
+        'wall_max': max((case['wall_max'] for case in cases), default=0.0),
+        'cpu_max': max((max(case['cpu']) for case in cases if case['cpu']), default=None),
+        'rss_max': max(rsses) if rsses else None,
+    }
+    for p in PERCENTILES:
+        summary[f'wall_p{p}'] = percentile(wall_medians, p)
+
+    slowest_case = None
+    if cases:
+        key = 'cpu_median' if use_cpu else 'wall_median'
+        slowest_case = max(cases, key=lambda case: case[key])['name']
+
+    return {
+        'repeats': repeats,
+        'workers': workers,
+        'basis': 'cpu' if use_cpu else 'wall',
+        'cases': cases,
+        'summary': summary,
+        'slowest_case': slowest_case,
+        'suggested_time_limit': suggest_time_limit(slowest),
+    }
+
+
+def save_report(report: Dict[str, Any], output_dir: str, file_prefix: str = "timing") -> List[str]:
+    """把标定报告保存为 JSON 和 CSV
+
+    Args:
+        report: calibrate 返回的报告
+        output_dir: 输出目录，一般为测试数据所在目录
+        file_prefix: 文件名前缀
+
+    Returns:
+        保存的文件路径列表
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    json_path = output_path / f"{file_prefix}.json"
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    csv_path = output_path / f"{file_prefix}.csv"
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['case', 'wall_median_ms', 'wall_max_ms', 'cpu_median_ms', 'rss_max_kb'])
+        for case in report['cases']:
+            writer.writerow([
+                case['name'],
+                f"{case['wall_median'] * 1000:.1f}",
+                f"{case['wall_max'] * 1000:.1f}",
+                '' if case['cpu_median'] is None else f"{case['cpu_median'] * 1000:.1f}",
+                '' if case['rss_max'] is None else case['rss_max'] // 1024,
+            ])
+    return [str(json_path), str(csv_path)]
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """报告的文字摘要，用于界面显示"""
+    summary = report['summary']
+    lines = [f"每个用例运行 {report['repeats']} 次，共 {len(report['cases'])} 个用例",
+             f"最慢用例: {report['slowest_case']}",
+             f"墙钟时间最大值: {summary['wall_max'] * 1000:.0f} ms",
+             "墙钟时间分位数（各用例中位数）: " +
+             "，".join(f"P{p} {summary[f'wall_p{p}'] * 1000:.0f} ms" for p in PERCENTILES)]
+    if summary['cpu_max'] is not None:
+        lines.append(f"CPU 时间最大值: {summary['cpu_max'] * 1000:.0f} ms")
+    if summary['rss_max'] is not None:
+        lines.append(f"峰值内存: {summary['rss_max'] / 1024 / 1024:.1f} MB")
+    basis = "CPU 时间" if report['basis'] == 'cpu' else "墙钟时间"
+    lines.append(f"建议时间限制: {report['suggested_time_limit']:g} 秒（按{basis}的 {SAFETY_FACTOR:g} 倍）")
+    return "\n".join(lines)
@@ -1,15 +1,13 @@
-import requests
 import threading
 import json
 import tkinter as tk
 from tkinter import messagebox
-import webbrowser
 import os
 import sys
 from datetime import datetime
 
 class UpdateChecker:
-    def __init__(self, local_update_file=None, config_file=None):
+    def __init__(self, local_update_file=None, config_file=None, state_file=None):
         # 获取程序运行目录（兼容PyInstaller）
         if getattr(sys, 'frozen', False):
             # PyInstaller打包后的路径 - 使用_MEIPASS获取资源文件路径
@@ -23,9 +21,17 @@ class UpdateChecker:
             local_update_file = os.path.join(self.base_path, "config", "update.json")
         if config_file is None:
             config_file = os.path.join(self.base_path, "config", "update_config.json")
+        if state_file is None:
+            # 检查状态需要跨次启动保留，打包后不能写在 _MEIPASS 临时目录中，与用户配置一样放在程序所在目录
+            if getattr(sys, 'frozen', False):
+                state_dir = os.path.join(os.path.dirname(sys.executable), "config")
+            else:
+                state_dir = os.path.join(self.base_path, "config")
+            state_file = os.path.join(state_dir, "update_state.json")
             
         self.local_update_file = local_update_file
         self.config_file = config_file
+        self.state_file = state_file
         self.config = self.load_config()
 
     def load_config(self):
@@ -59,41 +65,62 @@ class UpdateChecker:
             print(f"加载配置失败，使用默认配置: {e}")
             return default_config
 
-    def check_for_updates(self):
-        """检查是否有更新"""
-        try:
-            # 检查配置是否有效
-            if not self.config.get('github_raw_url') or 'your-username' in self.config['github_raw_url']:
-                print("GitHub配置未设置，跳过更新检查")
-                return False, None
-                
-            response = requests.get(self.config['github_raw_url'], timeout=self.config['timeout'])
+    def check_for_updates(self, force=False):
+        """检查是否有更新
 
-            if response.status_code == 200:
-                remote_data = response.json()
+        在 check_interval_hours 间隔内直接使用磁盘上缓存的结果，不访问网络；
+        超过间隔后发送带 ETag/If-Modified-Since 的条件请求，远程未变化时服务器返回304。
 
-                # 读取本地版本信息
-                if os.path.exists(self.local_update_file):
-                    with open(self.local_update_file, 'r', encoding='utf-8') as f:
-                        local_data = json.load(f)
+        Args:
+            force: 是否忽略检查间隔，立即向服务器确认
+        """
+        # 检查配置是否有效
+        if not self.config.get('github_raw_url') or 'your-username' in self.config['github_raw_url']:
+            print("GitHub配置未设置，跳过更新检查")
+            return False, None
 
-                    # 比较版本号
-                    if self.compare_versions(remote_data.get('level', '1.0.0'), local_data.get('level', '1.0.0')):
-                        return True, remote_data
+        state = self.load_state()
 
-                    # 比较更新时间
-                    if self.compare_update_time(remote_data.get('update_time', ''), local_data.get('update_time', '')):
-                        return True, remote_data
-                else:
-                    # 本地文件不存在，创建默认文件
-                    self.create_default_local_file()
-                    return True, remote_data  # 首次运行，提示有更新
+        # 检查间隔内，直接使用缓存的远程数据
+        if not force and state.get('remote_data') and self.is_check_fresh(state):
+            return self.evaluate_remote_data(state['remote_data'])
 
-                return False, None
+        # requests导入较慢，只在真正发起检查时加载，避免拖慢启动
+        try:
+            import requests
+        except ImportError:
+            print("未安装requests库，跳过更新检查")
+            return False, None
+
+        try:
+            headers = {}
+            # 只有缓存了远程数据时才发送条件请求，否则304将无数据可用
+            if state.get('remote_data'):
+                if state.get('etag'):
+                    headers['If-None-Match'] = state['etag']
+                if state.get('last_modified'):
+                    headers['If-Modified-Since'] = state['last_modified']
+
+            response = requests.get(self.config['github_raw_url'], headers=headers,
+                                    timeout=self.config['timeout'])
+
+            if response.status_code == 304:
+                # 远程文件未变化，沿用缓存结果
+                remote_data = state['remote_data']
+            elif response.status_code == 200:
+                remote_data = response.json()
+                state['remote_data'] = remote_data
+                state['etag'] = response.headers.get('ETag')
+                state['last_modified'] = response.headers.get('Last-Modified')
             else:
                 print(f"获取远程更新信息失败，状态码: {response.status_code}")
                 return False, None
-                
+
+            state['last_check'] = datetime.now().timestamp()
+            self.save_state(state)
+
+            return self.evaluate_remote_data(remote_data)
+
         except requests.exceptions.Timeout:
             print("检查更新超时")
             return False, None
@@ -107,6 +134,84 @@ class UpdateChecker:
             print(f"检查更新失败: {e}")
             return False, None
 
+    def evaluate_remote_data(self, remote_data):
+        """将远程更新信息与本地版本比较
+
+        Returns:
+            (是否有更新, 远程更新数据)
+        """
+        # 读取本地版本信息
+        if os.path.exists(self.local_update_file):
+            try:
+                with open(self.local_update_file, 'r', encoding='utf-8') as f:
+                    local_data = json.load(f)
+            except Exception as e:
+                print(f"读取本地更新文件失败: {e}")
+                return False, None
+
+            # 比较版本号
+            if self.compare_versions(remote_data.get('level', '1.0.0'), local_data.get('level', '1.0.0')):
+                return True, remote_data
+
+            # 比较更新时间
+            if self.compare_update_time(remote_data.get('update_time', ''), local_data.get('update_time', '')):
+                return True, remote_data
+        else:
+            # 本地文件不存在，创建默认文件
+            self.create_default_local_file()
+            return True, remote_data  # 首次运行，提示有更新
+
+        return False, None
+
+    def get_check_interval_seconds(self):
+        """获取检查间隔（秒），兼容旧配置中的 update_check_interval（秒）"""
+        try:
+            if 'update_check_interval' in self.config:
+                return float(self.config['update_check_interval'])
+            return float(self.config.get('check_interval_hours', 24)) * 3600
+        except (TypeError, ValueError):
+            return 24 * 3600
+
+    def is_check_fresh(self, state=None):
+        """上次检查是否仍在检查间隔内"""
+        if state is None:
+            state = self.load_state()
+        last_check = state.get('last_check')
+        if not last_check:
+            return False
+        elapsed = datetime.now().timestamp() - last_check
+        return 0 <= elapsed < self.get_check_interval_seconds()
+
+    def get_cached_result(self):
+        """不访问网络，根据缓存的远程数据返回检查结果；没有缓存时返回None"""
+        state = self.load_state()
+        if not state.get('remote_data'):
+            return None
+        return self.evaluate_remote_data(state['remote_data'])
+
+    def load_state(self):
+        """加载检查状态（上次检查时间、ETag、Last-Modified和缓存的远程数据）"""
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if isinstance(state, dict):
+                    return state
+        except Exception as e:
+            print(f"加载更新检查状态失败: {e}")
+        return {}
+
+    def save_state(self, state):
+        """保存检查状态，先写临时文件再替换，避免中途退出留下损坏的文件"""
+        try:
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+            temp_file = self.state_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=4, ensure_ascii=False)
+            os.replace(temp_file, self.state_file)
+        except Exception as e:
+            print(f"保存更新检查状态失败: {e}")
+
     def create_default_local_file(self):
         """创建默认的本地更新文件"""
         try:
@@ -171,6 +276,7 @@ class UpdateChecker:
 
             if result:
                 # 打开更新链接
+                import webbrowser
                 webbrowser.open(self.config['github_page_url'])
 
                 # 更新本地文件
@@ -222,21 +328,44 @@ class UpdateChecker:
         thread = threading.Thread(target=check_thread, daemon=True)
         thread.start()
 
-    def manual_check_update(self):
-        """手动检查更新"""
-        try:
-            result = self.check_for_updates()
+    def manual_check_update(self, root=None):
+        """手动检查更新
+
+        检查在后台线程中进行（检查间隔内直接使用缓存结果，超过间隔时向服务器确认），
+        结果通过 root.after 回到界面线程显示，检查期间窗口不会卡住。
+
+        Args:
+            root: 界面的根窗口，不提供时使用 tkinter 的默认根窗口
+        """
+        root = root or tk._default_root
+
+        def show_result(result, error):
+            if error is not None:
+                messagebox.showerror("检查更新", f"检查更新时发生错误: {error}")
+                return
             if result is None:
                 messagebox.showwarning("检查更新", "更新检查失败，请检查网络连接或配置")
                 return
-                
+
             has_update, update_data = result
             if has_update and update_data:
                 self.show_update_dialog(update_data)
             else:
                 messagebox.showinfo("检查更新", "当前已是最新版本！")
-        except Exception as e:
-            messagebox.showerror("检查更新", f"检查更新时发生错误: {e}")
+
+        def check_thread():
+            result, error = None, None
+            try:
+                result = self.check_for_updates()
+            except Exception as e:
+                error = e
+            try:
+                root.after(0, show_result, result, error)
+            except Exception as e:
+                print(f"显示更新检查结果失败: {e}")
+
+        thread = threading.Thread(target=check_thread, daemon=True)
+        thread.start()
 
 
 # 使用示例
@@ -2,6 +2,17 @@ import tkinter as tk
 import re
 import json
 import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _load_syntax_config_cached(config_path):
+    """读取语法高亮配置，同一进程内只解析一次"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}  # 默认配置, 不高亮
 
 
 class SyntaxHighlighter:
@@ -22,11 +33,7 @@ class SyntaxHighlighter:
     def load_syntax_config(self):
         """加载语法高亮配置"""
         config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "syntax_highlight.json")
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {}  # 默认配置, 不高亮
+        return _load_syntax_config_cached(config_path)
     
     def setup_tags(self):
         """设置文本标签样式"""
@@ -15,6 +15,9 @@ from .func import deBug
 
 class AutoCompletion:
     """自动补全类"""
+
+    # 类型方法表在首次补全时才通过 dir() 构建，并在所有编辑器实例间共享
+    _methods_cache = {}
     
     def __init__(self, text_widget, language="python"):
         """
@@ -224,6 +227,17 @@ class AutoCompletion:
 
     def get_methods_for_type(self, obj_type):
         """为指定类型获取方法建议"""
+        cached = AutoCompletion._methods_cache.get(obj_type)
+        if cached is not None:
+            return cached
+
+        methods = self._build_methods_for_type(obj_type)
+        if methods:
+            AutoCompletion._methods_cache[obj_type] = methods
+        return methods
+
+    def _build_methods_for_type(self, obj_type):
+        """通过 dir() 构建指定类型的方法表"""
         methods = []
         
         try:
@@ -8,17 +8,12 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional, Callable
-from .SyntaxHighlighter import SyntaxHighlighter
-from .auto_completion import AutoCompletion
 import re
 
-# 添加DeepSeek相关导入
+# 添加DeepSeek相关导入（DeepSeek、语法高亮和自动补全均在首次使用时才导入）
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from deepseek_api.deepseek_dialog import DeepSeekDialog, ApiKeyDialog
-from deepseek_api.api_key_manager import ApiKeyManager
-from deepseek_api.prompt_template import generate_test_data_prompt
 
 from .func.deBug import debug
 from .func.deepseek_ui import DeepSeekUI
@@ -104,6 +99,7 @@ class CodeEditor:
 
         # 初始化语法高亮器
         if not self.highlighter:
+            from .SyntaxHighlighter import SyntaxHighlighter
             self.highlighter = SyntaxHighlighter(self.code_text, self.language)
 
         # 初始化代码内容
@@ -149,6 +145,7 @@ class CodeEditor:
 
         # 创建语法高亮器
         try:
+            from .SyntaxHighlighter import SyntaxHighlighter
             self.highlighter = SyntaxHighlighter(self.code_text, self.language)
             debug(f"语法高亮器创建成功，语言: {self.language}", level=2)
         except Exception as e:
@@ -157,6 +154,7 @@ class CodeEditor:
         
         # 初始化自动补全功能
         try:
+            from .auto_completion import AutoCompletion
             self.auto_completion = AutoCompletion(self.code_text)
             debug("自动补全功能初始化成功", level=2)
             # 关键：让事件处理器能检测到自动补全状态
@@ -386,6 +384,9 @@ class CodeEditor:
 
     def get_deepseek_api_key(self) -> str:
         """获取DeepSeek API密钥"""
+        from deepseek_api.api_key_manager import ApiKeyManager
+        from deepseek_api.deepseek_dialog import ApiKeyDialog
+
         # 使用API密钥管理器
         api_key = ApiKeyManager.get_api_key()
         if api_key:
@@ -7,10 +7,10 @@ DeepSeek UI模块
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from deepseek_api.deepseek_dialog import DeepSeekDialog, ApiKeyDialog
-from deepseek_api.api_key_manager import ApiKeyManager
 from .deBug import debug
 
+# DeepSeek对话框依赖requests和keyring，导入较慢，只在首次使用时加载
+
 
 class DeepSeekUI:
     """DeepSeek UI类"""
@@ -32,6 +32,8 @@ class DeepSeekUI:
     def ask_deepseek_with_editor(self, code_editor, example_data: str):
         """使用代码编辑器的DeepSeek功能"""
         try:
+            from deepseek_api.deepseek_dialog import DeepSeekDialog
+
             current_code = code_editor.get_code()
 
             # 获取API密钥
@@ -63,6 +65,8 @@ class DeepSeekUI:
         """调用DeepSeek生成代码"""
         debug("ask_deepseek() 被调用")
         try:
+            from deepseek_api.deepseek_dialog import DeepSeekDialog
+
             # 获取API密钥
             api_key = self.get_deepseek_api_key()
             if not api_key:
@@ -92,6 +96,9 @@ class DeepSeekUI:
     
     def get_deepseek_api_key(self) -> str:
         """获取DeepSeek API密钥"""
+        from deepseek_api.api_key_manager import ApiKeyManager
+        from deepseek_api.deepseek_dialog import ApiKeyDialog
+
         # 使用新的API密钥管理器
         api_key = ApiKeyManager.get_api_key()
         if api_key:
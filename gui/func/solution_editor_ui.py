@@ -5,10 +5,35 @@
 负责处理解题代码编辑器窗口的创建和管理
 """
 
+import threading
 import tkinter as tk
 from tkinter import ttk
+from tkinter import messagebox, simpledialog
 from typing import List
 from .test_runner_dialog import TestRunnerDialog
+from core.solution_runner import COMPILED_LANGUAGES, LANGUAGE_SPECS
+from core.time_calibration import DEFAULT_REPEATS, format_report
+
+# 测时进度的刷新间隔（毫秒）
+CALIBRATION_POLL_INTERVAL = 200
+
+# 编译型语言的模板代码：从标准输入读取数据，结果输出到标准输出
+COMPILED_TEMPLATES = {
+    "C++": "#include <bits/stdc++.h>\nusing namespace std;\n\nint main() {\n"
+           "    ios::sync_with_stdio(false);\n    cin.tie(nullptr);\n    // 从标准输入读取数据，结果输出到标准输出\n\n"
+           "    return 0;\n}\n",
+    "C": "#include <stdio.h>\n\nint main(void) {\n    // 从标准输入读取数据，结果输出到标准输出\n\n    return 0;\n}\n",
+    "Rust": "use std::io::{self, Read, Write};\n\nfn main() {\n    let mut input = String::new();\n"
+            "    io::stdin().read_to_string(&mut input).unwrap();\n    let mut out = io::stdout().lock();\n\n}\n",
+    "Go": "package main\n\nimport (\n\t\"bufio\"\n\t\"fmt\"\n\t\"os\"\n)\n\nfunc main() {\n"
+          "\treader := bufio.NewReader(os.Stdin)\n\twriter := bufio.NewWriter(os.Stdout)\n\tdefer writer.Flush()\n"
+          "\t_ = reader\n\tfmt.Fprintln(writer)\n}\n",
+    "Java": "import java.io.*;\nimport java.util.*;\n\npublic class Main {\n"
+            "    public static void main(String[] args) throws IOException {\n"
+            "        BufferedReader reader = new BufferedReader(new InputStreamReader(System.in));\n"
+            "        PrintWriter out = new PrintWriter(new BufferedWriter(new OutputStreamWriter(System.out)));\n\n"
+            "        out.flush();\n    }\n}\n",
+}
 
 
 class SolutionEditorUI:
@@ -33,10 +58,18 @@ class SolutionEditorUI:
         self.current_test_index = 0
         self.example_text = None
         self.next_test_btn = None
+        
+        # 解题代码的语言和编译选项
+        self.language_var = None
+        self.flags_var = None
     
     def show_solution_editor(self, test_data: List[str], output_dir: str, input_files: List[str], 
-                           delete_temp_files_var):
-        """显示解题代码编辑器"""
+                           delete_temp_files_var, input_pack=None):
+        """显示解题代码编辑器
+        
+        提供 input_pack（core.input_pack.InputPack）时为已有数据包生成 .out 文件，
+        test_data 只是其中前几组的示例
+        """
         # 保存测试数据
         self.test_data = test_data
         self.current_test_index = 0
@@ -101,15 +134,35 @@ def main():
         # 创建嵌入式编辑器（不是弹窗）
         code_editor.create_embedded_editor(code_frame)
 
+        # 语言和编译选项（编译型语言使用本机工具链，编译结果会被缓存）
+        language_frame = ttk.Frame(main_frame)
+        language_frame.pack(fill=tk.X)
+        ttk.Label(language_frame, text="语言:").pack(side=tk.LEFT)
+        self.language_var = tk.StringVar(value="Python")
+        language_combo = ttk.Combobox(language_frame, textvariable=self.language_var,
+                                      values=["Python"] + COMPILED_LANGUAGES, state="readonly", width=8)
+        language_combo.pack(side=tk.LEFT, padx=(5, 15))
+        ttk.Label(language_frame, text="编译选项:").pack(side=tk.LEFT)
+        self.flags_var = tk.StringVar(value="")
+        flags_entry = ttk.Entry(language_frame, textvariable=self.flags_var, width=30, state=tk.DISABLED)
+        flags_entry.pack(side=tk.LEFT, padx=(5, 0))
+        language_combo.bind('<<ComboboxSelected>>',
+                            lambda event: self._on_language_changed(code_editor, template_code, flags_entry))
+
         # 按钮框架
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=(10, 0))
 
         # 执行并保存按钮
-        execute_btn = ttk.Button(button_frame, text="执行并保存结果",
-                                 command=lambda: self.solution_executor.execute_and_save_solution(
-                                     code_editor.get_code(), test_data, output_dir, editor_window,
-                                     delete_temp_files_var.get()))
+        if input_pack is None:
+            execute_command = lambda: self.solution_executor.execute_and_save_solution(
+                code_editor.get_code(), test_data, output_dir, editor_window,
+                delete_temp_files_var.get(), self.language_var.get(), self.flags_var.get())
+        else:
+            execute_command = lambda: self.solution_executor.execute_and_save_pack(
+                code_editor.get_code(), input_pack, output_dir, editor_window,
+                delete_temp_files_var.get(), self.language_var.get(), self.flags_var.get())
+        execute_btn = ttk.Button(button_frame, text="执行并保存结果", command=execute_command)
         execute_btn.pack(side=tk.LEFT, padx=(0, 10))
 
         # 问问DeepSeek按钮
@@ -126,6 +179,12 @@ def main():
                                   command=lambda: self._run_test_with_current_data(code_editor))
         test_run_btn.pack(side=tk.LEFT, padx=(0, 10))
         
+        # 测时按钮：作为标程运行多次，给出建议的时间限制（有数据包时在包中全部 .in 文件上运行）
+        calibrate_btn = ttk.Button(button_frame, text="测时")
+        calibrate_btn.config(command=lambda: self._calibrate_time_limit(code_editor, test_data, output_dir,
+                                                                        editor_window, calibrate_btn, input_pack))
+        calibrate_btn.pack(side=tk.LEFT, padx=(0, 10))
+
         # 下一个测试数据按钮
         self.next_test_btn = ttk.Button(button_frame, text=self._get_next_button_text(),
                                        command=lambda: self._switch_to_next_test_data(example_frame))
@@ -204,8 +263,78 @@ def main():
         if self.next_test_btn:
             self.next_test_btn.config(text=self._get_next_button_text())
     
+    def _on_language_changed(self, code_editor, python_template: str, flags_entry):
+        """切换语言：代码未修改过时换成对应语言的模板，并填入默认编译选项"""
+        language = self.language_var.get()
+        templates = [python_template.strip()] + [template.strip() for template in COMPILED_TEMPLATES.values()]
+        if code_editor.get_code().strip() in templates + [""]:
+            code_editor.set_code(COMPILED_TEMPLATES.get(language, python_template))
+
+        if language == "Python":
+            self.flags_var.set("")
+            flags_entry.config(state=tk.DISABLED)
+        else:
+            self.flags_var.set(LANGUAGE_SPECS[language]['flags'])
+            flags_entry.config(state=tk.NORMAL)
+    
+    def _calibrate_time_limit(self, code_editor, test_data, output_dir, editor_window, calibrate_btn,
+                              input_pack=None):
+        """在后台线程中测时，完成后显示报告"""
+        repeats = simpledialog.askinteger("测时", "每组数据运行的次数：", parent=editor_window,
+                                          initialvalue=DEFAULT_REPEATS, minvalue=1, maxvalue=100)
+        if not repeats:
+            return
+
+        code = code_editor.get_code()
+        language = self.language_var.get()
+        flags = self.flags_var.get()
+        case_count = len(input_pack) if input_pack is not None else len(test_data)
+        state = {'progress': (0, case_count * repeats), 'result': None, 'error': None}
+
+        def worker():
+            try:
+                state['result'] = self.solution_executor.calibrate_time_limit(
+                    code, test_data, output_dir, language, flags, repeats,
+                    lambda done, total: state.update(progress=(done, total)), input_pack)
+            except Exception as e:
+                state['error'] = str(e)
+
+        def poll():
+            if not editor_window.winfo_exists():
+                return
+            if state['result'] is None and state['error'] is None:
+                done, total = state['progress']
+                calibrate_btn.config(text=f"测时中 {done}/{total}")
+                editor_window.after(CALIBRATION_POLL_INTERVAL, poll)
+                return
+            calibrate_btn.config(text="测时", state=tk.NORMAL)
+            if state['error']:
+                messagebox.showerror("测时出错", state['error'], parent=editor_window)
+                return
+            report = state['result']
+            messagebox.showinfo("测时结果", format_report(report) + "\n\n报告已保存：\n" +
+                                "\n".join(report['saved_files']), parent=editor_window)
+
+        calibrate_btn.config(state=tk.DISABLED)
+        threading.Thread(target=worker, daemon=True).start()
+        editor_window.after(CALIBRATION_POLL_INTERVAL, poll)
+
     def _run_test_with_current_data(self, code_editor):
         """使用当前测试数据运行测试"""
+        language = self.language_var.get() if self.language_var else "Python"
+        if language != "Python":
+            # 编译型语言直接用当前测试数据运行
+            test_input = self._get_current_test_data()
+            try:
+                solution = self.solution_executor.compile_solution(code_editor.get_code(), language,
+                                                                   self.flags_var.get())
+                result = solution.run(test_input)
+            except Exception as e:
+                messagebox.showerror("运行错误", f"测试运行出错：\n{str(e)}")
+                return
+            self.test_runner.show_result_dialog(test_input, result)
+            return
+
         # 设置测试运行器的测试数据列表和当前索引
         self.test_runner.set_test_data_list(self.test_data, self.current_test_index)
         # 运行测试
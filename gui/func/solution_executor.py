@@ -6,10 +6,18 @@
 """
 
 import io
+import os
 import sys
-from typing import List
+import tempfile
+from typing import List, Optional, Dict, Any, Callable
 from tkinter import messagebox
 
+from core.solution_runner import BuildCache, SolutionProcess
+from core.output_cache import OutputCache
+from core.time_calibration import calibrate, save_report
+from core.input_pack import InputPack
+from core.pipeline import format_stats
+
 
 class SolutionExecutor:
     """解题代码执行器类"""
@@ -21,43 +29,124 @@ class SolutionExecutor:
             file_manager: 文件管理器实例
         """
         self.file_manager = file_manager
+        self.build_cache = BuildCache()  # 编译结果和子进程运行的 Python 代码缓存
+        self.output_cache = OutputCache()  # 解题输出缓存，未改动的输入不再重新运行
+    
+    def compile_solution(self, code: str, language: str, flags: Optional[str] = None) -> SolutionProcess:
+        """准备在子进程中运行的解题程序：编译型语言编译（相同代码和编译选项直接复用缓存），
+        Python 代码经 process_solution_code 处理后由 solution_host 运行，出错时改为运行原始代码"""
+        if language == "Python":
+            return self.build_cache.python_solution(self.process_solution_code(code), original_code=code)
+        return self.build_cache.compile(language, code, flags)
     
     def execute_and_save_solution(self, code: str, test_data: List[str], output_dir: str, 
-                                editor_window, delete_temp_files: bool = False):
-        """执行解题代码并保存结果"""
+                                editor_window, delete_temp_files: bool = False,
+                                language: str = "Python", flags: Optional[str] = None):
+        """执行解题代码并保存结果
+        
+        解题代码在子进程中运行（其他语言先编译）：从 .in 文件读取输入，输出分块直接写入 .out 文件，
+        不在内存中收集解答；代码和输入都没有变化的用例直接使用输出缓存中的结果。
+        输出目录中记录任务清单，中断后再次执行时跳过已完成且校验通过的用例
+        """
         try:
-            # 处理代码：将print语句转换为return语句
-            processed_code = self.process_solution_code(code)
-
-            # 执行代码获取所有测试用例的结果
-            solutions = []
-            for i, data in enumerate(test_data):
-                try:
-                    result = self.execute_solution_code(processed_code, data)
-                    solutions.append(str(result))
-                except Exception as e:
-                    messagebox.showerror("执行错误", f"执行第{i + 1}个测试用例时出错：{str(e)}")
-                    return
-
-            # 使用文件管理器保存带解答的文件
-            save_result = self.file_manager.save_with_solutions(test_data, solutions, output_dir,
-                                                                delete_temp_files=delete_temp_files)
+            solution = self.compile_solution(code, language, flags)
+            save_result = self.file_manager.save_with_solution_process(test_data, solution, output_dir,
+                                                                       delete_temp_files=delete_temp_files,
+                                                                       output_cache=self.output_cache,
+                                                                       checkpoint=True)
 
             # 关闭编辑器窗口
             editor_window.destroy()
 
             # 显示成功消息
-            success_msg = (f"成功生成 {len(test_data)} 组测试数据和解答！\n"
-                           f"输出目录：{output_dir}\n"
-                           f"文件数量：{save_result['file_count']}")
+            self._show_saved_message(len(test_data), output_dir, save_result, delete_temp_files)
 
-            if delete_temp_files and 'deleted_temp_files' in save_result:
-                success_msg += f"\n已删除临时文件：{len(save_result['deleted_temp_files'])} 个"
+        except Exception as e:
+            messagebox.showerror("错误", f"处理解题代码时出错：{str(e)}")
+    
+    def execute_and_save_pack(self, code: str, pack, output_dir: str, editor_window,
+                              delete_temp_files: bool = False, language: str = "Python",
+                              flags: Optional[str] = None):
+        """为已有数据包（目录或zip）中的 .in 文件生成 .out 文件
 
-            messagebox.showinfo("成功", success_msg)
+        .in 文件逐个交给解题程序，不整体读入内存；其余与 execute_and_save_solution 相同
+        """
+        try:
+            solution = self.compile_solution(code, language, flags)
+            save_result = self.file_manager.save_pack_with_solution_process(pack, solution, output_dir,
+                                                                            delete_temp_files=delete_temp_files,
+                                                                            output_cache=self.output_cache,
+                                                                            checkpoint=True)
+            editor_window.destroy()
+            self._show_saved_message(len(pack), output_dir, save_result, delete_temp_files)
 
         except Exception as e:
             messagebox.showerror("错误", f"处理解题代码时出错：{str(e)}")
+
+    def calibrate_time_limit(self, code: str, test_data: List[str], output_dir: str, language: str = "Python",
+                             flags: Optional[str] = None, repeats: int = 5,
+                             progress_callback: Optional[Callable[[int, int], None]] = None,
+                             input_pack=None) -> Dict[str, Any]:
+        """把解题代码作为标程在每组测试数据上运行多次，统计用时并给出建议的时间限制
+
+        报告保存为输出目录下的 timing.json 和 timing.csv，用例名与测试数据包中的 .in 文件一致。
+        提供 input_pack 时使用数据包中的 .in 文件（目录中的原地使用，zip 中的解压到临时目录），test_data 不再使用。
+
+        Args:
+            code: 标程代码
+            test_data: 测试数据列表
+            output_dir: 测试数据的输出目录
+            language: 语言
+            flags: 编译选项
+            repeats: 每组数据运行的次数
+            progress_callback: 进度回调，参数为 (已完成次数, 总次数)
+            input_pack: 数据包（core.input_pack.InputPack）
+
+        Returns:
+            标定报告，'saved_files' 为保存的报告文件
+        """
+        solution = self.compile_solution(code, language, flags)
+        with tempfile.TemporaryDirectory(prefix='timing-') as temp_dir:
+            if input_pack is not None:
+                # zip 另外打开一次，不与生成 .out 时共用文件句柄
+                pack = InputPack(input_pack.source) if input_pack.is_zip else input_pack
+                try:
+                    in_paths = [str(pack.materialize(name, temp_dir)) for name in input_pack.names]
+                finally:
+                    if pack is not input_pack:
+                        pack.close()
+            else:
+                in_paths = []
+                for i, data in enumerate(test_data, 1):
+                    in_path = os.path.join(temp_dir, f"test{i:02d}.in")
+                    self.file_manager.write_data_file(in_path, data)
+                    in_paths.append(in_path)
+            report = calibrate(solution, in_paths, repeats, progress_callback=progress_callback)
+        report['saved_files'] = save_report(report, output_dir)
+        return report
+
+    def _show_saved_message(self, count: int, output_dir: str, save_result, delete_temp_files: bool):
+        """显示保存成功的消息"""
+        success_msg = (f"成功生成 {count} 组测试数据和解答！\n"
+                       f"输出目录：{output_dir}\n"
+                       f"文件数量：{save_result['file_count']}")
+
+        if 'cache_hits' in save_result:
+            total = save_result['cache_hits'] + save_result['cache_misses']
+            rate = save_result['cache_hits'] / total * 100 if total else 0
+            success_msg += (f"\n输出缓存：命中 {save_result['cache_hits']} 个，"
+                            f"重新运行 {save_result['cache_misses']} 个（命中率 {rate:.0f}%）")
+
+        if save_result.get('resumed_cases'):
+            success_msg += f"\n继续上次中断的任务：跳过已完成的 {save_result['resumed_cases']} 组"
+
+        if 'stats' in save_result:
+            success_msg += f"\n{format_stats(save_result['stats'])}"
+
+        if delete_temp_files and 'deleted_temp_files' in save_result:
+            success_msg += f"\n已删除临时文件：{len(save_result['deleted_temp_files'])} 个"
+
+        messagebox.showinfo("成功", success_msg)
     
     def process_solution_code(self, code: str) -> str:
         """处理解题代码，将print语句转换为return语句"""
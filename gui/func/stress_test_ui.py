@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+对拍界面
+负责对拍窗口的创建，在后台线程中运行对拍器并显示进度和反例
+"""
+
+import os
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from .stress_tester import StressTester
+
+# 界面刷新进度的间隔（毫秒）
+POLL_INTERVAL = 200
+
+STATUS_TEXT = {
+    'passed': "全部一致",
+    'stopped': "已停止，全部一致",
+    'mismatch': "输出不一致",
+    'reference_error': "暴力解运行出错",
+    'candidate_error': "待测解运行出错",
+    'timeout': "运行超时",
+    'invalid': "配置无法生成数据",
+    'error': "工作进程出错",
+}
+
+
+class StressTestUI:
+    """对拍窗口类"""
+
+    def __init__(self, parent_window, get_variable_configs_callback):
+        """
+        初始化对拍窗口
+
+        Args:
+            parent_window: 父窗口
+            get_variable_configs_callback: 获取变量配置的回调函数
+        """
+        self.parent_window = parent_window
+        self.get_variable_configs = get_variable_configs_callback
+        self.tester = None  # 正在运行的对拍器
+        self.last_tester = None  # 上一次完成的对拍器，用于保存反例
+        self.progress = None  # 后台线程写入的最新进度
+        self.result = None  # 后台线程写入的对拍结果
+        self.window = None
+
+    def show_stress_dialog(self):
+        """显示对拍窗口"""
+        configs = self.get_variable_configs()
+        if not configs:
+            messagebox.showwarning("警告", "请至少配置一个变量！")
+            return
+
+        from ..code_editor import CodeEditor
+
+        self.window = tk.Toplevel(self.parent_window)
+        self.window.title("对拍")
+        self.window.geometry("1000x750")
+        self.window.transient(self.parent_window)
+
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # 两份代码并排
+        code_frame = ttk.Frame(main_frame)
+        code_frame.pack(fill=tk.BOTH, expand=True)
+        editors = []
+        for column, title in enumerate(("暴力解（认为正确）", "待测解")):
+            frame = ttk.LabelFrame(code_frame, text=title, padding="5")
+            frame.grid(row=0, column=column, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 5))
+            code_frame.columnconfigure(column, weight=1)
+            editor = CodeEditor(parent=frame, title="", template_code="def main():\n    return None\n",
+                                width=0, height=0)
+            editor.create_embedded_editor(frame)
+            editors.append(editor)
+        code_frame.rowconfigure(0, weight=1)
+
+        # 选项
+        option_frame = ttk.Frame(main_frame)
+        option_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Label(option_frame, text="进程数:").pack(side=tk.LEFT)
+        workers_var = tk.StringVar(value=str(os.cpu_count() or 1))
+        ttk.Entry(option_frame, textvariable=workers_var, width=5).pack(side=tk.LEFT, padx=(5, 15))
+        ttk.Label(option_frame, text="最多组数（留空不限）:").pack(side=tk.LEFT)
+        max_cases_var = tk.StringVar(value="")
+        ttk.Entry(option_frame, textvariable=max_cases_var, width=8).pack(side=tk.LEFT, padx=(5, 15))
+        shrink_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(option_frame, text="发现问题后缩小反例", variable=shrink_var).pack(side=tk.LEFT)
+
+        # 状态和结果
+        self.status_label = ttk.Label(main_frame, text="提示：数据按当前变量配置生成，对拍时建议使用较小的范围")
+        self.status_label.pack(fill=tk.X, pady=(10, 5))
+        self.result_text = tk.Text(main_frame, height=12, wrap=tk.NONE, font=('Consolas', 10))
+        self.result_text.pack(fill=tk.BOTH, expand=True)
+
+        # 按钮
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        self.start_btn = ttk.Button(button_frame, text="开始对拍",
+                                    command=lambda: self._start(configs, editors[0].get_code(), editors[1].get_code(),
+                                                                workers_var.get(), max_cases_var.get(),
+                                                                shrink_var.get()))
+        self.start_btn.pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="停止", command=self._stop).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="保存反例", command=self._save_failure).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="关闭", command=self._close).pack(side=tk.RIGHT)
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
+
+    def _start(self, configs, reference_code, candidate_code, workers, max_cases, shrink):
+        """在后台线程中开始对拍"""
+        if self.tester is not None:
+            return
+        try:
+            workers = int(workers) if workers.strip() else None
+            max_cases = int(max_cases) if max_cases.strip() else None
+            self.tester = StressTester(configs, reference_code, candidate_code, workers=workers)
+        except Exception as e:
+            messagebox.showerror("错误", f"无法开始对拍：{str(e)}", parent=self.window)
+            return
+
+        self.progress = None
+        self.result = None
+        self.last_tester = None
+        self.result_text.delete(1.0, tk.END)
+        self.status_label.config(text=f"对拍中...（随机种子 {self.tester.seed}）")
+        self.start_btn.config(state=tk.DISABLED)
+
+        tester = self.tester
+
+        def worker():
+            try:
+                result = tester.run(max_cases, shrink, self._on_progress)
+            except Exception as e:
+                result = {'status': 'error', 'error': str(e)}
+            # 窗口关闭后或已开始新的对拍时丢弃结果
+            if self.tester is tester:
+                self.result = result
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.window.after(POLL_INTERVAL, self._poll)
+
+    def _on_progress(self, progress):
+        """后台线程的进度回调，只记录，由界面线程定时读取"""
+        self.progress = progress
+
+    def _poll(self):
+        """定时刷新进度，对拍结束后显示结果"""
+        if not self.window or not self.window.winfo_exists():
+            return
+        if self.result is None:
+            if self.progress:
+                self.status_label.config(text=f"已对拍 {self.progress['cases']} 组，"
+                                              f"{self.progress['cases_per_second']:.0f} 组/秒")
+            self.window.after(POLL_INTERVAL, self._poll)
+            return
+
+        self._show_result(self.result)
+        self.start_btn.config(state=tk.NORMAL)
+        self.last_tester, self.tester = self.tester, None
+
+    def _show_result(self, result):
+        """显示对拍结果和反例"""
+        status = STATUS_TEXT.get(result['status'], result['status'])
+        if 'cases' not in result:
+            self.status_label.config(text=f"{status}：{result.get('error', '')}")
+            return
+
+        text = f"{status}：共对拍 {result['cases']} 组，{result['cases_per_second']:.0f} 组/秒"
+        if result['shrink_cases']:
+            text += f"，缩小反例时又运行了 {result['shrink_cases']} 组"
+        self.status_label.config(text=text)
+
+        failure = result['failure']
+        if not failure:
+            return
+        self.result_text.insert(tk.END, f"种子: {failure['seed']}\n")
+        if failure.get('error'):
+            self.result_text.insert(tk.END, f"错误: {failure['error']}\n")
+        for title, key in (("输入", 'input'), ("暴力解输出", 'expected'), ("待测解输出", 'actual')):
+            if failure.get(key) is not None:
+                self.result_text.insert(tk.END, f"\n=== {title} ===\n{failure[key]}\n")
+
+    def _stop(self):
+        """停止对拍"""
+        if self.tester is not None:
+            self.tester.stop()
+            self.status_label.config(text="正在停止...")
+
+    def _save_failure(self):
+        """把反例保存到用户选择的目录"""
+        result = self.result if self.last_tester else None
+        if not result or not result.get('failure'):
+            messagebox.showinfo("提示", "还没有发现反例", parent=self.window)
+            return
+        output_dir = filedialog.askdirectory(parent=self.window, title="选择保存反例的目录")
+        if not output_dir:
+            return
+        saved = self.last_tester.save_failure(result['failure'], output_dir)
+        messagebox.showinfo("成功", "已保存：\n" + "\n".join(saved), parent=self.window)
+
+    def _close(self):
+        """关闭窗口并停止对拍"""
+        self._stop()
+        self.tester = None
+        self.window.destroy()
+        self.window = None
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+对拍器核心类
+负责在多个进程中不断生成随机数据，分别运行暴力解和待测解并比较输出，与UI界面分离
+"""
+
+import os
+import queue
+import random
+import time
+import multiprocessing
+from typing import List, Dict, Any, Optional, Callable
+
+from core.data_generator_core import DataGeneratorCore
+from core.file_manager_core import FileManagerCore
+from core.generation_plan import REFERENCE_FIELDS, parse_reference, parse_length
+from .solution_executor import SolutionExecutor
+
+# 单组数据从工作进程开始处理到得到结果的最长时间（秒），超过视为超时
+STRESS_CASE_TIMEOUT = 10
+# 缩小反例时依次尝试的缩小比例，以及每种比例最多尝试的组数
+SHRINK_FACTORS = (0.1, 0.5)
+SHRINK_ATTEMPTS = 200
+# 缩小反例的最大轮数
+MAX_SHRINK_ROUNDS = 20
+# 进度回调的最短间隔（秒）
+PROGRESS_INTERVAL = 0.5
+
+# 工作进程中复用的生成器和执行器
+_worker_generator = None
+_worker_executor = None
+# 工作进程开始处理一组数据时在此报告 (种子, 开始时间)
+_worker_started = None
+
+
+def _init_worker(started_queue):
+    """工作进程初始化：记录用于报告开始时间的队列"""
+    global _worker_started
+    _worker_started = started_queue
+
+
+def generate_case(generator: DataGeneratorCore, configs: List[Dict[str, Any]], seed: int) -> str:
+    """用给定种子生成一组数据，相同种子总是得到相同的数据"""
+    generator.set_seed(seed)
+    return generator.generate_test_data(configs, 1)[0]
+
+
+def normalize_output(output: str) -> str:
+    """去掉每行末尾和整个输出首尾的空白后再比较"""
+    return '\n'.join(line.rstrip() for line in str(output).strip().splitlines())
+
+
+def _run_case(task) -> Dict[str, Any]:
+    """在工作进程中生成一组数据并运行两份代码，只在出现问题时返回数据和输出"""
+    global _worker_generator, _worker_executor
+    if _worker_generator is None:
+        _worker_generator = DataGeneratorCore()
+        _worker_executor = SolutionExecutor(None)
+
+    configs, seed, reference_code, candidate_code = task
+    if _worker_started is not None:
+        # time.monotonic 在各进程间可比较，主进程据此从真正开始运行时计算超时
+        _worker_started.put((seed, time.monotonic()))
+    result = {'seed': seed, 'status': 'ok'}
+    try:
+        input_data = generate_case(_worker_generator, configs, seed)
+    except ValueError as e:
+        result.update(status='invalid', error=str(e))
+        return result
+
+    outputs = []
+    for status, code in (('reference_error', reference_code), ('candidate_error', candidate_code)):
+        try:
+            outputs.append(_worker_executor.execute_solution_code(code, input_data))
+        except Exception as e:
+            result.update(status=status, error=str(e), input=input_data)
+            return result
+
+    if normalize_output(outputs[0]) != normalize_output(outputs[1]):
+        result.update(status='mismatch', input=input_data, expected=outputs[0], actual=outputs[1])
+    return result
+
+
+def shrink_configs(configs: List[Dict[str, Any]], factor: float) -> List[Dict[str, Any]]:
+    """按比例缩小配置中的常量规模（循环次数、范围、字符串长度、节点数和边数）
+
+    引用其他变量的字段保持不变；绝对值不超过1的数不再缩小。
+    """
+    shrunk = []
+    for config in configs:
+        config = dict(config)
+        name = config.get('name', '')
+        for field, label in REFERENCE_FIELDS.items():
+            if field in config:
+                config[field] = _shrink_value(config[field], factor, name, label)
+
+        if 'string_length' in config:
+            try:
+                min_len, max_len = parse_length(config['string_length'], name, {}, set())
+            except ValueError:
+                min_len = max_len = None
+            if min_len is not None and min_len.is_constant and max_len.is_constant:
+                low = _shrink_number(min_len.constant, factor)
+                high = _shrink_number(max_len.constant, factor)
+                config['string_length'] = str(high) if min_len is max_len else f"{min(low, high)},{high}"
+        shrunk.append(config)
+    return shrunk
+
+
+def _shrink_value(value: Any, factor: float, owner: str, label: str) -> Any:
+    """缩小一个常量字段（数字、数字字符串或常量表达式），其余原样返回"""
+    try:
+        reference = parse_reference(value, owner, label, {}, set())
+    except ValueError:
+        return value
+    return _shrink_number(reference.constant, factor)
+
+
+def _shrink_number(number, factor: float):
+    if isinstance(number, float):
+        return number * factor
+    if abs(number) <= 1:
+        return number
+    scaled = int(number * factor)
+    return max(1, scaled) if number > 0 else min(-1, scaled)
+
+
+class StressTester:
+    """对拍器：比较暴力解和待测解在随机数据上的输出"""
+
+    def __init__(self, configs: List[Dict[str, Any]], reference_code: str, candidate_code: str,
+                 workers: Optional[int] = None, case_timeout: float = STRESS_CASE_TIMEOUT,
+                 seed: Optional[int] = None):
+        """
+        初始化对拍器
+
+        Args:
+            configs: 变量配置列表，用于生成数据
+            reference_code: 暴力解代码（认为输出正确）
+            candidate_code: 待测解代码
+            workers: 工作进程数，默认为CPU核数
+            case_timeout: 单组数据的最长运行时间（秒）
+            seed: 起始随机种子，第 i 组数据的种子为 seed + i，默认随机选取
+        """
+        executor = SolutionExecutor(None)
+        self.configs = configs
+        self.reference_code = executor.process_solution_code(reference_code)
+        self.candidate_code = executor.process_solution_code(candidate_code)
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.case_timeout = case_timeout
+        self.seed = seed if seed is not None else random.randrange(2 ** 31)
+        self.stopped = False
+        self.file_manager = FileManagerCore()
+
+    def stop(self):
+        """请求停止，当前正在运行的数据组结束后返回"""
+        self.stopped = True
+
+    def run(self, max_cases: Optional[int] = None, shrink: bool = True,
+            progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """不断生成数据对拍，直到发现不一致、达到组数上限或被停止
+
+        Args:
+            max_cases: 最多对拍的组数，None 表示不限
+            shrink: 发现问题后是否缩小规模寻找更小的反例
+            progress_callback: 进度回调，参数含 cases、elapsed、cases_per_second
+
+        Returns:
+            结果字典：status 为 passed / stopped / mismatch / reference_error / candidate_error /
+            timeout / invalid（配置无法生成数据）/ error（工作进程出错）；cases、elapsed、cases_per_second 为统计；
+            failure 为出问题的数据组（含 seed、input，不一致时含 expected、actual）；
+            failure_configs 为生成该数据组所用的配置（缩小后的配置）
+        """
+        self.stopped = False
+        start = time.perf_counter()
+        failure, cases = self._search(self.configs, self.seed, max_cases, False, progress_callback, start)
+        elapsed = time.perf_counter() - start
+
+        result = {
+            'status': failure['status'] if failure else ('stopped' if self.stopped else 'passed'),
+            'cases': cases,
+            'elapsed': elapsed,
+            'cases_per_second': cases / elapsed if elapsed > 0 else 0.0,
+            'seed': self.seed,
+            'failure': failure,
+            'failure_configs': self.configs,
+            'shrink_cases': 0,
+        }
+        if failure and shrink and failure['status'] != 'invalid':
+            self._shrink(result)
+        return result
+
+    def _shrink(self, result: Dict[str, Any]):
+        """不断缩小配置中的规模重新生成，保留能复现问题的最小数据"""
+        configs = self.configs
+        seed = self.seed + result['cases']
+        for _ in range(MAX_SHRINK_ROUNDS):
+            progressed = False
+            for factor in SHRINK_FACTORS:
+                if self.stopped:
+                    return
+                candidate = shrink_configs(configs, factor)
+                if candidate == configs:
+                    continue
+                failure, cases = self._search(candidate, seed, SHRINK_ATTEMPTS, True)
+                seed += SHRINK_ATTEMPTS
+                result['shrink_cases'] += cases
+                if failure:
+                    configs = candidate
+                    if len(failure['input']) <= len(result['failure']['input']):
+                        result['failure'] = failure
+                        result['failure_configs'] = candidate
+                    progressed = True
+                    break
+            if not progressed:
+                return
+
+    def _search(self, configs: List[Dict[str, Any]], seed: int, limit: Optional[int], skip_invalid: bool,
+                progress_callback=None, start: float = 0.0):
+        """在进程池中对拍，返回 (第一个出问题的数据组或None, 已完成的组数)
+
+        每次搜索使用独立的进程池，找到问题或超时后直接终止仍在运行的进程。
+        超时从工作进程开始处理该组时计算，在进程池队列中等待的时间不计入。
+        """
+        results = queue.Queue()
+        started = multiprocessing.Queue()
+        pending = {}  # 种子 -> 开始运行的时间，尚未开始时为None
+        submitted = 0
+        cases = 0
+        last_progress = time.perf_counter()
+        in_flight = self.workers * 2
+
+        with multiprocessing.Pool(self.workers, initializer=_init_worker, initargs=(started,)) as pool:
+            while not self.stopped:
+                while len(pending) < in_flight and (limit is None or submitted < limit):
+                    case_seed = seed + submitted
+                    submitted += 1
+                    pending[case_seed] = None
+                    pool.apply_async(_run_case, ((configs, case_seed, self.reference_code, self.candidate_code),),
+                                     callback=results.put,
+                                     error_callback=lambda e, s=case_seed: results.put(
+                                         {'seed': s, 'status': 'error', 'error': str(e)}))
+                if not pending:
+                    break
+
+                while True:
+                    try:
+                        case_seed, start_time = started.get_nowait()
+                    except queue.Empty:
+                        break
+                    if case_seed in pending:
+                        pending[case_seed] = start_time
+                now = time.monotonic()
+                timed_out = [s for s, start_time in pending.items()
+                             if start_time is not None and now - start_time > self.case_timeout]
+                if timed_out:
+                    return self._timeout_failure(configs, min(timed_out)), cases
+                try:
+                    result = results.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+
+                pending.pop(result['seed'], None)
+                cases += 1
+                if result['status'] == 'invalid' and skip_invalid:
+                    continue
+                if result['status'] != 'ok':
+                    if 'input' not in result and result['status'] != 'invalid':
+                        result['input'] = generate_case(DataGeneratorCore(), configs, result['seed'])
+                    return result, cases
+
+                if progress_callback and time.perf_counter() - last_progress >= PROGRESS_INTERVAL:
+                    last_progress = time.perf_counter()
+                    elapsed = last_progress - start
+                    progress_callback({'cases': cases, 'elapsed': elapsed, 'cases_per_second': cases / elapsed})
+        return None, cases
+
+    def _timeout_failure(self, configs: List[Dict[str, Any]], seed: int) -> Dict[str, Any]:
+        """超时的数据组在工作进程中生成，这里用同一种子重新生成以便保存"""
+        return {'seed': seed, 'status': 'timeout', 'error': f"运行超过 {self.case_timeout} 秒",
+                'input': generate_case(DataGeneratorCore(), configs, seed)}
+
+    def save_failure(self, failure: Dict[str, Any], output_dir: str) -> List[str]:
+        """保存出问题的数据组：stress.in 为输入，stress.ans 为暴力解输出，stress.out 为待测解输出
+
+        Args:
+            failure: run 返回的 failure
+            output_dir: 输出目录
+
+        Returns:
+            保存的文件路径列表
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        files = [('stress.in', failure.get('input')),
+                 ('stress.ans', failure.get('expected')),
+                 ('stress.out', failure.get('actual'))]
+        saved = []
+        for file_name, content in files:
+            if content is None:
+                continue
+            file_path = os.path.join(output_dir, file_name)
+            self.file_manager.write_data_file(file_path, content)
+            saved.append(file_path)
+        return saved
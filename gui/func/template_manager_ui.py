@@ -29,6 +29,7 @@ class TemplateManagerUI:
         self.variable_rows = variable_rows
         self.scrollable_frame = scrollable_frame
         self.get_variable_configs = get_variable_configs_callback
+        self._variable_change_callback = None  # 变量配置被修改时的回调，由主窗口设置
     
     def load_template(self):
         """加载预设模板"""
@@ -38,7 +39,7 @@ class TemplateManagerUI:
         """显示模板选择对话框"""
         template_window = tk.Toplevel(self.parent_window)
         template_window.title("选择模板")
-        template_window.geometry("500x520")
+        template_window.geometry("500x580")
         template_window.transient(self.parent_window)
         template_window.grab_set()
 
@@ -49,6 +50,17 @@ class TemplateManagerUI:
         # 模板列表
         ttk.Label(main_frame, text="可用模板:", font=('Arial', 12, 'bold')).pack(anchor=tk.W, pady=(0, 10))
 
+        # 搜索框：按名称、描述和变量属性边输入边筛选
+        search_frame = ttk.Frame(main_frame)
+        search_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(search_frame, text="搜索:").pack(side=tk.LEFT, padx=(0, 5))
+        search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=search_var)
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        search_entry.focus()
+        ttk.Label(main_frame, text="例如: 数组 1e5、tree、type:字符串、loop:n、max:10^9",
+                  foreground="gray").pack(anchor=tk.W, pady=(0, 5))
+
         # 创建列表框和滚动条
         list_frame = ttk.Frame(main_frame)
         list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
@@ -60,21 +72,27 @@ class TemplateManagerUI:
         template_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # 加载模板
-        all_templates = self.template_manager.get_all_templates()
-        template_data = []
+        # 加载模板目录（用户模板只读取索引，完整变量在选中时才加载）
+        catalog = self.template_manager.get_template_catalog()
+        search_index = self.template_manager.get_search_index(catalog)
+        template_data = []  # 当前列表中显示的模板
+
+        def show_templates(templates):
+            """用给定模板刷新列表"""
+            template_data[:] = templates
+            template_listbox.delete(0, tk.END)
+            display_names = [f"[{'默认' if template_type == 'default' else '用户'}] {template['name']}"
+                             for template_type, template in templates]
+            # 一次性插入，模板很多时也能立即显示
+            if display_names:
+                template_listbox.insert(tk.END, *display_names)
 
-        # 添加默认模板
-        for template in all_templates['default']:
-            display_name = f"[默认] {template['name']}"
-            template_listbox.insert(tk.END, display_name)
-            template_data.append(('default', template))
+        def on_search_changed(*args):
+            """搜索内容变化时重新筛选"""
+            show_templates(search_index.search(search_var.get()))
 
-        # 添加用户模板
-        for template in all_templates['user']:
-            display_name = f"[用户] {template['name']}"
-            template_listbox.insert(tk.END, display_name)
-            template_data.append(('user', template))
+        show_templates(search_index.documents)
+        search_var.trace_add('write', on_search_changed)
 
         # 描述区域
         desc_frame = ttk.LabelFrame(main_frame, text="模板描述", padding="5")
@@ -88,7 +106,8 @@ class TemplateManagerUI:
             selection = template_listbox.curselection()
             if selection:
                 index = selection[0]
-                template_type, template = template_data[index]
+                template_type, entry = template_data[index]
+                template = self.template_manager.load_template_detail(entry) or entry
 
                 desc_text.config(state=tk.NORMAL)
                 desc_text.delete(1.0, tk.END)
@@ -119,7 +138,11 @@ class TemplateManagerUI:
                 return
 
             index = selection[0]
-            template_type, template = template_data[index]
+            template_type, entry = template_data[index]
+            template = self.template_manager.load_template_detail(entry)
+            if template is None:
+                messagebox.showerror("错误", f"加载模板失败: {entry['name']}")
+                return
 
             # 清空现有变量
             for row in self.variable_rows:
@@ -147,7 +170,8 @@ class TemplateManagerUI:
         from gui.variable_row import VariableRow
         
         row_index = len(self.variable_rows)
-        var_row = VariableRow(self.scrollable_frame, row_index, self._remove_variable_row_callback)
+        var_row = VariableRow(self.scrollable_frame, row_index, self._remove_variable_row_callback,
+                              self._variable_change_callback)
         var_row.create_widgets()
 
         # 应用配置
@@ -166,6 +190,10 @@ class TemplateManagerUI:
     def set_remove_variable_row_callback(self, callback):
         """设置移除变量行的回调函数"""
         self._remove_variable_row_callback = callback
+
+    def set_variable_change_callback(self, callback):
+        """设置变量配置被修改时的回调函数"""
+        self._variable_change_callback = callback
     
     def show_save_template_dialog(self, parent_window=None):
         """显示保存模板对话框"""
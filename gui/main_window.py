@@ -19,11 +19,15 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from gui.variable_row import VariableRow
 from core.data_generator_core import DataGeneratorCore
+from core.preview_limits import PREVIEW_CHAR_BUDGET, PREVIEW_LINE_BUDGET
+from core.config_validator import validate_configs, format_size
 from core.file_manager_core import FileManagerCore
+from core.pipeline import PackPipeline, format_stats
+from core.job_manifest import find_resumable_job
+from core.size_budget import parse_total
+from core.input_pack import InputPack
 from core.config_manager import ConfigManager
 from templates.template_manager import TemplateManager
-from deepseek_api.deepseek_dialog import DeepSeekDialog, ApiKeyDialog
-from deepseek_api.api_key_manager import ApiKeyManager
 
 # 各个功能组件相关
 from .func.deBug import debug
@@ -32,6 +36,13 @@ from .func.solution_executor import SolutionExecutor
 from gui.func.template_manager_ui import TemplateManagerUI
 from gui.func.deepseek_ui import DeepSeekUI
 from gui.func.solution_editor_ui import SolutionEditorUI
+from gui.func.stress_test_ui import StressTestUI
+
+
+# 修改配置后等待该毫秒数再做静态检查，连续输入时只检查一次
+VALIDATION_DELAY = 150
+# 导入已有数据包时在编辑器中显示的示例组数
+PACK_EXAMPLE_COUNT = 5
 
 
 class MainWindow:
@@ -40,6 +51,7 @@ class MainWindow:
     def __init__(self, root):
         self.root = root
         self.variable_rows = []
+        self.validation_job = None
 
         # 初始化核心组件
         self.data_generator = DataGeneratorCore()
@@ -59,6 +71,7 @@ class MainWindow:
         )  # 模板管理组件
         self.deepseek_ui = DeepSeekUI(self.root)  # DeepSeek功能组件
         self.solution_editor_ui = SolutionEditorUI(self.root, self.solution_executor, self.deepseek_ui)  # 解决方案编辑组件
+        self.stress_test_ui = StressTestUI(self.root, self.get_variable_configs)  # 对拍组件
 
         # 加载用户配置
         self.user_config = self.config_manager.load_config()
@@ -114,6 +127,7 @@ class MainWindow:
         # 设置模板管理UI的scrollable_frame引用
         self.template_manager_ui.scrollable_frame = self.scrollable_frame
         self.template_manager_ui.set_remove_variable_row_callback(self.remove_variable_row)
+        self.template_manager_ui.set_variable_change_callback(self.schedule_validation)
 
     def create_variable_area(self, parent):
         """创建变量配置区域"""
@@ -162,7 +176,11 @@ class MainWindow:
 
         # 预设模板按钮
         template_btn = ttk.Button(control_frame, text="加载模板", command=self.load_template)
-        template_btn.grid(row=0, column=2)
+        template_btn.grid(row=0, column=2, padx=(0, 10))
+
+        # 对拍按钮
+        stress_btn = ttk.Button(control_frame, text="对拍", command=self.stress_test_ui.show_stress_dialog)
+        stress_btn.grid(row=0, column=3)
 
     def create_generation_area(self, parent):
         """创建生成配置区域"""
@@ -207,6 +225,38 @@ class MainWindow:
                                  state="readonly", width=8)
         time_combo.grid(row=1, column=5, padx=(5, 0), pady=(5, 0))
 
+        # 总规模：把某个变量的总和分配到各组（如所有用例的 n 之和为 2*10**5）
+        self.budget_enabled_var = tk.BooleanVar()
+        budget_cb = ttk.Checkbutton(gen_frame, text="按总规模分配", variable=self.budget_enabled_var)
+        budget_cb.grid(row=2, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
+
+        budget_frame = ttk.Frame(gen_frame)
+        budget_frame.grid(row=2, column=1, columnspan=5, sticky=tk.W, pady=(5, 0))
+        ttk.Label(budget_frame, text="变量:").grid(row=0, column=0, padx=(0, 5))
+        self.budget_variable_var = tk.StringVar()
+        ttk.Entry(budget_frame, textvariable=self.budget_variable_var, width=8).grid(row=0, column=1, padx=(0, 10))
+        ttk.Label(budget_frame, text="总和:").grid(row=0, column=2, padx=(0, 5))
+        self.budget_total_var = tk.StringVar()
+        ttk.Entry(budget_frame, textvariable=self.budget_total_var, width=12).grid(row=0, column=3, padx=(0, 10))
+        self.budget_max_case_var = tk.BooleanVar()
+        ttk.Checkbutton(budget_frame, text="含一个最大用例",
+                        variable=self.budget_max_case_var).grid(row=0, column=4)
+
+        # 多组模式：一个文件包含 T 组数据，首行可写 T
+        self.multi_case_enabled_var = tk.BooleanVar()
+        multi_case_cb = ttk.Checkbutton(gen_frame, text="每个文件多组数据", variable=self.multi_case_enabled_var)
+        multi_case_cb.grid(row=3, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
+
+        multi_case_frame = ttk.Frame(gen_frame)
+        multi_case_frame.grid(row=3, column=1, columnspan=5, sticky=tk.W, pady=(5, 0))
+        ttk.Label(multi_case_frame, text="每个文件组数 T:").grid(row=0, column=0, padx=(0, 5))
+        self.multi_case_count_var = tk.StringVar()
+        ttk.Entry(multi_case_frame, textvariable=self.multi_case_count_var, width=8).grid(row=0, column=1,
+                                                                                          padx=(0, 10))
+        self.multi_case_header_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(multi_case_frame, text="首行输出T",
+                        variable=self.multi_case_header_var).grid(row=0, column=2)
+
         # 生成按钮
         generate_frame = ttk.Frame(parent)
         generate_frame.grid(row=4, column=0, pady=10)
@@ -216,7 +266,14 @@ class MainWindow:
         generate_btn.grid(row=0, column=0, padx=(0, 10))
 
         preview_btn = ttk.Button(generate_frame, text="预览数据", command=self.preview_data)
-        preview_btn.grid(row=0, column=1)
+        preview_btn.grid(row=0, column=1, padx=(0, 10))
+
+        import_btn = ttk.Button(generate_frame, text="为已有数据生成.out", command=self.solve_existing_pack)
+        import_btn.grid(row=0, column=2)
+
+        # 静态检查的汇总：错误数量和每组数据的规模估算
+        self.estimate_label = ttk.Label(generate_frame, text="", foreground="gray")
+        self.estimate_label.grid(row=1, column=0, columnspan=3, pady=(5, 0))
 
     def add_initial_variable_row(self):
         """添加初始变量行"""
@@ -225,12 +282,13 @@ class MainWindow:
     def add_variable_row(self):
         """添加变量行"""
         row_index = len(self.variable_rows)
-        var_row = VariableRow(self.scrollable_frame, row_index, self.remove_variable_row)
+        var_row = VariableRow(self.scrollable_frame, row_index, self.remove_variable_row, self.schedule_validation)
         var_row.create_widgets()
         self.variable_rows.append(var_row)
 
         # 更新滚动区域
         self.scrollable_frame.update_idletasks()
+        self.schedule_validation()
 
     def remove_variable_row(self, row_index):
         """移除变量行"""
@@ -246,6 +304,7 @@ class MainWindow:
             # 重新排列剩余行的索引
             for i, row in enumerate(self.variable_rows):
                 row.update_index(i)
+            self.schedule_validation()
 
     def clear_all_variables(self):
         """清空所有变量"""
@@ -259,6 +318,39 @@ class MainWindow:
         """加载预设模板"""
         self.template_manager_ui.load_template()
 
+    def schedule_validation(self):
+        """防抖的静态检查"""
+        if self.validation_job:
+            self.root.after_cancel(self.validation_job)
+        self.validation_job = self.root.after(VALIDATION_DELAY, self.validate_variables)
+
+    def validate_variables(self):
+        """静态检查所有变量配置，在各变量行和生成按钮下方显示结果（不生成数据）"""
+        self.validation_job = None
+        rows = []
+        configs = []
+        for row in self.variable_rows:
+            config = row.get_config()
+            if config:
+                rows.append(row)
+                configs.append(config)
+            else:
+                row.show_validation(None)
+
+        report = validate_configs(configs)
+        for row, result in zip(rows, report['variables']):
+            row.show_validation(result)
+
+        error_count = sum(len(result['errors']) for result in report['variables'])
+        if error_count:
+            self.estimate_label.config(text=f"配置中有 {error_count} 处错误", foreground="red")
+            return
+        text = (f"每组最多 {report['estimated_values']} 个值，约 {format_size(report['estimated_bytes'])}，"
+                f"预计生成耗时 {report['estimated_seconds']:.2f} 秒")
+        if report['unestimated']:
+            text += f"（不含 {', '.join(report['unestimated'])}）"
+        self.estimate_label.config(text=text, foreground="gray")
+
     def get_variable_configs(self) -> List[Dict[str, Any]]:
         """获取所有变量配置"""
         configs = []
@@ -276,14 +368,13 @@ class MainWindow:
                 messagebox.showwarning("警告", "请至少配置一个变量！")
                 return
 
-            # 获取不重复数据选项
-            no_duplicate = self.no_duplicate_var.get()
-
-            # 生成预览数据（只生成3组）
-            preview_data = self.data_generator.generate_preview_data(configs, 3, no_duplicate)
+            # 生成预览数据（只生成3组，每组只生成预算内能显示的部分）
+            char_budget = int(self.user_config.get('preview_char_budget', PREVIEW_CHAR_BUDGET))
+            line_budget = int(self.user_config.get('preview_line_budget', PREVIEW_LINE_BUDGET))
+            preview_cases = self.data_generator.generate_preview_cases(configs, 3, char_budget, line_budget)
 
             # 显示预览窗口
-            self.show_preview_window(preview_data)
+            self.show_preview_window(preview_cases)
 
         except Exception as e:
             messagebox.showerror("错误", f"预览数据时出错：{str(e)}")
@@ -313,20 +404,47 @@ class MainWindow:
             # 获取删除临时文件选项
             delete_temp_files = self.delete_temp_files_var.get()
 
-            # 生成数据
-            generated_data = self.data_generator.generate_test_data(configs, test_count, no_duplicate)
+            budget = self.get_budget()
+            multi_case = self.get_multi_case()
 
-            # 保存文件
-            save_result = self.file_manager.save_test_files(generated_data, output_dir,
-                                                                delete_temp_files=delete_temp_files)
+            # 输出目录中有同样配置的未完成任务时询问是否继续
+            seed = None
+            resumable = find_resumable_job(output_dir, configs, test_count, no_duplicate, budget=budget,
+                                           multi_case=multi_case)
+            if resumable and messagebox.askyesno(
+                    "继续任务", f"输出目录中有相同配置的未完成任务（已生成 {resumable[1]}/{test_count} 组），是否继续？"):
+                seed = resumable[0]
 
-            # 询问是否生成处理结果
-            if messagebox.askyesno("生成处理结果", "数据生成完成！是否生成处理结果(.out文件)？"):
-                # 修复：使用正确的变量名
+            # 生成前询问是否生成处理结果：需要时先不打包，.in 文件留在输出目录中交给解题程序，
+            # 与 .out 文件一起打包，不再把数据读回内存
+            with_outputs = messagebox.askyesno("生成处理结果", "是否在生成数据后生成处理结果(.out文件)？")
+
+            # 多进程生成数据，边生成边写入文件和zip，数据不在内存中累积
+            pipeline = PackPipeline(output_dir, delete_temp_files=delete_temp_files and not with_outputs,
+                                    create_zip=not with_outputs, checkpoint=True)
+            save_result = pipeline.run_generated(configs, test_count, seed=seed, no_duplicate=no_duplicate,
+                                                 budget=budget, multi_case=multi_case)
+
+            if with_outputs:
                 input_files = save_result.get('created_files', [])
-                self.solution_editor_ui.show_solution_editor(generated_data, output_dir, input_files, self.delete_temp_files_var)
+                pack = InputPack(output_dir, names=[os.path.basename(path) for path in input_files])
+                examples = pack.read_examples(PACK_EXAMPLE_COUNT)
+                self.solution_editor_ui.show_solution_editor(examples, output_dir, input_files,
+                                                             self.delete_temp_files_var, input_pack=pack)
             else:
-                success_msg = f"成功生成 {test_count} 组测试数据！\n输出目录：{output_dir}"
+                success_msg = (f"成功生成 {save_result['file_count']} 组测试数据！\n输出目录：{output_dir}\n"
+                               f"{format_stats(save_result['stats'])}")
+                if multi_case:
+                    success_msg += f"\n每个文件包含 {multi_case['cases']} 组数据"
+                if 'sizes' in save_result:
+                    sizes = save_result['sizes']
+                    if multi_case:
+                        # 多组模式下总和按文件计算
+                        success_msg += f"，每个文件中 {budget['variable']} 之和为 {sum(sizes[0])}"
+                        sizes = [size for file_sizes in sizes for size in file_sizes]
+                    else:
+                        success_msg += f"\n{budget['variable']} 总和 {sum(sizes)}"
+                    success_msg += f"，最小 {min(sizes)}，最大 {max(sizes)}"
                 if delete_temp_files and 'deleted_temp_files' in save_result:
                     success_msg += f"\n已删除临时文件：{len(save_result['deleted_temp_files'])} 个"
                 messagebox.showinfo("成功", success_msg)
@@ -336,6 +454,46 @@ class MainWindow:
         except Exception as e:
             messagebox.showerror("错误", f"生成数据时出错：{str(e)}")
 
+    def get_budget(self):
+        """界面上的总规模设置，未启用时返回None"""
+        if not self.budget_enabled_var.get():
+            return None
+        variable = self.budget_variable_var.get().strip()
+        total = self.budget_total_var.get().strip()
+        if not variable or not total:
+            raise ValueError("按总规模分配时请填写变量名和总和")
+        return {'variable': variable, 'total': parse_total(total), 'max_case': self.budget_max_case_var.get()}
+
+    def get_multi_case(self):
+        """界面上的多组模式设置，未启用时返回None"""
+        if not self.multi_case_enabled_var.get():
+            return None
+        try:
+            cases = int(self.multi_case_count_var.get().strip())
+        except ValueError:
+            raise ValueError("每个文件的组数 T 必须是整数")
+        if cases <= 0:
+            raise ValueError("每个文件的组数 T 必须大于0")
+        return {'cases': cases, 'header': self.multi_case_header_var.get()}
+
+    def solve_existing_pack(self):
+        """为已有的测试数据包（zip，或目录中的 .in 文件）生成 .out 文件"""
+        path = filedialog.askopenfilename(title="选择zip数据包，或目录中的任意一个 .in 文件",
+                                          filetypes=[("测试数据包", "*.zip *.in"), ("所有文件", "*.*")])
+        if not path:
+            return
+        try:
+            pack = InputPack(path if path.lower().endswith('.zip') else os.path.dirname(path))
+            examples = pack.read_examples(PACK_EXAMPLE_COUNT)
+        except Exception as e:
+            messagebox.showerror("错误", f"读取数据包时出错：{str(e)}")
+            return
+
+        output_dir = str(pack.default_output_dir())
+        messagebox.showinfo("导入数据包", f"找到 {len(pack)} 个 .in 文件\n.out 文件将保存到：{output_dir}")
+        self.solution_editor_ui.show_solution_editor(examples, output_dir, [], self.delete_temp_files_var,
+                                                     input_pack=pack)
+
     def show_preview_window(self, preview_data):
         """显示预览窗口"""
         preview_window = tk.Toplevel(self.root)
@@ -354,9 +512,20 @@ class MainWindow:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # 插入预览数据
-        for i, data in enumerate(preview_data, 1):
-            text_widget.insert(tk.END, f"=== 测试用例 {i} ===\n")
-            text_widget.insert(tk.END, data + "\n\n")
+        for i, case in enumerate(preview_data, 1):
+            text_widget.insert(tk.END, f"=== 测试用例 {i}（约 {format_size(case['estimated_bytes'])}，"
+                                       f"共 {case['total_values']} 个值，显示 {case['shown_values']} 个）===\n")
+            text_widget.insert(tk.END, case['text'] + "\n")
+
+            # 各变量的统计
+            for stats in case['variables']:
+                if stats['total'] <= 1:
+                    continue
+                line = f"  {stats['name']}: {stats['total']} 个值"
+                if 'min' in stats:
+                    line += f"，样本范围 [{stats['min']}, {stats['max']}]"
+                text_widget.insert(tk.END, line + "\n")
+            text_widget.insert(tk.END, "\n")
 
         text_widget.config(state=tk.DISABLED)
 
@@ -379,6 +548,17 @@ class MainWindow:
             # 应用输出目录
             self.output_dir_var.set(self.user_config.get('output_dir', './test_data'))
 
+            # 应用总规模设置
+            self.budget_enabled_var.set(self.user_config.get('budget_enabled', False))
+            self.budget_variable_var.set(self.user_config.get('budget_variable', ''))
+            self.budget_total_var.set(self.user_config.get('budget_total', ''))
+            self.budget_max_case_var.set(self.user_config.get('budget_max_case', False))
+
+            # 应用多组模式设置
+            self.multi_case_enabled_var.set(self.user_config.get('multi_case_enabled', False))
+            self.multi_case_count_var.set(self.user_config.get('multi_case_count', '100'))
+            self.multi_case_header_var.set(self.user_config.get('multi_case_header', True))
+
         except Exception as e:
             debug(f"应用配置时出错: {e}")
 
@@ -389,17 +569,30 @@ class MainWindow:
                 'test_count': self.test_count_var.get(),
                 'no_duplicate': self.no_duplicate_var.get(),
                 'delete_temp_files': self.delete_temp_files_var.get(),
-                'output_dir': self.output_dir_var.get()
+                'output_dir': self.output_dir_var.get(),
+                'budget_enabled': self.budget_enabled_var.get(),
+                'budget_variable': self.budget_variable_var.get(),
+                'budget_total': self.budget_total_var.get(),
+                'budget_max_case': self.budget_max_case_var.get(),
+                'multi_case_enabled': self.multi_case_enabled_var.get(),
+                'multi_case_count': self.multi_case_count_var.get(),
+                'multi_case_header': self.multi_case_header_var.get(),
+                'preview_char_budget': self.user_config.get('preview_char_budget', PREVIEW_CHAR_BUDGET),
+                'preview_line_budget': self.user_config.get('preview_line_budget', PREVIEW_LINE_BUDGET)
             }
 
-            self.config_manager.save_config(current_config)
+            if not self.config_manager.save_config(current_config):
+                debug("保存配置失败，将在稍后重试")
 
         except Exception as e:
             debug(f"保存配置时出错: {e}")
 
     def on_closing(self):
         """窗口关闭时的处理"""
-        # 保存当前配置
+        # 保存当前配置并立即写盘，写盘失败时提示用户
         self.save_current_config()
+        if not self.config_manager.flush():
+            messagebox.showwarning("保存配置失败",
+                                   f"无法写入配置文件：{self.config_manager.get_config_file_path()}\n本次的设置不会被保留。")
         # 关闭窗口
         self.root.destroy()
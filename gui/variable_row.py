@@ -9,14 +9,19 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Dict, Any, Callable, Optional
 
+from core.structured_generators import STRUCTURED_SOURCES, TREE_SHAPES, TREE_FORMATS, GRAPH_TYPES
+from core.config_validator import SUPPORTED_SOURCES, format_size
+
 
 class VariableRow:
     """变量行类"""
     
-    def __init__(self, parent, index: int, remove_callback: Callable[[int], None]):
+    def __init__(self, parent, index: int, remove_callback: Callable[[int], None],
+                 change_callback: Optional[Callable[[], None]] = None):
         self.parent = parent
         self.index = index
         self.remove_callback = remove_callback
+        self.change_callback = change_callback  # 任一配置项被修改时调用，用于实时检查
         
         # 变量配置
         self.var_name = tk.StringVar(value=f"var{index + 1}")
@@ -31,11 +36,29 @@ class VariableRow:
         self.choice_list = tk.StringVar(value="")
         self.char_set = tk.StringVar(value="a-z")
         self.string_length = tk.StringVar(value="10")
+        self.distinct = tk.BooleanVar(value=False)  # 整数范围是否不重复取值
+        self.weighted = tk.BooleanVar(value=False)  # 选择列表是否按 "值:权重" 选择
         self.custom_code = tk.StringVar(value="")  # 自定义代码
         
+        # 树、图、排列配置（节点数和边数可以是数字或变量名）
+        self.node_count = tk.StringVar(value="n")
+        self.edge_count = tk.StringVar(value="m")
+        self.tree_shape = tk.StringVar(value=TREE_SHAPES[0])
+        self.tree_format = tk.StringVar(value=TREE_FORMATS[0])
+        self.graph_type = tk.StringVar(value=GRAPH_TYPES[0])
+        self.relabel = tk.BooleanVar(value=True)
+        
         # 界面组件
         self.frame = None
         self.source_config_frame = None
+        self.status_label = None
+
+        # 监听所有配置项的修改
+        for variable in (self.var_name, self.data_type, self.source_type, self.separator, self.loop_count,
+                         self.range_min, self.range_max, self.choice_list, self.char_set, self.string_length,
+                         self.distinct, self.weighted, self.custom_code, self.node_count, self.edge_count, self.tree_shape,
+                         self.tree_format, self.graph_type, self.relabel):
+            variable.trace_add('write', self.on_field_changed)
     
     def create_widgets(self):
         """创建界面组件"""
@@ -62,7 +85,7 @@ class VariableRow:
         # 来源类型
         ttk.Label(self.frame, text="来自:").grid(row=0, column=4, sticky=tk.W, padx=(0, 5))
         source_type_combo = ttk.Combobox(self.frame, textvariable=self.source_type,
-                                       values=["数据范围", "选择列表", "字符集合", "来自代码"],
+                                       values=["数据范围", "选择列表", "字符集合", "来自代码"] + STRUCTURED_SOURCES,
                                        state="readonly", width=10)
         source_type_combo.grid(row=0, column=5, sticky=tk.W, padx=(0, 10))
         source_type_combo.bind('<<ComboboxSelected>>', self.on_source_type_changed)
@@ -74,7 +97,7 @@ class VariableRow:
         
         # 为循环次数输入框添加提示
         def show_loop_tooltip(event):
-            tooltip_text = "输入数字或变量名\n例如: 1, 5, n"
+            tooltip_text = "输入数字、变量名或表达式\n例如: 1, 5, n, n-1"
             # 这里可以添加更详细的提示逻辑
         
         loop_entry.bind("<Enter>", show_loop_tooltip)
@@ -93,6 +116,10 @@ class VariableRow:
         
         # 数据源配置区域
         self.create_source_config_area()
+
+        # 检查结果和规模估算
+        self.status_label = ttk.Label(self.frame, text="", foreground="gray")
+        self.status_label.grid(row=2, column=0, columnspan=11, sticky=tk.W, pady=(3, 0))
     
     def create_source_config_area(self):
         """创建数据源配置区域"""
@@ -113,6 +140,8 @@ class VariableRow:
             self.create_charset_config()
         elif source_type == "来自代码":
             self.create_code_config()
+        elif source_type in STRUCTURED_SOURCES:
+            self.create_structure_config()
     
     def create_range_config(self):
         """创建数据范围配置"""
@@ -126,6 +155,11 @@ class VariableRow:
         max_entry = ttk.Entry(self.source_config_frame, textvariable=self.range_max, width=10)
         max_entry.grid(row=0, column=3, sticky=tk.W, padx=(5, 0))
         
+        # 整数类型可以选择不重复取值（循环生成的值互不相同）
+        if self.data_type.get() == "整数":
+            ttk.Checkbutton(self.source_config_frame, text="不重复", variable=self.distinct).grid(
+                row=0, column=4, sticky=tk.W, padx=(20, 0))
+        
         # 如果是字符串类型，添加长度配置
         if self.data_type.get() == "字符串":
             ttk.Label(self.source_config_frame, text="长度:").grid(row=0, column=4, sticky=tk.W, padx=(20, 5))
@@ -133,7 +167,7 @@ class VariableRow:
             length_entry.grid(row=0, column=5, sticky=tk.W)
             
             # 添加长度格式说明
-            length_example = "长度格式: 10 (固定) 或 1,10 (随机1-10) 或 1,n (使用变量n)"
+            length_example = "长度格式: 10 (固定) 或 1,10 (随机1-10) 或 1,n (使用变量n)，可用表达式如 2*n"
             ttk.Label(self.source_config_frame, text=length_example, foreground="blue").grid(row=1, column=4, columnspan=2, sticky=tk.W, pady=(2, 0))
     
     def create_choice_config(self):
@@ -143,8 +177,12 @@ class VariableRow:
         choice_entry = ttk.Entry(self.source_config_frame, textvariable=self.choice_list, width=50)
         choice_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 10))
         
+        # 勾选后每个选项写成 "值:权重"
+        ttk.Checkbutton(self.source_config_frame, text="按权重", variable=self.weighted).grid(
+            row=0, column=2, sticky=tk.W)
+        
         # 示例标签
-        example_text = "例如: apple,banana,orange 或 1,2,3,4,5"
+        example_text = "例如: apple,banana,orange 或 1,2,3,4,5；按权重: 0:90%,1:10%"
         ttk.Label(self.source_config_frame, text=example_text, foreground="gray").grid(row=1, column=1, sticky=tk.W, pady=(2, 0))
     
     def create_charset_config(self):
@@ -166,9 +204,40 @@ class VariableRow:
         
         # 如果是字符串类型，添加长度格式说明
         if self.data_type.get() == "字符串":
-            length_example = "长度格式: 10 (固定长度) 或 1,10 (随机长度1-10) 或 1,n (使用变量n)"
+            length_example = "长度格式: 10 (固定长度) 或 1,10 (随机长度1-10) 或 1,n (使用变量n)，可用表达式如 2*n"
             ttk.Label(self.source_config_frame, text=length_example, foreground="blue").grid(row=2, column=1, columnspan=3, sticky=tk.W, pady=(2, 0))
     
+    def create_structure_config(self):
+        """创建树、图、排列配置"""
+        source_type = self.source_type.get()
+        
+        size_label = "长度:" if source_type == "排列" else "节点数:"
+        ttk.Label(self.source_config_frame, text=size_label).grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
+        ttk.Entry(self.source_config_frame, textvariable=self.node_count, width=8).grid(row=0, column=1, sticky=tk.W, padx=(0, 10))
+        
+        if source_type == "树":
+            ttk.Label(self.source_config_frame, text="形态:").grid(row=0, column=2, sticky=tk.W, padx=(0, 5))
+            ttk.Combobox(self.source_config_frame, textvariable=self.tree_shape, values=TREE_SHAPES,
+                         state="readonly", width=10).grid(row=0, column=3, sticky=tk.W, padx=(0, 10))
+            ttk.Label(self.source_config_frame, text="输出:").grid(row=0, column=4, sticky=tk.W, padx=(0, 5))
+            ttk.Combobox(self.source_config_frame, textvariable=self.tree_format, values=TREE_FORMATS,
+                         state="readonly", width=10).grid(row=0, column=5, sticky=tk.W, padx=(0, 10))
+            ttk.Checkbutton(self.source_config_frame, text="打乱编号", variable=self.relabel).grid(row=0, column=6, sticky=tk.W)
+            example_text = "边列表每行一条边 \"u v\"，父节点数组依次输出节点 2..n 的父节点（以1为根）"
+        elif source_type == "图":
+            ttk.Label(self.source_config_frame, text="边数:").grid(row=0, column=2, sticky=tk.W, padx=(0, 5))
+            ttk.Entry(self.source_config_frame, textvariable=self.edge_count, width=8).grid(row=0, column=3, sticky=tk.W, padx=(0, 10))
+            ttk.Label(self.source_config_frame, text="类型:").grid(row=0, column=4, sticky=tk.W, padx=(0, 5))
+            ttk.Combobox(self.source_config_frame, textvariable=self.graph_type, values=GRAPH_TYPES,
+                         state="readonly", width=10).grid(row=0, column=5, sticky=tk.W)
+            example_text = "无自环、无重边，每条边输出为 \"u v\"，节点编号从1开始"
+        else:
+            example_text = "输出 1..n 的随机排列"
+        
+        # 示例标签
+        ttk.Label(self.source_config_frame, text=example_text + "；数量可填数字或变量名", foreground="gray").grid(
+            row=1, column=0, columnspan=7, sticky=tk.W, pady=(2, 0))
+    
     def create_code_config(self):
         """创建代码配置"""
         ttk.Label(self.source_config_frame, text="代码:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
@@ -247,16 +316,8 @@ class VariableRow:
         """数据类型改变时的回调"""
         data_type = self.data_type.get()
         
-        # 根据数据类型调整可用的来源类型
-        if data_type in ["整数", "浮点数"]:
-            # 数值类型支持数据范围、选择列表和来自代码
-            source_values = ["数据范围", "选择列表", "来自代码"]
-        elif data_type == "字符":
-            # 字符类型支持选择列表、字符集合和来自代码
-            source_values = ["选择列表", "字符集合", "来自代码"]
-        else:  # 字符串
-            # 字符串类型支持所有来源类型
-            source_values = ["数据范围", "选择列表", "字符集合", "来自代码"]
+        # 根据数据类型调整可用的来源类型（整数额外支持树、图、排列）
+        source_values = SUPPORTED_SOURCES.get(data_type, SUPPORTED_SOURCES["字符串"])
         
         # 更新来源类型下拉框
         source_combo = None
@@ -280,6 +341,37 @@ class VariableRow:
         """来源类型改变时的回调"""
         self.create_source_config_area()
     
+    def on_field_changed(self, *args):
+        """配置项被修改时通知主窗口重新检查"""
+        if self.change_callback:
+            self.change_callback()
+
+    def show_validation(self, result: Optional[Dict[str, Any]]):
+        """显示静态检查结果
+
+        Args:
+            result: validate_configs 返回的该变量的结果；为None表示配置不完整
+        """
+        if not self.status_label:
+            return
+
+        if result is None:
+            self.status_label.config(text="配置不完整，生成时将跳过该变量", foreground="gray")
+        elif result['errors']:
+            self.status_label.config(text="✗ " + "；".join(result['errors']), foreground="red")
+        else:
+            if result['values'] is None:
+                text = "无法估算规模"
+            elif result['bytes'] is None:
+                text = f"每组最多 {result['values']} 个值"
+            else:
+                text = f"每组最多 {result['values']} 个值，约 {format_size(result['bytes'])}"
+            if result['warnings']:
+                self.status_label.config(text="⚠ " + "；".join(result['warnings']) + f"（{text}）",
+                                         foreground="darkorange")
+            else:
+                self.status_label.config(text=text, foreground="gray")
+
     def get_config(self) -> Optional[Dict[str, Any]]:
         """获取变量配置"""
         var_name = self.var_name.get().strip()
@@ -303,6 +395,8 @@ class VariableRow:
                 config['max_value'] = self.range_max.get().strip()
                 if self.data_type.get() == "字符串":
                     config['string_length'] = self.string_length.get().strip()
+                elif self.data_type.get() == "整数" and self.distinct.get():
+                    config['distinct'] = True
             except ValueError:
                 return None
                 
@@ -311,6 +405,8 @@ class VariableRow:
             if not choices:
                 return None
             config['choices'] = [choice.strip() for choice in choices.split(',') if choice.strip()]
+            if self.weighted.get():
+                config['weighted'] = True
             
         elif source_type == "字符集合":
             charset = self.char_set.get().strip()
@@ -325,6 +421,22 @@ class VariableRow:
             if not code:
                 return None
             config['custom_code'] = code
+            
+        elif source_type in STRUCTURED_SOURCES:
+            node_count = self.node_count.get().strip()
+            if not node_count:
+                return None
+            config['node_count'] = node_count
+            if source_type == "树":
+                config['tree_shape'] = self.tree_shape.get()
+                config['tree_format'] = self.tree_format.get()
+                config['relabel'] = self.relabel.get()
+            elif source_type == "图":
+                edge_count = self.edge_count.get().strip()
+                if not edge_count:
+                    return None
+                config['edge_count'] = edge_count
+                config['graph_type'] = self.graph_type.get()
         
         return config
     
@@ -362,11 +474,13 @@ class VariableRow:
                 self.range_max.set(config['max_value'])
             if 'string_length' in config:
                 self.string_length.set(str(config['string_length']))
+            self.distinct.set(bool(config.get('distinct', False)))
                 
         elif source_type == '选择列表':
             if 'choices' in config:
                 choices_str = ','.join(map(str, config['choices']))
                 self.choice_list.set(choices_str)
+            self.weighted.set(bool(config.get('weighted', False)))
                 
         elif source_type == '字符集合':
             if 'charset' in config:
@@ -377,6 +491,20 @@ class VariableRow:
         elif source_type == '来自代码':
             if 'custom_code' in config:
                 self.custom_code.set(config['custom_code'])
+                
+        elif source_type in STRUCTURED_SOURCES:
+            if 'node_count' in config:
+                self.node_count.set(str(config['node_count']))
+            if 'edge_count' in config:
+                self.edge_count.set(str(config['edge_count']))
+            if 'tree_shape' in config:
+                self.tree_shape.set(config['tree_shape'])
+            if 'tree_format' in config:
+                self.tree_format.set(config['tree_format'])
+            if 'graph_type' in config:
+                self.graph_type.set(config['graph_type'])
+            if 'relabel' in config:
+                self.relabel.set(bool(config['relabel']))
         
         # 重新创建数据源配置区域以反映更改
         self.create_source_config_area()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+启动耗时测量脚本 - 跟踪 TkMain 的导入耗时和首帧耗时
+
+使用方法:
+1. 导入耗时汇总: python startup_benchmark.py
+2. 显示更多模块: python startup_benchmark.py --top 30
+3. 同时测量首帧耗时(需要图形界面): python startup_benchmark.py --first-frame
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 这些模块应当按需加载，出现在启动导入链中说明懒加载被破坏
+LAZY_MODULES = ['requests', 'keyring', 'deepseek_api.deepseek_dialog', 'deepseek_api.deepseek_client',
+                'gui.SyntaxHighlighter', 'gui.auto_completion', 'gui.code_editor']
+
+
+def measure_import_time(module="gui.main_window"):
+    """使用 -X importtime 导入模块，返回 [(模块名, 自身耗时us, 累计耗时us)]"""
+    cmd = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    proc = subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True)
+
+    records = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 表头行
+        self_us = int(parts[0].strip())
+        cumulative_us = int(parts[1].strip())
+        name = parts[2].strip()
+        records.append((name, self_us, cumulative_us))
+
+    if proc.returncode != 0:
+        print(f"导入 {module} 失败:\n{proc.stderr.splitlines()[-1] if proc.stderr else ''}")
+    return records
+
+
+def measure_first_frame():
+    """启动 TkMain 并读取首帧耗时（毫秒），返回 (首帧耗时, 进程总耗时)"""
+    env = dict(os.environ, TKTOOL_STARTUP_PROFILE="1")
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, os.path.join(PROJECT_ROOT, "TkMain.py")],
+                          cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=60)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    for line in proc.stdout.splitlines():
+        if line.startswith("STARTUP_FIRST_FRAME_MS="):
+            return float(line.split("=", 1)[1]), wall_ms
+    return None, wall_ms
+
+
+def print_import_summary(records, top=15):
+    """打印导入耗时汇总"""
+    if not records:
+        print("没有获取到导入耗时数据")
+        return
+
+    total_us = sum(self_us for _, self_us, _ in records)
+    print(f"导入模块数: {len(records)}，导入总耗时: {total_us / 1000:.1f} ms")
+    print(f"\n累计耗时最高的 {top} 个模块:")
+    for name, self_us, cumulative_us in sorted(records, key=lambda r: r[2], reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  (自身 {self_us / 1000:6.1f} ms)  {name}")
+
+    loaded = {name for name, _, _ in records}
+    eager = [name for name in LAZY_MODULES if name in loaded]
+    if eager:
+        print(f"\n警告: 以下模块应按需加载，却在启动时被导入: {', '.join(eager)}")
+    else:
+        print("\n按需加载的模块均未在启动时导入")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='启动耗时测量脚本')
+    parser.add_argument('--module', '-m', default='gui.main_window', help='要测量导入耗时的模块')
+    parser.add_argument('--top', '-n', type=int, default=15, help='显示累计耗时最高的模块数量')
+    parser.add_argument('--first-frame', '-f', action='store_true', help='同时测量首帧耗时（需要图形界面）')
+
+    args = parser.parse_args()
+
+    print_import_summary(measure_import_time(args.module), args.top)
+
+    if args.first_frame:
+        first_frame_ms, wall_ms = measure_first_frame()
+        if first_frame_ms is None:
+            print(f"\n未能获取首帧耗时（进程耗时 {wall_ms:.1f} ms），请确认有可用的图形界面")
+        else:
+            print(f"\n首帧耗时: {first_frame_ms:.1f} ms（含解释器启动的进程总耗时 {wall_ms:.1f} ms）")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,25 @@
 功能：管理数据生成模板的加载、保存和应用
 """
 
+import copy
 import json
 import os
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+from core.structured_generators import STRUCTURED_SOURCES
+
+
+# 目录索引文件名，不以.json结尾，避免被当作用户模板加载
+CATALOG_FILE_NAME = ".catalog_index"
+# 2: 条目中不再保存绝对路径，移动程序目录后索引仍然有效
+CATALOG_VERSION = 2
+
+# 变量摘要中保留的字段（不含自定义代码等大字段），供列表展示和搜索使用
+SUMMARY_FIELDS = ('name', 'data_type', 'source_type', 'separator', 'loop_count',
+                  'min_value', 'max_value', 'string_length', 'charset')
+SUMMARY_MAX_CHOICES = 10
+
 
 class TemplateManager:
     """模板管理器类"""
@@ -19,6 +33,16 @@ class TemplateManager:
         self.default_templates_file = self.templates_dir / "default_templates.json"
         self.user_templates_dir = self.templates_dir / "user_templates"
         self.user_templates_dir.mkdir(exist_ok=True)
+        self.catalog_file = self.user_templates_dir / CATALOG_FILE_NAME
+
+        # 用户模板目录索引 {文件名: 目录条目}，首次使用时从索引文件加载
+        self._catalog = None
+        # 已加载的完整用户模板 {文件名: (mtime_ns, 模板数据)}
+        self._template_cache = {}
+        # 默认模板缓存 (mtime_ns, 模板列表)
+        self._default_cache = None
+        # 搜索索引缓存 (目录签名, 索引)
+        self._search_cache = None
 
     def load_default_templates(self) -> List[Dict[str, Any]]:
         """加载默认模板
@@ -27,9 +51,15 @@ class TemplateManager:
             默认模板列表
         """
         try:
+            mtime_ns = self.default_templates_file.stat().st_mtime_ns
+            if self._default_cache is not None and self._default_cache[0] == mtime_ns:
+                return copy.deepcopy(self._default_cache[1])
+
             with open(self.default_templates_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                return data.get('templates', [])
+                templates = data.get('templates', [])
+            self._default_cache = (mtime_ns, templates)
+            return copy.deepcopy(templates)
         except Exception as e:
             print(f"加载默认模板失败: {e}")
             return []
@@ -42,16 +72,176 @@ class TemplateManager:
         """
         templates = []
 
+        for entry in self.get_user_catalog():
+            template_data = self.load_template_detail(entry)
+            if template_data is not None:
+                templates.append(template_data)
+
+        return templates
+
+    def get_user_catalog(self) -> List[Dict[str, Any]]:
+        """获取用户模板目录（增量刷新）
+        
+        只对修改时间或大小发生变化的文件重新解析，其余直接使用索引中的条目。
+        目录条目包含名称、描述、修改时间和变量摘要，不含完整变量配置。
+        
+        Returns:
+            按文件名排序的目录条目列表（副本，修改不影响缓存）
+        """
+        catalog = self._load_catalog()
+        refreshed = {}
+        changed = False
+
         try:
-            for template_file in self.user_templates_dir.glob("*.json"):
-                with open(template_file, 'r', encoding='utf-8') as f:
-                    template_data = json.load(f)
-                    template_data['file_path'] = str(template_file)
-                    templates.append(template_data)
+            with os.scandir(self.user_templates_dir) as entries:
+                for dir_entry in entries:
+                    if not dir_entry.name.endswith('.json') or not dir_entry.is_file():
+                        continue
+
+                    stat = dir_entry.stat()
+                    cached = catalog.get(dir_entry.name)
+                    if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                        refreshed[dir_entry.name] = cached
+                        continue
+
+                    entry = self._build_catalog_entry(Path(dir_entry.path), stat)
+                    if entry is not None:
+                        refreshed[dir_entry.name] = entry
+                    changed = True
+        except Exception as e:
+            print(f"扫描用户模板目录失败: {e}")
+            return [copy.deepcopy(catalog[name]) for name in sorted(catalog)]
+
+        if changed or refreshed.keys() != catalog.keys():
+            self._save_catalog(refreshed)
+        self._catalog = refreshed
+
+        return [copy.deepcopy(refreshed[name]) for name in sorted(refreshed)]
+
+    def get_template_catalog(self) -> Dict[str, List[Dict[str, Any]]]:
+        """获取模板目录，用于快速列出模板
+        
+        Returns:
+            包含默认模板和用户模板目录条目的字典，用户模板的完整变量需通过 load_template_detail 加载
+        """
+        return {
+            'default': self.load_default_templates(),
+            'user': self.get_user_catalog()
+        }
+
+    def get_search_index(self, catalog: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        """获取模板搜索索引，模板目录未变化时复用已建立的索引
+        
+        Args:
+            catalog: 模板目录，省略时自动获取
+            
+        Returns:
+            TemplateSearchIndex 实例
+        """
+        from .template_search import TemplateSearchIndex
+
+        if catalog is None:
+            catalog = self.get_template_catalog()
+
+        signature = (self._default_cache[0] if self._default_cache else None,
+                     tuple((entry['file_name'], entry['mtime_ns']) for entry in catalog['user']))
+        if self._search_cache is not None and self._search_cache[0] == signature:
+            return self._search_cache[1]
+
+        index = TemplateSearchIndex()
+        index.build([('default', template) for template in catalog['default']] +
+                    [('user', entry) for entry in catalog['user']])
+        self._search_cache = (signature, index)
+        return index
+
+    def load_template_detail(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """按需加载模板的完整数据
+        
+        Args:
+            entry: 目录条目（默认模板直接返回自身）
+            
+        Returns:
+            完整模板数据（副本，修改不影响缓存），加载失败返回None
+        """
+        if 'variables' in entry:
+            return entry
+
+        file_name = entry.get('file_name')
+        # 路径每次由模板目录和文件名得到，程序目录移动或复制后仍能加载
+        template_file = self.user_templates_dir / file_name
+        cached = self._template_cache.get(file_name)
+        if cached and cached[0] == entry.get('mtime_ns'):
+            template_data = copy.deepcopy(cached[1])
+            template_data['file_path'] = str(template_file)
+            return template_data
+
+        try:
+            with open(template_file, 'r', encoding='utf-8') as f:
+                template_data = json.load(f)
+            self._template_cache[file_name] = (entry.get('mtime_ns'), copy.deepcopy(template_data))
+            template_data['file_path'] = str(template_file)
+            return template_data
         except Exception as e:
             print(f"加载用户模板失败: {e}")
+            return None
 
-        return templates
+    def _build_catalog_entry(self, template_file: Path, stat) -> Optional[Dict[str, Any]]:
+        """解析模板文件并生成目录条目"""
+        try:
+            with open(template_file, 'r', encoding='utf-8') as f:
+                template_data = json.load(f)
+        except Exception as e:
+            print(f"加载用户模板失败: {template_file.name}: {e}")
+            return None
+
+        variables = template_data.get('variables', [])
+
+        return {
+            'file_name': template_file.name,
+            'name': template_data.get('name', template_file.stem),
+            'description': template_data.get('description', ''),
+            'created_time': template_data.get('created_time', ''),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'variable_count': len(variables) if isinstance(variables, list) else 0,
+            'variable_summary': [self._summarize_variable(var) for var in variables
+                                 if isinstance(var, dict)] if isinstance(variables, list) else []
+        }
+
+    def _summarize_variable(self, variable: Dict[str, Any]) -> Dict[str, Any]:
+        """生成变量摘要，省略自定义代码等大字段"""
+        summary = {key: variable[key] for key in SUMMARY_FIELDS if key in variable}
+        choices = variable.get('choices')
+        if choices:
+            summary['choices'] = list(choices[:SUMMARY_MAX_CHOICES])
+            summary['choice_count'] = len(choices)
+        return summary
+
+    def _load_catalog(self) -> Dict[str, Dict[str, Any]]:
+        """加载目录索引（进程内只读取一次索引文件）"""
+        if self._catalog is not None:
+            return self._catalog
+
+        self._catalog = {}
+        try:
+            if self.catalog_file.exists():
+                with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == CATALOG_VERSION:
+                    self._catalog = data.get('entries', {})
+        except Exception as e:
+            print(f"加载模板索引失败，将重新建立: {e}")
+        return self._catalog
+
+    def _save_catalog(self, catalog: Dict[str, Dict[str, Any]]):
+        """保存目录索引，先写临时文件再替换"""
+        try:
+            temp_file = self.catalog_file.with_name(CATALOG_FILE_NAME + '.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': CATALOG_VERSION, 'entries': catalog}, f, ensure_ascii=False)
+            os.replace(temp_file, self.catalog_file)
+        except Exception as e:
+            print(f"保存模板索引失败: {e}")
 
     def get_all_templates(self) -> Dict[str, List[Dict[str, Any]]]:
         """获取所有模板
@@ -127,17 +317,15 @@ class TemplateManager:
         Returns:
             模板数据，如果不存在返回None
         """
-        all_templates = self.get_all_templates()
-
         # 先在默认模板中查找
-        for template in all_templates['default']:
+        for template in self.load_default_templates():
             if template['name'] == template_name:
                 return template
 
-        # 再在用户模板中查找
-        for template in all_templates['user']:
-            if template['name'] == template_name:
-                return template
+        # 再在用户模板目录中查找，只加载命中的模板
+        for entry in self.get_user_catalog():
+            if entry['name'] == template_name:
+                return self.load_template_detail(entry)
 
         return None
 
@@ -203,7 +391,7 @@ class TemplateManager:
 
         # 检查来源类型
         if 'source_type' in variable:
-            valid_sources = ['数据范围', '选择列表', '字符集合']
+            valid_sources = ['数据范围', '选择列表', '字符集合'] + STRUCTURED_SOURCES
             if variable['source_type'] not in valid_sources:
                 errors.append(f"变量 {index + 1} 来源类型无效: {variable['source_type']}")
 
@@ -218,6 +406,11 @@ class TemplateManager:
         elif source_type == '字符集合':
             if 'charset' not in variable or not variable['charset']:
                 errors.append(f"变量 {index + 1} 字符集合不能为空")
+        elif source_type in STRUCTURED_SOURCES:
+            if not variable.get('node_count'):
+                errors.append(f"变量 {index + 1} 缺少节点数")
+            if source_type == '图' and variable.get('edge_count') in (None, ''):
+                errors.append(f"变量 {index + 1} 缺少边数")
 
         return errors
 
@@ -309,9 +502,9 @@ class TemplateManager:
         Returns:
             包含默认模板和用户模板名称的字典
         """
-        all_templates = self.get_all_templates()
+        catalog = self.get_template_catalog()
 
         return {
-            'default': [t['name'] for t in all_templates['default']],
-            'user': [t['name'] for t in all_templates['user']]
+            'default': [t['name'] for t in catalog['default']],
+            'user': [t['name'] for t in catalog['user']]
         }
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+模板搜索索引
+功能：对模板名称、描述和变量属性建立倒排索引，支持边输入边搜索
+"""
+
+import re
+import math
+from bisect import bisect_left
+from typing import List, Dict, Any, Tuple, Optional
+
+# 各字段的权重：名称最重要，其次是变量结构，最后是描述
+FIELD_WEIGHTS = {
+    'name': 3.0,
+    'structure': 1.5,
+    'description': 1.0,
+}
+
+# 查询中没有区分度的常见英文词
+STOP_WORDS = {'a', 'an', 'the', 'with', 'up', 'to', 'of', 'in', 'on', 'for', 'and', 'or', 'is', 'at', 'by'}
+
+# 英文查询词对应的中文词条，便于用英文搜索中文模板
+SYNONYMS = {
+    'tree': ['树'], 'graph': ['图'], 'edge': ['边'], 'array': ['数组'], 'matrix': ['矩阵'],
+    'string': ['字符串'], 'char': ['字符'], 'int': ['整数'], 'integer': ['整数'], 'float': ['浮点数'],
+    'permutation': ['排列'], 'range': ['数据范围'], 'choice': ['选择列表'], 'charset': ['字符集合'],
+    'point': ['坐标'], 'loop': ['循环'],
+}
+
+# 前缀匹配最多展开的词条数量，保证输入很短时也能快速返回
+MAX_PREFIX_EXPANSION = 64
+
+# 结构化过滤词，如 type:整数、source:数据范围、loop:n、max:1e5
+_FIELD_TOKEN_RE = re.compile(r'(\w+):(\S+)')
+# 数字（支持 1e5、10^9、-3、0.5）、英文标识符、单个中日韩字符
+_TOKEN_RE = re.compile(r'-?\d+(?:\.\d+)?(?:[eE]\d+|\^\d+)?|[a-zA-Z_][a-zA-Z0-9_]*|[一-鿿]')
+
+
+def normalize_number(text: str) -> Optional[str]:
+    """将数字写法统一为标准形式，如 1e5、10^5、100000 都变为 100000"""
+    try:
+        if '^' in text:
+            base, exponent = text.split('^', 1)
+            value = int(base) ** int(exponent)
+        elif 'e' in text or 'E' in text:
+            value = float(text)
+        else:
+            value = float(text) if '.' in text else int(text)
+    except (ValueError, OverflowError):
+        return None
+
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def tokenize(text: Any) -> List[str]:
+    """将文本切分为索引词条
+
+    英文转为小写，数字统一格式，中文按单字和相邻双字切分。
+    """
+    if text is None:
+        return []
+    text = str(text)
+    tokens = []
+
+    for match in _FIELD_TOKEN_RE.finditer(text):
+        field, value = match.group(1).lower(), match.group(2)
+        number = normalize_number(value)
+        tokens.append(f"{field}:{number if number is not None else value.lower()}")
+    text = _FIELD_TOKEN_RE.sub(' ', text)
+
+    previous_cjk = None
+    for match in _TOKEN_RE.finditer(text):
+        token = match.group(0)
+        if '一' <= token[0] <= '鿿':
+            tokens.append(token)
+            # 与前一个相邻的汉字组成双字词，提高中文短语的匹配精度
+            if previous_cjk is not None and previous_cjk[1] == match.start():
+                tokens.append(previous_cjk[0] + token)
+            previous_cjk = (token, match.end())
+            continue
+
+        previous_cjk = None
+        if token[0].isdigit() or token[0] == '-':
+            number = normalize_number(token)
+            tokens.append(number if number is not None else token)
+        else:
+            tokens.append(token.lower())
+
+    return tokens
+
+
+def variable_structure_tokens(variable: Dict[str, Any]) -> List[str]:
+    """生成变量属性的索引词条（包含普通词条和 字段:值 形式的结构化词条）"""
+    tokens = []
+
+    name = variable.get('name')
+    if name:
+        tokens.extend(tokenize(name))
+        tokens.append(f"var:{str(name).lower()}")
+
+    for field, key in (('type', 'data_type'), ('source', 'source_type')):
+        value = variable.get(key)
+        if value:
+            tokens.extend(tokenize(value))
+            tokens.append(f"{field}:{value}")
+
+    for field, key in (('min', 'min_value'), ('max', 'max_value')):
+        value = variable.get(key)
+        if value is None or value == '':
+            continue
+        value_tokens = tokenize(value)
+        tokens.extend(value_tokens)
+        tokens.extend(f"{field}:{token}" for token in value_tokens)
+
+    loop_count = variable.get('loop_count')
+    if loop_count not in (None, '', 1, '1'):
+        loop_tokens = tokenize(loop_count)
+        tokens.extend(loop_tokens)
+        tokens.extend(f"loop:{token}" for token in loop_tokens)
+
+    for key in ('string_length', 'charset'):
+        if variable.get(key):
+            tokens.extend(tokenize(variable[key]))
+
+    for choice in variable.get('choices', []) or []:
+        tokens.extend(tokenize(choice))
+
+    return tokens
+
+
+class TemplateSearchIndex:
+    """模板倒排索引
+
+    每个词条记录包含它的模板及加权词频，查询时按 TF-IDF 打分，
+    最后一个查询词按前缀匹配，以支持边输入边搜索。
+    """
+
+    def __init__(self):
+        self.documents = []  # [(模板类型, 模板或目录条目)]
+        self.postings = {}  # {词条: {文档编号: 加权词频}}
+        self.vocabulary = []  # 排序后的词条，用于前缀查找
+
+    def build(self, documents: List[Tuple[str, Dict[str, Any]]]):
+        """建立索引
+
+        Args:
+            documents: [(模板类型, 模板数据或目录条目)]，变量信息取自 variables 或 variable_summary
+        """
+        self.documents = list(documents)
+        self.postings = {}
+
+        for doc_id, (_, template) in enumerate(self.documents):
+            fields = {
+                'name': tokenize(template.get('name', '')),
+                'description': tokenize(template.get('description', '')),
+                'structure': [],
+            }
+            variables = template.get('variables') or template.get('variable_summary') or []
+            for variable in variables:
+                if isinstance(variable, dict):
+                    fields['structure'].extend(variable_structure_tokens(variable))
+
+            for field, tokens in fields.items():
+                weight = FIELD_WEIGHTS[field]
+                for token in tokens:
+                    doc_weights = self.postings.setdefault(token, {})
+                    doc_weights[doc_id] = doc_weights.get(doc_id, 0.0) + weight
+
+        self.vocabulary = sorted(self.postings)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """搜索模板
+
+        Args:
+            query: 查询文本，可包含 type:整数、source:数据范围、loop:n、max:1e5 等结构化条件
+            limit: 最多返回的结果数量
+
+        Returns:
+            按相关度排序的 [(模板类型, 模板数据或目录条目)]；查询为空时按原顺序返回全部
+        """
+        query_tokens = [token for token in tokenize(query) if token not in STOP_WORDS]
+        if not query_tokens:
+            results = self.documents
+            return results[:limit] if limit else list(results)
+
+        total = len(self.documents)
+        scores = {}
+        matched_terms = {}
+
+        for position, token in enumerate(query_tokens):
+            # 最后一个词可能还没输入完整，按前缀匹配
+            if position == len(query_tokens) - 1:
+                terms = self._expand_prefix(token)
+            else:
+                terms = [token] if token in self.postings else self._expand_prefix(token)
+            terms.extend(synonym for synonym in SYNONYMS.get(token, []) if synonym in self.postings)
+
+            token_scores = {}
+            for term in terms:
+                doc_weights = self.postings[term]
+                idf = math.log(1 + total / len(doc_weights))
+                # 前缀匹配和同义词的得分略低于完全匹配
+                factor = 1.0 if term == token else 0.6
+                for doc_id, weight in doc_weights.items():
+                    score = weight * idf * factor
+                    if score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = score
+
+            for doc_id, score in token_scores.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+                matched_terms[doc_id] = matched_terms.get(doc_id, 0) + 1
+
+        # 命中的查询词越多越靠前，其次按得分，最后保持原顺序
+        ranked = sorted(scores, key=lambda doc_id: (-matched_terms[doc_id], -scores[doc_id], doc_id))
+        if limit:
+            ranked = ranked[:limit]
+        return [self.documents[doc_id] for doc_id in ranked]
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """查找以指定前缀开头的词条"""
+        terms = []
+        index = bisect_left(self.vocabulary, prefix)
+        while index < len(self.vocabulary) and len(terms) < MAX_PREFIX_EXPANSION:
+            term = self.vocabulary[index]
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+            index += 1
+        return terms
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试字符集的区间表示和大字符集的随机生成
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.charset import parse_charset
+from core.data_generator_core import DataGeneratorCore
+
+
+def test_charset():
+    """测试区间解析、按编号取字符、缓存和大字符集的生成耗时"""
+    print("=== 测试字符集 ===")
+
+    print("\n1. 区间解析")
+    for definition in ['a-z', 'a-zA-Z0-9', 'abc123', 'aab', '一-龥']:
+        charset = parse_charset(definition)
+        print(f"   {definition}: {len(charset.starts)} 个区间，共 {charset.size} 个字符")
+
+    charset = parse_charset('a-zA-Z0-9')
+    status = "✓" if charset.expand() == ''.join(sorted('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')) else "✗"
+    print(f"   按编号展开与逐个列举一致: {status}")
+    print(f"   相同定义只解析一次: {'✓' if parse_charset('a-zA-Z0-9') is charset else '✗'}")
+
+    print("\n2. 重复字符按出现次数计权（与展开后的字符串一致）")
+    chars = parse_charset('aab').random_chars(DataGeneratorCore().random, 30000)
+    print(f"   'a' 的比例 {chars.count('a') / len(chars):.3f}（约 0.667）")
+
+    print("\n3. 中文字符集生成")
+    generator = DataGeneratorCore()
+    config = {'name': 's', 'data_type': '字符串', 'source_type': '字符集合', 'separator': '换行',
+              'charset': '一-龥', 'string_length': '20', 'loop_count': 50000}
+    start = time.perf_counter()
+    lines = generator.generate_test_data([config], 1)[0].split('\n')
+    elapsed = (time.perf_counter() - start) * 1000
+    status = "✓" if all(len(line) == 20 and all('一' <= ch <= '龥' for ch in line) for line in lines) else "✗"
+    print(f"   {len(lines)} 个长度为20的字符串 {status}，耗时 {elapsed:.0f} ms")
+
+    print("\n4. 空字符集报错")
+    try:
+        generator.generate_test_data([dict(config, charset='z-a')], 1)
+        print("   ✗ 没有报错")
+    except ValueError as e:
+        print(f"   ✓ {e}")
+
+
+if __name__ == "__main__":
+    test_charset()
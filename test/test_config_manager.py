@@ -61,6 +61,10 @@ def test_config_manager():
         config_path = config_manager.get_config_file_path()
         print(f"配置文件路径: {config_path}")
         
+        # 等待延迟写入完成，再清理临时目录
+        config_manager.flush()
+        print(f"配置文件已写入: {config_manager.config_file.exists()}")
+
         print("\n配置管理器测试完成！")
         
     finally:
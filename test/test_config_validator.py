@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试配置静态检查和规模估算
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_generator_core import DataGeneratorCore
+from core.config_validator import validate_configs
+
+
+def test_config_validator():
+    """测试错误检查、规模估算和检查耗时"""
+    print("=== 测试配置静态检查 ===")
+
+    print("\n1. 能确定会失败的配置")
+    invalid_cases = [
+        ("引用后面的变量", [{'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+                              'loop_count': 'n', 'min_value': 1, 'max_value': 9},
+                             {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+                              'loop_count': 1, 'min_value': 1, 'max_value': 9}]),
+        ("表达式语法错误", [{'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+                              'loop_count': 1, 'min_value': 1, 'max_value': '10**'}]),
+        ("字符集为空", [{'name': 's', 'data_type': '字符', 'source_type': '字符集合', 'separator': '空格',
+                          'loop_count': 1, 'charset': 'z-a'}]),
+        ("不重复取值超出范围", [{'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+                                  'loop_count': 20, 'min_value': 1, 'max_value': 10, 'distinct': True}]),
+        ("边数超过上限", [{'name': 'g', 'data_type': '整数', 'source_type': '图', 'separator': '换行',
+                            'loop_count': 1, 'node_count': 4, 'edge_count': 7}]),
+        ("引用多值变量", [{'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+                            'loop_count': 3, 'min_value': 1, 'max_value': 9},
+                           {'name': 'b', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+                            'loop_count': 'a', 'min_value': 1, 'max_value': 9}]),
+        ("代码语法错误", [{'name': 'c', 'data_type': '整数', 'source_type': '来自代码', 'separator': '空格',
+                            'loop_count': 1, 'custom_code': 'def generate_data(:\n    return 1'}]),
+        ("类型与来源不匹配", [{'name': 'c', 'data_type': '字符', 'source_type': '数据范围', 'separator': '空格',
+                                'loop_count': 1, 'min_value': 1, 'max_value': 9}]),
+    ]
+    for label, configs in invalid_cases:
+        report = validate_configs(configs)
+        errors = [error for result in report['variables'] for error in result['errors']]
+        status = "✓" if not report['valid'] and errors else "✗"
+        print(f"   {status} {label}: {errors}")
+
+    print("\n2. 警告不影响有效性")
+    report = validate_configs([{'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+                                'loop_count': 1, 'min_value': 5, 'max_value': 5}])
+    status = "✓" if report['valid'] and report['variables'][0]['warnings'] else "✗"
+    print(f"   {status} {report['variables'][0]['warnings']}")
+
+    print("\n3. 按上界估算规模（n ≤ 10^5 的数组和树）")
+    configs = [
+        {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+         'loop_count': 1, 'min_value': 1, 'max_value': '10**5'},
+        {'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+         'loop_count': 'n', 'min_value': 1, 'max_value': '10^9'},
+        {'name': 't', 'data_type': '整数', 'source_type': '树', 'separator': '换行',
+         'loop_count': 1, 'node_count': 'n'},
+    ]
+    report = validate_configs(configs)
+    print(f"   每组最多 {report['estimated_values']} 个值，约 {report['estimated_bytes']} 字节，"
+          f"预计 {report['estimated_seconds']:.3f} 秒")
+
+    # 估算应不小于实际生成的大小
+    generator = DataGeneratorCore()
+    configs[0]['min_value'] = configs[0]['max_value']
+    actual = len(generator.generate_test_bytes(configs, 1)[0])
+    status = "✓" if actual <= report['estimated_bytes'] else "✗"
+    print(f"   {status} 实际生成 {actual} 字节")
+
+    print("\n4. 单个配置按完整的变量列表解析引用")
+    ok = generator.validate_config(configs[1], configs) and not generator.validate_config(configs[1])
+    print(f"   {'✓' if ok else '✗'} 引用 n 的数组在完整列表中有效，单独检查时引用无法解析")
+
+    print("\n5. 检查耗时（不生成数据）")
+    configs = [dict(configs[1], loop_count=10 ** 9)]
+    start = time.perf_counter()
+    for _ in range(1000):
+        validate_configs(configs)
+    print(f"   循环次数为 10^9 的配置检查1000次，耗时 {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    test_config_validator()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试配置的延迟合并写入和原子替换
+"""
+
+import sys
+import os
+import json
+import time
+import shutil
+import tempfile
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config_manager import ConfigManager, FLUSH_DELAY
+
+
+def make_manager(temp_dir):
+    """创建使用临时目录的配置管理器"""
+    config_manager = ConfigManager()
+    config_manager.config_dir = Path(temp_dir)
+    config_manager.config_file = Path(temp_dir) / 'user_preferences.json'
+    return config_manager
+
+
+def test_config_write_behind():
+    """测试多次保存合并为一次写盘"""
+    print("=== 测试配置延迟写入 ===")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        config_manager = make_manager(temp_dir)
+
+        print("\n1. 连续保存100次")
+        start = time.perf_counter()
+        for i in range(100):
+            config_manager.set_config_value('test_count', str(i))
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"耗时: {elapsed:.1f} ms")
+        print(f"保存后文件尚未写入: {not config_manager.config_file.exists()}")
+
+        print("\n2. 另一个实例读取共享缓存")
+        other_manager = make_manager(temp_dir)
+        print(f"读取到的test_count: {other_manager.get_config_value('test_count')}")
+
+        print(f"\n3. 等待 {FLUSH_DELAY} 秒后台写盘")
+        time.sleep(FLUSH_DELAY + 0.5)
+        with open(config_manager.config_file, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        status = "✓" if saved['test_count'] == '99' else "✗"
+        print(f"文件中的test_count: {saved['test_count']} {status}")
+
+        leftovers = [name for name in os.listdir(temp_dir) if name.endswith('.tmp')]
+        print(f"残留的临时文件: {leftovers}")
+
+        print("\n4. 外部修改文件后重新读取")
+        time.sleep(0.01)
+        with open(config_manager.config_file, 'w', encoding='utf-8') as f:
+            json.dump({'test_count': 'external'}, f)
+        print(f"读取到的test_count: {config_manager.get_config_value('test_count')}")
+
+        print("\n5. 立即写盘")
+        config_manager.save_config({'test_count': '7'})
+        print(f"写盘结果: {config_manager.flush()}")
+
+        print("\n6. 替换文件后保留原文件的权限")
+        os.chmod(config_manager.config_file, 0o644)
+        config_manager.save_config({'test_count': '8'})
+        config_manager.flush()
+        mode = config_manager.config_file.stat().st_mode & 0o777
+        status = "✓" if os.name == 'nt' or mode == 0o644 else "✗"
+        print(f"文件权限: {oct(mode)} {status}")
+
+        print("\n7. 后台写盘失败由下一次保存报告")
+        missing_dir = Path(temp_dir) / 'missing'
+        failing_manager = make_manager(temp_dir)
+        failing_manager.config_file = missing_dir / 'user_preferences.json'
+        first = failing_manager.save_config({'test_count': '1'})
+        time.sleep(FLUSH_DELAY + 0.5)
+        second = failing_manager.save_config({'test_count': '2'})
+        status = "✓" if first and not second and not failing_manager.flush() else "✗"
+        print(f"第一次保存: {first}，后台写盘失败后再次保存: {second} {status}")
+        missing_dir.mkdir()
+        status = "✓" if failing_manager.flush() and failing_manager.get_config_value('test_count') == '2' else "✗"
+        print(f"目录恢复后写盘成功 {status}")
+
+    finally:
+        shutil.rmtree(temp_dir)
+        print(f"\n已清理临时目录: {temp_dir}")
+
+
+if __name__ == "__main__":
+    test_config_write_behind()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试数据范围的不重复取值模式
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_generator_core import DataGeneratorCore
+
+
+def test_distinct_range():
+    """测试大范围内取不重复整数、生成排列以及数量超过范围时的报错"""
+    print("=== 测试不重复取值 ===")
+
+    generator = DataGeneratorCore()
+
+    print("\n1. 在 [1, 10^9] 中取约 10^5 个不重复整数")
+    configs = [
+        {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+         'min_value': '99999', 'max_value': '100000', 'loop_count': 1},
+        {'name': 'arr', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+         'min_value': '1', 'max_value': '1000000000', 'loop_count': 'n', 'distinct': True},
+    ]
+    start = time.perf_counter()
+    data = generator.generate_test_data(configs, 1)[0]
+    elapsed = (time.perf_counter() - start) * 1000
+    lines = data.split('\n')
+    values = lines[1].split(' ')
+    status = "✓" if len(values) == int(lines[0]) and len(set(values)) == len(values) else "✗"
+    print(f"   n = {lines[0]}，不重复值 {len(set(values))} 个，耗时 {elapsed:.1f} ms {status}")
+
+    print("\n2. 循环次数等于范围大小时生成排列")
+    perm_config = [{'name': 'p', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+                    'min_value': '1', 'max_value': '10', 'loop_count': 10, 'distinct': True}]
+    data = generator.generate_test_data(perm_config, 1)[0]
+    status = "✓" if sorted(map(int, data.split())) == list(range(1, 11)) else "✗"
+    print(f"   {data} {status}")
+
+    print("\n3. 循环次数超过范围大小时报错")
+    perm_config[0]['loop_count'] = 11
+    try:
+        generator.generate_test_data(perm_config, 1)
+        print("   ✗ 没有报错")
+    except ValueError as e:
+        print(f"   ✓ {e}")
+
+
+if __name__ == "__main__":
+    test_distinct_range()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试范围、长度和循环次数中的算术表达式
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_generator_core import DataGeneratorCore
+from core.generation_plan import build_plan
+
+
+def test_expression():
+    """测试表达式的编译、常量折叠、取值和报错"""
+    print("=== 测试算术表达式 ===")
+
+    generator = DataGeneratorCore()
+
+    print("\n1. 常量表达式在编译时求值")
+    plan = build_plan([{'name': 'x', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+                        'min_value': '-10^9', 'max_value': '10**9', 'loop_count': '2*3'}])
+    variable = plan.variables[0]
+    print(f"   最小值 {variable.min_value.constant}，最大值 {variable.max_value.constant}，"
+          f"循环次数 {variable.loop_count.constant}")
+
+    print("\n2. 引用前面变量的表达式")
+    configs = [
+        {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+         'min_value': '4', 'max_value': '9', 'loop_count': 1},
+        {'name': 'edges', 'data_type': '整数', 'source_type': '树', 'separator': '换行',
+         'node_count': 'n'},
+        {'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+         'min_value': 'n', 'max_value': '2*n', 'loop_count': 'max(1, n//2)'},
+    ]
+    for _ in range(5):
+        lines = generator.generate_test_data(configs, 1)[0].split('\n')
+        n = int(lines[0])
+        values = list(map(int, lines[-1].split()))
+        edge_count = len(lines) - 2
+        ok = edge_count == n - 1 and len(values) == max(1, n // 2) and all(n <= v <= 2 * n for v in values)
+        print(f"   n = {n}: {edge_count} 条边，{len(values)} 个值 {'✓' if ok else '✗'}")
+
+    print("\n3. 无效表达式在生成前报错")
+    for bad in ['n+', 'foo(n)', '__import__("os")', 'n.real', 'k*2', '1/0', 'max(5)', 'min(n)', 'abs(n, 1)',
+                '10**999*1.0']:
+        try:
+            build_plan([configs[0], dict(configs[2], max_value=bad)])
+            print(f"   ✗ {bad}: 没有报错")
+        except ValueError as e:
+            print(f"   ✓ {bad}: {e}")
+
+    print("\n4. 生成时计算出错报告变量和字段")
+    plan = build_plan([configs[0], dict(configs[2], max_value='10.0**(n*40)')])
+    try:
+        plan.variables[1].max_value.resolve([9, None])
+        print("   ✗ 没有报错")
+    except ValueError as e:
+        print(f"   ✓ {e}")
+
+    print("\n5. 每组求值耗时")
+    plan = build_plan(configs)
+    reference = plan.variables[2].loop_count
+    slots = [100000, None, None]
+    start = time.perf_counter()
+    for _ in range(100000):
+        reference.resolve(slots)
+    print(f"   max(1, n//2) 求值10万次: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    test_expression()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试生成计划：引用只解析一次，无效引用在生成前报错
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_generator_core import DataGeneratorCore
+from core.generation_plan import build_plan
+
+
+def test_generation_plan():
+    """测试依赖检查和按槽位取值"""
+    print("=== 测试生成计划 ===")
+
+    generator = DataGeneratorCore()
+
+    print("\n1. 合法的向前引用")
+    configs = [
+        {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+         'min_value': '3', 'max_value': '5', 'loop_count': 1},
+        {'name': 'arr', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+         'min_value': '1', 'max_value': 'n', 'loop_count': 'n'},
+        {'name': 's', 'data_type': '字符串', 'source_type': '字符集合', 'separator': '换行',
+         'charset': 'a-z', 'string_length': '1,n', 'loop_count': 1},
+    ]
+    plan = build_plan(configs)
+    print(f"   各变量依赖的位置: {[variable.dependencies for variable in plan.variables]}")
+    data = generator.generate_test_data(configs, 1)[0]
+    tokens = data.split()
+    n = int(tokens[0])
+    values = list(map(int, tokens[1:-1]))
+    status = "✓" if len(values) == n and max(values) <= n and 1 <= len(tokens[-1]) <= n else "✗"
+    print(f"   {data!r} {status}")
+
+    print("\n2. 无效引用在生成前报错")
+    bad_cases = [
+        ("引用后面的变量", [dict(configs[1]), dict(configs[0])]),
+        ("引用未定义的变量", [dict(configs[0], loop_count='k')]),
+        ("长度引用未定义的变量", [dict(configs[2], string_length='1,len')]),
+        ("格式错误", [dict(configs[0], max_value='10 +')]),
+    ]
+    for label, bad_configs in bad_cases:
+        try:
+            generator.generate_test_data(bad_configs, 1)
+            print(f"   ✗ {label}: 没有报错")
+        except ValueError as e:
+            print(f"   ✓ {label}: {e}")
+
+    print("\n3. 引用生成了多个值的变量时报错")
+    try:
+        generator.generate_test_data([dict(configs[0], loop_count=2), configs[1]], 1)
+        print("   ✗ 没有报错")
+    except ValueError as e:
+        print(f"   ✓ {e}")
+
+    print("\n4. 生成耗时")
+    big_configs = [
+        {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+         'min_value': '200000', 'max_value': '200001', 'loop_count': 1},
+        {'name': 'arr', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+         'min_value': '1', 'max_value': 'n', 'loop_count': 'n'},
+    ]
+    start = time.perf_counter()
+    generator.generate_test_data(big_configs, 1)
+    print(f"   n = 2×10^5 的数组: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    test_generation_plan()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试为已有数据包（目录或zip）重新生成 .out 文件
+"""
+
+import sys
+import os
+import zipfile
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.input_pack import InputPack, natural_key
+from core.file_manager_core import FileManagerCore
+from core.solution_runner import BuildCache
+
+DOUBLE_CODE = "def main():\n    return int(input_data) * 2\n"
+
+
+def test_input_pack():
+    """测试扫描、排序、目录和zip两种来源"""
+    print("=== 测试导入已有数据包 ===")
+
+    print("\n1. 按数字排序")
+    names = sorted(["case10.in", "case2.in", "case1.in"], key=natural_key)
+    status = "✓" if names == ["case1.in", "case2.in", "case10.in"] else "✗"
+    print(f"   {status} {names}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        solution = BuildCache(os.path.join(temp_dir, 'cache')).python_solution(DOUBLE_CODE)
+        file_manager = FileManagerCore()
+
+        print("\n2. 目录：.out 写在 .in 旁边，原有 .in 文件不删除")
+        pack_dir = os.path.join(temp_dir, 'old_pack')
+        os.makedirs(os.path.join(pack_dir, 'sub'))
+        for name, value in (("case1.in", 1), ("case2.in", 2), ("case10.in", 10), ("sub/extra.in", 7)):
+            with open(os.path.join(pack_dir, name), 'w', encoding='utf-8') as f:
+                f.write(f"{value}\n")
+        pack = InputPack(pack_dir)
+        result = file_manager.save_pack_with_solution_process(pack, solution, str(pack.default_output_dir()),
+                                                              delete_temp_files=True)
+        with zipfile.ZipFile(result['zip_file']) as zipf:
+            entries = sorted(zipf.namelist())
+            extra = zipf.read("sub/extra.out").decode('utf-8').strip()
+        inputs_kept = all(os.path.exists(os.path.join(pack_dir, name)) for name in pack.names)
+        outputs_deleted = not os.path.exists(os.path.join(pack_dir, 'case1.out'))
+        status = "✓" if extra == "14" and inputs_kept and outputs_deleted and len(entries) == 8 else "✗"
+        print(f"   {status} {pack.names}，sub/extra.out = {extra}，zip 中 {len(entries)} 个文件，"
+              f"原 .in 文件保留，.out 打包后删除")
+
+        print("\n3. zip：逐个解压到新目录并打包")
+        zip_path = os.path.join(temp_dir, 'legacy.zip')
+        with zipfile.ZipFile(zip_path, 'w') as zipf:
+            for i in range(1, 13):
+                zipf.writestr(f"data{i}.in", f"{i}\n")
+            zipf.writestr("readme.txt", "not an input")
+        pack = InputPack(zip_path)
+        examples = pack.read_examples(2)
+        output_dir = str(pack.default_output_dir())
+        result = file_manager.save_pack_with_solution_process(pack, solution, output_dir)
+        with open(os.path.join(output_dir, 'data12.out'), encoding='utf-8') as f:
+            last = f.read().strip()
+        status = "✓" if (len(pack) == 12 and examples == ["1\n", "2\n"] and last == "24"
+                         and result['file_count'] == 24 and output_dir.endswith('legacy_out')) else "✗"
+        print(f"   {status} {len(pack)} 个 .in 文件，示例 {examples}，data12.out = {last}")
+
+        print("\n4. 没有 .in 文件")
+        try:
+            InputPack(os.path.join(temp_dir, 'cache'))
+            print("   ✗ 没有报错")
+        except ValueError as e:
+            print(f"   ✓ {e}")
+
+
+if __name__ == "__main__":
+    test_input_pack()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试任务清单：中断后继续、跳过已完成的用例、按哈希校验已有文件
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.pipeline import PackPipeline
+from core.solution_runner import BuildCache
+from core.job_manifest import find_resumable_job, manifest_path, read_manifest
+
+CONFIGS = [
+    {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+     'loop_count': 1, 'min_value': 1, 'max_value': 100},
+]
+
+# 每次运行在日志中记一行；存在标记文件时处理到第 n=... 组就失败，模拟中途中断
+CODE_TEMPLATE = """import os
+def main():
+    with open({log!r}, 'a') as f:
+        f.write(input_data)
+    if os.path.exists({flag!r}) and int(input_data) == {fail_on}:
+        raise RuntimeError("中断")
+    return int(input_data) * 2
+"""
+
+
+def count_runs(log_path):
+    if not os.path.exists(log_path):
+        return 0
+    with open(log_path, encoding='utf-8') as f:
+        return len(f.read().split())
+
+
+def test_job_manifest():
+    """测试中断后继续、校验被改动的文件和配置不同时不继续"""
+    print("=== 测试任务清单 ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out_dir = os.path.join(temp_dir, 'out')
+        log_path = os.path.join(temp_dir, 'runs.log')
+        flag_path = os.path.join(temp_dir, 'fail.flag')
+        data = [str(i) for i in range(1, 21)]
+        code = CODE_TEMPLATE.format(log=log_path, flag=flag_path, fail_on=15)
+        solution = BuildCache(os.path.join(temp_dir, 'cache')).python_solution(code)
+
+        print("\n1. 中途失败")
+        open(flag_path, 'w').close()
+        try:
+            PackPipeline(out_dir, solution=solution, solve_workers=1, checkpoint=True).run_data(data)
+            print("   ✗ 没有报错")
+        except ValueError:
+            manifest = read_manifest(manifest_path(out_dir))
+            done = sum(1 for case in manifest['cases'].values() if 'out_sha256' in case)
+            status = "✓" if done == 14 and not manifest['completed'] else "✗"
+            print(f"   {status} 清单记录了 {done} 组已完成的输出")
+
+        print("\n2. 继续任务")
+        os.remove(flag_path)
+        before = count_runs(log_path)
+        result = PackPipeline(out_dir, solution=solution, solve_workers=1, checkpoint=True).run_data(data)
+        runs = count_runs(log_path) - before
+        with open(os.path.join(out_dir, 'test20.out'), encoding='utf-8') as f:
+            last = f.read().strip()
+        status = "✓" if runs == 6 and result['resumed_cases'] == 14 and last == "40" else "✗"
+        print(f"   {status} 跳过 {result['resumed_cases']} 组，重新运行 {runs} 组，test20.out = {last}")
+
+        print("\n3. 改动过的文件重新生成")
+        with open(os.path.join(out_dir, 'test03.out'), 'w', encoding='utf-8') as f:
+            f.write("wrong\n")
+        data[4] = "50"
+        before = count_runs(log_path)
+        PackPipeline(out_dir, solution=solution, solve_workers=1, checkpoint=True).run_data(data)
+        runs = count_runs(log_path) - before
+        with open(os.path.join(out_dir, 'test03.out'), encoding='utf-8') as f:
+            fixed = f.read().strip()
+        status = "✓" if runs == 2 and fixed == "6" else "✗"
+        print(f"   {status} 重新运行 {runs} 组（被改动的输出和改变的输入），test03.out = {fixed}")
+
+        print("\n4. 生成任务")
+        gen_dir = os.path.join(temp_dir, 'gen')
+        result = PackPipeline(gen_dir, checkpoint=True).run_generated(CONFIGS, 10, workers=1, seed=3)
+        status = "✓" if find_resumable_job(gen_dir, CONFIGS, 10, False) is None else "✗"
+        print(f"   {status} 已完成的任务不再提示继续")
+        os.remove(os.path.join(gen_dir, 'test04.in'))
+        manifest = read_manifest(manifest_path(gen_dir))
+        manifest['completed'] = False
+        with open(manifest_path(gen_dir), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        found = find_resumable_job(gen_dir, CONFIGS, 10, False)
+        other = find_resumable_job(gen_dir, CONFIGS, 11, False)
+        again = PackPipeline(gen_dir, checkpoint=True).run_generated(CONFIGS, 10, workers=1, seed=found[0])
+        status = "✓" if found == (3, 10) and other is None and again['resumed_cases'] == 9 else "✗"
+        print(f"   {status} 找到未完成的任务 {found}，跳过 {again['resumed_cases']} 组")
+
+
+if __name__ == "__main__":
+    test_job_manifest()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试多组模式：一个文件包含 T 组数据，首行为 T，总规模按文件分配
+"""
+
+import sys
+import os
+import zipfile
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.pipeline import PackPipeline
+from core.file_manager_core import FileManagerCore
+from core.output_cache import hash_file
+
+CONFIGS = [
+    {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+     'loop_count': 1, 'min_value': 1, 'max_value': 50},
+    {'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+     'loop_count': 'n', 'min_value': 1, 'max_value': 100},
+]
+
+
+def read_cases(text, header):
+    """把文件内容拆成 T 和各组的 (n, 数组)"""
+    lines = text.split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    t = int(lines.pop(0)) if header else None
+    cases = [(int(lines[i]), lines[i + 1].split()) for i in range(0, len(lines), 2)]
+    return t, cases
+
+
+def test_multi_case():
+    """测试多组文件的格式、总规模和哈希"""
+    print("=== 测试多组模式 ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        print("\n1. 首行为 T，后面是 T 组数据")
+        out_dir = os.path.join(temp_dir, 'plain')
+        result = PackPipeline(out_dir).run_generated(CONFIGS, 3, workers=1, seed=5,
+                                                     multi_case={'cases': 20, 'header': True})
+        ok = result['file_count'] == 3
+        with zipfile.ZipFile(result['zip_file']) as zipf:
+            for index in range(1, 4):
+                t, cases = read_cases(zipf.read(f"test{index:02d}.in").decode('utf-8'), True)
+                ok = ok and t == 20 and len(cases) == 20 and all(len(a) == n for n, a in cases)
+        print(f"   {'✓' if ok else '✗'} 3 个文件，每个文件 20 组，数组长度与 n 一致")
+
+        print("\n2. 每个文件中 n 之和等于总和（多进程生成）")
+        out_dir = os.path.join(temp_dir, 'budget')
+        budget = {'variable': 'n', 'total': 400, 'max_case': True}
+        result = PackPipeline(out_dir).run_generated(CONFIGS, 4, workers=2, seed=9, budget=budget,
+                                                     multi_case={'cases': 10, 'header': False})
+        ok = True
+        with zipfile.ZipFile(result['zip_file']) as zipf:
+            for index in range(1, 5):
+                _, cases = read_cases(zipf.read(f"test{index:02d}.in").decode('utf-8'), False)
+                sizes = [n for n, _ in cases]
+                ok = ok and len(cases) == 10 and sum(sizes) == 400 and 50 in sizes
+                ok = ok and sizes == result['sizes'][index - 1]
+        print(f"   {'✓' if ok else '✗'} 每个文件 10 组，n 之和都为 400，且包含 n = 50 的最大用例")
+
+        print("\n3. 逐组写入的哈希与文件内容一致")
+        path = os.path.join(temp_dir, 'cases.in')
+        digest = FileManagerCore().write_cases_file(path, (f"{i}" for i in range(5)), header="5")
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+        status = "✓" if digest == hash_file(path) and content == "5\n0\n1\n2\n3\n4\n" else "✗"
+        print(f"   {status} {content!r}")
+
+        print("\n4. 不能与不重复数据同时使用")
+        try:
+            PackPipeline(temp_dir).run_generated(CONFIGS, 3, no_duplicate=True, multi_case={'cases': 2})
+            print("   ✗ 没有报错")
+        except ValueError as e:
+            print(f"   ✓ {e}")
+
+
+if __name__ == "__main__":
+    test_multi_case()
@@ -32,7 +32,7 @@ def generate_data():
     
     print("整数代码生成测试:")
     for i in range(5):
-        value = generator._generate_single_value(config_int)
+        value = int(generator.generate_test_data([config_int], 1)[0])
         print(f"  生成值 {i+1}: {value} (类型: {type(value).__name__})")
     
     # 测试字符串代码生成
@@ -53,7 +53,7 @@ def generate_data():
     
     print("\n字符串代码生成测试:")
     for i in range(5):
-        value = generator._generate_single_value(config_str)
+        value = generator.generate_test_data([config_str], 1)[0]
         print(f"  生成值 {i+1}: {value} (长度: {len(value)})")
     
     # 测试浮点数代码生成
@@ -72,7 +72,7 @@ def generate_data():
     
     print("\n浮点数代码生成测试:")
     for i in range(5):
-        value = generator._generate_single_value(config_float)
+        value = float(generator.generate_test_data([config_float], 1)[0])
         print(f"  生成值 {i+1}: {value} (类型: {type(value).__name__})")
 
 def test_no_duplicate():
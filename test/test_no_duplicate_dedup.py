@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试不重复模式：摘要去重、取值空间估算和小空间枚举
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_generator_core import DataGeneratorCore
+
+
+def test_no_duplicate_dedup():
+    """测试取值空间不足时立即发现，以及小空间和大空间下的不重复生成"""
+    print("=== 测试不重复数据生成 ===")
+
+    generator = DataGeneratorCore()
+    configs = [
+        {'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+         'min_value': '1', 'max_value': '3', 'loop_count': 1},
+        {'name': 'b', 'data_type': '字符', 'source_type': '字符集合', 'separator': '换行',
+         'charset': 'a-c', 'loop_count': 2},
+    ]
+
+    print("\n1. 取值空间估算")
+    cardinality = generator.estimate_cardinality(configs)
+    status = "✓" if cardinality == 27 else "✗"
+    print(f"   3 × 3² = {cardinality} {status}")
+
+    print("\n2. 请求数量超过取值空间（应立即警告并返回全部取值）")
+    start = time.perf_counter()
+    data = generator.generate_test_data(configs, 100, no_duplicate=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    status = "✓" if len(data) == 27 and len(set(data)) == 27 else "✗"
+    print(f"   生成 {len(data)} 组，不重复 {len(set(data))} 组，耗时 {elapsed:.2f} ms {status}")
+
+    print("\n3. 含变量引用的配置无法估算，使用随机去重")
+    dynamic_configs = [
+        {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+         'min_value': '1', 'max_value': '10', 'loop_count': 1},
+        {'name': 'arr', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+         'min_value': '1', 'max_value': '1000000', 'loop_count': 'n'},
+    ]
+    print(f"   估算结果（应为None）: {generator.estimate_cardinality(dynamic_configs)}")
+    data = generator.generate_test_data(dynamic_configs, 2000, no_duplicate=True)
+    status = "✓" if len(data) == 2000 and len(set(data)) == 2000 else "✗"
+    print(f"   生成 {len(data)} 组，不重复 {len(set(data))} 组 {status}")
+
+    print("\n4. 无分隔符时拼接可能相同，不做精确估算")
+    joined_configs = [dict(config, separator='无') for config in configs]
+    print(f"   估算结果（应为None）: {generator.estimate_cardinality(joined_configs)}")
+
+
+if __name__ == "__main__":
+    test_no_duplicate_dedup()
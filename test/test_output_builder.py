@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试字节输出：按字节拼接的数据与字符串一致，文件管理器可直接写入字节
+"""
+
+import sys
+import os
+import time
+import shutil
+import hashlib
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_generator_core import DataGeneratorCore
+from core.file_manager_core import FileManagerCore
+from core.output_builder import OutputBuilder
+
+
+def test_output_builder():
+    """测试字节拼接、整数快速路径和写文件"""
+    print("=== 测试字节输出 ===")
+
+    print("\n1. 构建器")
+    builder = OutputBuilder()
+    builder.write_values([1, -20, 300], b' ', as_int=True)
+    builder.write(b'\n')
+    builder.write_values(['你好', 'ab'], b',')
+    print(f"   {bytes(builder.getvalue())!r}")
+
+    print("\n2. 与字符串结果一致")
+    configs = [
+        {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+         'min_value': '1', 'max_value': '10', 'loop_count': 1},
+        {'name': 'a', 'data_type': '浮点数', 'source_type': '数据范围', 'separator': '空格',
+         'min_value': '0', 'max_value': '1', 'loop_count': 'n'},
+        {'name': 't', 'data_type': '整数', 'source_type': '树', 'separator': '换行', 'node_count': 'n'},
+        {'name': 's', 'data_type': '字符串', 'source_type': '字符集合', 'separator': '换行',
+         'charset': '一-龥a-z', 'string_length': '1,5', 'loop_count': 2},
+    ]
+    generator = DataGeneratorCore()
+    generator.set_seed(7)
+    text_data = generator.generate_test_data(configs, 20)
+    generator.set_seed(7)
+    byte_data = generator.generate_test_bytes(configs, 20)
+    status = "✓" if [data.decode('utf-8') for data in byte_data] == text_data else "✗"
+    print(f"   20 组数据一致: {status}")
+
+    print("\n3. 拼接时逐段计算的摘要与整组数据的摘要一致")
+    ok = True
+    for as_bytes in (True, False):
+        generator.set_seed(11)
+        generate = generator.generate_test_bytes if as_bytes else generator.generate_test_data
+        expected = generate(configs, 1)[0]
+        generator.set_seed(11)
+        hasher = hashlib.blake2b(digest_size=16)
+        group = generator._generate_single_group(configs, hasher, as_bytes=as_bytes)
+        data = bytes(group) if as_bytes else group.encode('utf-8')
+        ok = ok and group == expected and hasher.digest() == hashlib.blake2b(data, digest_size=16).digest()
+    print(f"   字节和字符串两种拼接: {'✓' if ok else '✗'}")
+
+    print("\n4. 大数组生成并写入文件")
+    big_configs = [
+        {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+         'min_value': '1000000', 'max_value': '1000000', 'loop_count': 1},
+        {'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+         'min_value': '1', 'max_value': '10**9', 'loop_count': 1000000},
+    ]
+    temp_dir = tempfile.mkdtemp()
+    try:
+        for label, generate in [("字符串", generator.generate_test_data), ("字节", generator.generate_test_bytes)]:
+            start = time.perf_counter()
+            data = generate(big_configs, 1)
+            FileManagerCore().save_test_files(data, temp_dir, create_zip=False)
+            print(f"   {label}: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        with open(os.path.join(temp_dir, "test01.in"), 'rb') as f:
+            content = f.read()
+        status = "✓" if content.endswith(b'\n') and content.count(b' ') == 999999 else "✗"
+        print(f"   文件以换行结尾且包含 10^6 个值: {status}")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    test_output_builder()
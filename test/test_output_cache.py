@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试解题输出缓存：只运行改动过的输入、换代码后不命中、按大小淘汰
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.solution_runner import BuildCache
+from core.output_cache import OutputCache
+from core.file_manager_core import FileManagerCore
+
+SUM_CODE = "def main():\n    return sum(map(int, input_data.split()))\n"
+
+
+def test_output_cache():
+    """测试命中率、输出内容和 LRU 淘汰"""
+    print("=== 测试解题输出缓存 ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        build_cache = BuildCache(os.path.join(temp_dir, 'builds'))
+        cache = OutputCache(os.path.join(temp_dir, 'outputs'))
+        file_manager = FileManagerCore()
+        out_dir = os.path.join(temp_dir, 'out')
+        solution = build_cache.python_solution(SUM_CODE)
+
+        print("\n1. 第一次生成")
+        test_data = [f"{i} {i * 2}" for i in range(1, 9)]
+        result = file_manager.save_with_solution_process(test_data, solution, out_dir, output_cache=cache)
+        status = "✓" if result['cache_hits'] == 0 and result['cache_misses'] == 8 else "✗"
+        print(f"   {status} 命中 {result['cache_hits']}，运行 {result['cache_misses']}")
+
+        print("\n2. 只修改两个用例")
+        test_data[2] = "100 200"
+        test_data[5] = "7 7 7"
+        result = file_manager.save_with_solution_process(test_data, solution, out_dir, output_cache=cache)
+        with open(os.path.join(out_dir, "test03.out"), encoding='utf-8') as f:
+            changed = f.read().strip()
+        with open(os.path.join(out_dir, "test04.out"), encoding='utf-8') as f:
+            cached = f.read().strip()
+        status = "✓" if (result['cache_hits'] == 6 and result['cache_misses'] == 2
+                         and changed == "300" and cached == "12") else "✗"
+        print(f"   {status} 命中 {result['cache_hits']}，运行 {result['cache_misses']}，"
+              f"test03.out = {changed}，test04.out = {cached}")
+
+        print("\n3. 修改解题代码")
+        other = build_cache.python_solution(SUM_CODE.replace("sum(", "-sum("))
+        result = file_manager.save_with_solution_process(test_data, other, out_dir, output_cache=cache)
+        status = "✓" if result['cache_hits'] == 0 else "✗"
+        print(f"   {status} 命中 {result['cache_hits']}，运行 {result['cache_misses']}")
+
+        print("\n4. 按大小淘汰")
+        small = OutputCache(os.path.join(temp_dir, 'small'), max_bytes=3000)
+        big = build_cache.python_solution("def main():\n    return input_data * 100\n")
+        file_manager.save_with_solution_process([f"{i:09d}" for i in range(10)], big, out_dir, output_cache=small)
+        status = "✓" if small.size() <= small.max_bytes else "✗"
+        print(f"   {status} 缓存大小 {small.size()} 字节，上限 {small.max_bytes} 字节")
+
+
+if __name__ == "__main__":
+    test_output_cache()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试流水线生成：多进程生成、解答与打包同时进行、阶段统计和出错时停止
+"""
+
+import sys
+import os
+import zipfile
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.pipeline import PackPipeline, format_stats
+from core.solution_runner import BuildCache
+from core.input_pack import InputPack
+from core.file_manager_core import FileManagerCore
+
+CONFIGS = [
+    {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+     'loop_count': 1, 'min_value': 1, 'max_value': 1000},
+    {'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+     'loop_count': 'n', 'min_value': 1, 'max_value': 100},
+]
+
+SUM_CODE = "def main():\n    return sum(map(int, input_data.split('\\n')[1].split()))\n"
+
+
+def read_pack(zip_path):
+    """读取zip中的全部文件"""
+    with zipfile.ZipFile(zip_path) as zipf:
+        return {name: zipf.read(name).decode('utf-8') for name in zipf.namelist()}
+
+
+def test_pipeline():
+    """测试生成、解答、打包和统计"""
+    print("=== 测试流水线生成 ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        print("\n1. 只生成数据")
+        result = PackPipeline(os.path.join(temp_dir, 'a')).run_generated(CONFIGS, 40, workers=2, seed=7)
+        again = PackPipeline(os.path.join(temp_dir, 'b')).run_generated(CONFIGS, 40, workers=1, seed=7)
+        first, second = read_pack(result['zip_file']), read_pack(again['zip_file'])
+        status = "✓" if len(first) == 40 and first == second else "✗"
+        print(f"   {status} {len(first)} 个文件，相同种子的多进程和单进程结果一致")
+
+        print("\n2. 生成、解答和打包同时进行")
+        solution = BuildCache(os.path.join(temp_dir, 'cache')).python_solution(SUM_CODE)
+        result = PackPipeline(os.path.join(temp_dir, 'c'), solution=solution, queue_size=4,
+                              delete_temp_files=True).run_generated(CONFIGS, 30, workers=2, seed=1)
+        pack = read_pack(result['zip_file'])
+        correct = all(pack[name.replace('.in', '.out')].strip() == str(sum(map(int, text.split('\n')[1].split())))
+                      for name, text in pack.items() if name.endswith('.in'))
+        left = [name for name in os.listdir(os.path.join(temp_dir, 'c')) if not name.endswith('.zip')]
+        status = "✓" if len(pack) == 60 and correct and not left else "✗"
+        print(f"   {status} {len(pack)} 个文件，输出全部正确，删除临时文件后剩余 {len(left)} 个")
+        for line in format_stats(result['stats']).splitlines():
+            print(f"      {line}")
+
+        print("\n3. 不重复模式")
+        configs = [{'name': 'x', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+                    'loop_count': 1, 'min_value': 1, 'max_value': 10 ** 6}]
+        result = PackPipeline(os.path.join(temp_dir, 'd')).run_generated(configs, 50, workers=2,
+                                                                         no_duplicate=True)
+        values = list(read_pack(result['zip_file']).values())
+        status = "✓" if len(values) == 50 and len(set(values)) == 50 else "✗"
+        print(f"   {status} {len(set(values))} 组不重复")
+
+        print("\n4. 解答出错时停止")
+        bad = BuildCache(os.path.join(temp_dir, 'cache')).python_solution("def main():\n    return 1 // 0\n")
+        try:
+            PackPipeline(os.path.join(temp_dir, 'e'), solution=bad).run_generated(CONFIGS, 20, workers=2)
+            print("   ✗ 没有报错")
+        except ValueError as e:
+            zips = [name for name in os.listdir(os.path.join(temp_dir, 'e')) if name.endswith('.zip')]
+            status = "✓" if not zips else "✗"
+            print(f"   {status} {str(e).splitlines()[0]}，未留下zip文件")
+
+        print("\n5. 先生成 .in 文件，再在原文件上运行解答")
+        out_dir = os.path.join(temp_dir, 'f')
+        generated = PackPipeline(out_dir, create_zip=False, checkpoint=True).run_generated(CONFIGS, 10, workers=2)
+        pack = InputPack(out_dir, names=[os.path.basename(path) for path in generated['created_files']])
+        solution = BuildCache(os.path.join(temp_dir, 'cache')).python_solution(SUM_CODE)
+        result = FileManagerCore().save_pack_with_solution_process(pack, solution, out_dir, delete_temp_files=True,
+                                                                   checkpoint=True)
+        files = read_pack(result['zip_file'])
+        zips = [name for name in os.listdir(out_dir) if name.endswith('.zip')]
+        left = [name for name in os.listdir(out_dir) if name.endswith('.in') or name.endswith('.out')]
+        status = "✓" if len(files) == 20 and 'test10.out' in files and len(zips) == 1 and not left else "✗"
+        print(f"   {status} zip 中 {len(files)} 个文件，输出目录中只有 {len(zips)} 个zip，生成的 .in 打包后删除")
+
+
+if __name__ == "__main__":
+    test_pipeline()
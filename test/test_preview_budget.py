@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试截断预览：预览耗时与数据规模无关
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_generator_core import DataGeneratorCore
+
+
+def test_preview_budget():
+    """测试大规模配置的预览耗时、截断提示和大小估算"""
+    print("=== 测试截断预览 ===")
+
+    generator = DataGeneratorCore()
+    configs = [
+        {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+         'min_value': '10**6-1', 'max_value': '10**6', 'loop_count': 1},
+        {'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+         'min_value': '1', 'max_value': '10**9', 'loop_count': 'n'},
+        {'name': 'edges', 'data_type': '整数', 'source_type': '树', 'separator': '换行', 'node_count': 'n'},
+    ]
+
+    print("\n1. n = 10^6 的数组和树")
+    start = time.perf_counter()
+    cases = generator.generate_preview_cases(configs, 3)
+    elapsed = (time.perf_counter() - start) * 1000
+    case = cases[0]
+    print(f"   3 组预览耗时 {elapsed:.1f} ms")
+    print(f"   显示 {case['shown_values']} / {case['total_values']} 个值，"
+          f"文本 {len(case['text'])} 个字符，估计完整大小 {case['estimated_bytes'] / 1024 / 1024:.1f} MB")
+    status = "✓" if "... (还有" in case['text'] and len(case['text']) < 2500 else "✗"
+    print(f"   截断提示: {status}")
+    for stats in case['variables']:
+        print(f"   {stats}")
+
+    print("\n2. 小规模数据完整显示")
+    small = [dict(configs[0], min_value='3', max_value='4'), configs[1]]
+    case = generator.generate_preview_cases(small, 1)[0]
+    status = "✓" if case['shown_values'] == case['total_values'] and "还有" not in case['text'] else "✗"
+    print(f"   {case['text']!r} {status}")
+
+    print("\n3. 按行数预算截断")
+    lines_config = [{'name': 'x', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+                     'min_value': '1', 'max_value': '9', 'loop_count': 1000}]
+    case = generator.generate_preview_cases(lines_config, 1, line_budget=10)[0]
+    print(f"   显示 {case['text'].count(chr(10)) + 1} 行，{case['shown_values']} 个值")
+
+
+if __name__ == "__main__":
+    test_preview_budget()
@@ -32,7 +32,7 @@ def test_random_length():
     print("\n生成10个随机长度字符串:")
     
     for i in range(10):
-        result = generator._generate_from_charset(config)
+        result = generator.generate_test_data([config], 1)[0]
         print(f"第{i+1}个: '{result}' (长度: {len(result)})")
     
     print("\n=== 测试数据范围随机长度功能 ===")
@@ -53,7 +53,7 @@ def test_random_length():
     print("\n生成10个随机长度大写字母字符串:")
     
     for i in range(10):
-        result = generator._generate_from_range(config2)
+        result = generator.generate_test_data([config2], 1)[0]
         print(f"第{i+1}个: '{result}' (长度: {len(result)})")
     
     print("\n=== 测试固定长度功能 ===")
@@ -73,7 +73,7 @@ def test_random_length():
     print("\n生成5个固定长度字符串:")
     
     for i in range(5):
-        result = generator._generate_from_charset(config3)
+        result = generator.generate_test_data([config3], 1)[0]
         print(f"第{i+1}个: '{result}' (长度: {len(result)})")
     
     print("\n=== 测试完整数据生成 ===")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试总规模分配：各组规模之和恰好等于总和，且都在变量范围内
+"""
+
+import sys
+import os
+import random
+import zipfile
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.pipeline import PackPipeline
+from core.size_budget import allocate_sizes, budget_bounds, parse_total
+
+CONFIGS = [
+    {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+     'loop_count': 1, 'min_value': 1, 'max_value': 1000},
+    {'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+     'loop_count': 'n', 'min_value': 1, 'max_value': 10**9},
+]
+
+
+def test_allocate_sizes():
+    """测试拆分的总和、范围和最大用例"""
+    print("=== 测试总和拆分 ===")
+    rng = random.Random(1)
+
+    print("\n1. 总和准确且不越界")
+    ok = True
+    for total, count, low, high in [(200000, 10, 1, 200000), (1000, 10, 1, 100), (55, 10, 5, 6), (0, 3, 0, 5)]:
+        sizes = allocate_sizes(total, count, low, high, rng)
+        ok = ok and len(sizes) == count and sum(sizes) == total and all(low <= s <= high for s in sizes)
+    print(f"   {'✓' if ok else '✗'} 各种范围下总和都准确")
+
+    print("\n2. 上限很紧时溢出部分重新分配")
+    sizes = allocate_sizes(990, 10, 1, 100, rng)
+    status = "✓" if sum(sizes) == 990 and max(sizes) <= 100 else "✗"
+    print(f"   {status} {sizes}")
+
+    print("\n3. 包含一个最大用例")
+    sizes = allocate_sizes(200000, 10, 1, 100000, rng, max_case=True)
+    status = "✓" if sum(sizes) == 200000 and 100000 in sizes else "✗"
+    print(f"   {status} 最大值 {max(sizes)}，总和 {sum(sizes)}")
+
+    print("\n4. 无法拆分时报错")
+    for total, count, low, high in [(5, 10, 1, 100), (2000, 10, 1, 100)]:
+        try:
+            allocate_sizes(total, count, low, high, rng)
+            print(f"   ✗ 总和 {total} 没有报错")
+        except ValueError as e:
+            print(f"   ✓ {e}")
+
+    print("\n5. 总和与变量范围的解析")
+    status = "✓" if parse_total("2*10**5") == 200000 and budget_bounds(CONFIGS, 'n') == (1, 1000) else "✗"
+    print(f"   {status} 2*10**5 = {parse_total('2*10**5')}，n 的范围 {budget_bounds(CONFIGS, 'n')}")
+    try:
+        budget_bounds(CONFIGS, 'a')
+        print("   ✗ 循环次数不为1的变量没有报错")
+    except ValueError as e:
+        print(f"   ✓ {e}")
+
+
+def test_budget_pipeline():
+    """测试按总规模生成的数据包"""
+    print("\n=== 测试按总规模生成 ===")
+    budget = {'variable': 'n', 'total': 2000, 'max_case': True}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result = PackPipeline(temp_dir).run_generated(CONFIGS, 5, workers=1, seed=7, budget=budget)
+        ok = True
+        total = 0
+        with zipfile.ZipFile(result['zip_file']) as zipf:
+            for index in range(1, 6):
+                lines = zipf.read(f"test{index:02d}.in").decode('utf-8').split('\n')
+                n = int(lines[0])
+                ok = ok and len(lines[1].split()) == n
+                total += n
+        status = "✓" if ok and total == 2000 and 1000 in result['sizes'] else "✗"
+        print(f"   {status} 各组 n = {result['sizes']}，总和 {total}，数组长度与 n 一致")
+
+        again = PackPipeline(os.path.join(temp_dir, 'again')).run_generated(CONFIGS, 5, workers=1, seed=7,
+                                                                            budget=budget)
+        status = "✓" if again['sizes'] == result['sizes'] else "✗"
+        print(f"   {status} 相同种子得到相同的分配")
+
+        try:
+            PackPipeline(temp_dir).run_generated(CONFIGS, 5, no_duplicate=True, budget=budget)
+            print("   ✗ 与不重复模式同时使用没有报错")
+        except ValueError as e:
+            print(f"   ✓ {e}")
+
+
+if __name__ == "__main__":
+    test_allocate_sizes()
+    test_budget_pipeline()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试编译型语言解题代码的编译缓存和运行
+"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.solution_runner import BuildCache, available_languages
+from core.file_manager_core import FileManagerCore
+
+CPP_CODE = """#include <bits/stdc++.h>
+using namespace std;
+int main() {
+    long long n, sum = 0;
+    cin >> n;
+    for (long long i = 0, x; i < n; i++) { cin >> x; sum += x; }
+    cout << sum << endl;
+    return 0;
+}
+"""
+
+
+def test_solution_runner():
+    """测试编译、缓存复用、直接写入 .out 文件和编译错误"""
+    print("=== 测试编译型语言解题代码 ===")
+    print(f"本机可用的编译型语言: {available_languages()}")
+    if "C++" not in available_languages():
+        print("   未找到 C++ 编译器，跳过")
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = BuildCache(os.path.join(temp_dir, 'cache'))
+
+        print("\n1. 编译与缓存")
+        start = time.perf_counter()
+        solution = cache.compile("C++", CPP_CODE)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        cache.compile("C++", CPP_CODE)
+        second = time.perf_counter() - start
+        status = "✓" if second < first / 10 else "✗"
+        print(f"   {status} 首次编译 {first * 1000:.0f} ms，再次编译（命中缓存） {second * 1000:.1f} ms")
+
+        other = cache.compile("C++", CPP_CODE, "-O0 -std=c++17")
+        status = "✓" if other.command != solution.command else "✗"
+        print(f"   {status} 编译选项不同时使用不同的缓存")
+
+        print("\n2. 运行")
+        result = solution.run("3\n1 2 3\n")
+        status = "✓" if result.strip() == "6" else "✗"
+        print(f"   {status} 输入 1 2 3 输出 {result.strip()}")
+
+        print("\n3. 输入输出文件")
+        test_data = [f"{n}\n" + " ".join(str(i) for i in range(1, n + 1)) for n in (1, 10, 100000)]
+        save_result = FileManagerCore().save_with_solution_process(test_data, solution, os.path.join(temp_dir, 'out'))
+        outputs = []
+        for i in range(1, 4):
+            with open(os.path.join(temp_dir, 'out', f"test{i:02d}.out"), encoding='utf-8') as f:
+                outputs.append(f.read().strip())
+        expected = [str(n * (n + 1) // 2) for n in (1, 10, 100000)]
+        status = "✓" if outputs == expected else "✗"
+        print(f"   {status} {save_result['file_count']} 个文件，输出 {outputs}")
+
+        print("\n4. 编译错误")
+        try:
+            cache.compile("C++", "int main() { return }")
+            print("   ✗ 没有报错")
+        except ValueError as e:
+            print(f"   ✓ {str(e).splitlines()[0]}")
+
+
+if __name__ == "__main__":
+    test_solution_runner()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试 Python 解题代码在子进程中运行、输出直接写入 .out 文件
+"""
+
+import sys
+import os
+import time
+import hashlib
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.solution_runner import BuildCache
+from core.file_manager_core import FileManagerCore
+from gui.func.solution_executor import SolutionExecutor
+
+
+def run_once(solution, temp_dir, input_data):
+    """写入 .in 文件并运行，返回输出内容和 run_file 的结果"""
+    in_path = os.path.join(temp_dir, 'case.in')
+    out_path = os.path.join(temp_dir, 'case.out')
+    with open(in_path, 'w', encoding='utf-8') as f:
+        f.write(input_data)
+    result = solution.run_file(in_path, out_path)
+    with open(out_path, 'rb') as f:
+        return f.read(), result
+
+
+def test_solution_stream():
+    """测试 print 模式、main 函数模式、大量输出、输出上限和超时"""
+    print("=== 测试 Python 解题代码的流式输出 ===")
+    executor = SolutionExecutor(FileManagerCore())
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor.build_cache = BuildCache(os.path.join(temp_dir, 'cache'))
+
+        print("\n1. print 模式")
+        solution = executor.compile_solution("nums = list(map(int, input_data.split()))\nprint(sum(nums))", "Python")
+        output, _ = run_once(solution, temp_dir, "1 2 3")
+        status = "✓" if output.strip() == b"6" else "✗"
+        print(f"   {status} 输出 {output.strip()}")
+
+        print("\n1b. 转换后不是合法语句时执行原始代码")
+        solution = executor.compile_solution("n = int(input_data)\nprint(n * 2, end='')", "Python")
+        output, _ = run_once(solution, temp_dir, "5")
+        status = "✓" if output == b"10" else "✗"
+        print(f"   {status} print(n * 2, end='') 输出 {output}")
+
+        print("\n2. main 函数模式")
+        solution = executor.compile_solution("def main():\n    return input_data.upper()\n", "Python")
+        output, _ = run_once(solution, temp_dir, "中文 abc")
+        status = "✓" if output.decode('utf-8').strip() == "中文 ABC" else "✗"
+        print(f"   {status} 输出 {output.decode('utf-8').strip()}")
+
+        print("\n3. 大量输出")
+        code = "import sys\ndef main():\n    for i in range(10**6):\n        sys.stdout.write(f'{i}\\n')\n"
+        solution = executor.compile_solution(code, "Python")
+        start = time.perf_counter()
+        output, result = run_once(solution, temp_dir, "")
+        elapsed = time.perf_counter() - start
+        status = "✓" if (result['size'] == len(output) and result['sha256'] == hashlib.sha256(output).hexdigest()
+                         and output.count(b'\n') == 10 ** 6) else "✗"
+        print(f"   {status} {result['size'] / 1024 / 1024:.1f} MB，用时 {elapsed:.2f} 秒")
+
+        print("\n4. 输出上限")
+        solution = executor.compile_solution("import sys\ndef main():\n    while True:\n        sys.stdout.write('x' * 4096)\n",
+                                             "Python")
+        solution.output_limit = 1024 * 1024
+        try:
+            run_once(solution, temp_dir, "")
+            print("   ✗ 没有报错")
+        except ValueError as e:
+            size = os.path.getsize(os.path.join(temp_dir, 'case.out'))
+            status = "✓" if size <= solution.output_limit else "✗"
+            print(f"   {status} {e}，已写入 {size} 字节")
+
+        print("\n5. 超时")
+        solution = executor.compile_solution("def main():\n    while True:\n        pass\n", "Python")
+        solution.timeout = 1
+        try:
+            run_once(solution, temp_dir, "")
+            print("   ✗ 没有报错")
+        except ValueError as e:
+            print(f"   ✓ {e}")
+
+
+if __name__ == "__main__":
+    test_solution_stream()
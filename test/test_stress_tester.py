@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试对拍器：多进程对拍、发现不一致后停止并缩小反例
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui.func.stress_tester import StressTester, shrink_configs
+
+CONFIGS = [
+    {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+     'loop_count': 1, 'min_value': 1, 'max_value': 1000},
+    {'name': 'a', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+     'loop_count': 'n', 'min_value': 1, 'max_value': '10**9'},
+]
+
+# 暴力解：数组最大值
+REFERENCE = """def main():
+    a = list(map(int, input_data.split('\\n')[1].split()))
+    return max(a)
+"""
+
+# 待测解：只看前50个数，n > 50 时可能出错
+CANDIDATE = """def main():
+    a = list(map(int, input_data.split('\\n')[1].split()))
+    return max(a[:50])
+"""
+
+
+def test_stress_tester():
+    """测试对拍结果、吞吐量和反例缩小"""
+    print("=== 测试对拍器 ===")
+
+    print("\n1. 缩小配置")
+    shrunk = shrink_configs(CONFIGS, 0.1)
+    print(f"   n 的最大值 {CONFIGS[0]['max_value']} -> {shrunk[0]['max_value']}，"
+          f"a 的最大值 {CONFIGS[1]['max_value']} -> {shrunk[1]['max_value']}，循环次数 {shrunk[1]['loop_count']}")
+
+    print("\n2. 两份相同的代码")
+    result = StressTester(CONFIGS, REFERENCE, REFERENCE, workers=2, seed=1).run(max_cases=500)
+    status = "✓" if result['status'] == 'passed' and result['cases'] == 500 else "✗"
+    print(f"   {status} {result['status']}，{result['cases']} 组，{result['cases_per_second']:.0f} 组/秒")
+
+    print("\n3. 发现不一致并缩小反例")
+    result = StressTester(CONFIGS, REFERENCE, CANDIDATE, workers=2, seed=1).run(max_cases=500)
+    failure = result['failure']
+    n = int(failure['input'].split('\n')[0])
+    status = "✓" if result['status'] == 'mismatch' and 50 < n <= 1000 else "✗"
+    print(f"   {status} {result['status']}，第 {result['cases']} 组发现，缩小反例运行 {result['shrink_cases']} 组，"
+          f"反例 n={n}，期望 {failure['expected']}，实际 {failure['actual']}")
+
+    print("\n4. 待测解运行出错")
+    result = StressTester(CONFIGS, REFERENCE, "def main():\n    return 1 // 0\n",
+                          workers=2, seed=1).run(max_cases=10, shrink=False)
+    status = "✓" if result['status'] == 'candidate_error' and result['failure']['input'] else "✗"
+    print(f"   {status} {result['status']}: {result['failure']['error']}")
+
+    print("\n5. 超时从开始运行时计算，排队时间不计入")
+    slow = "import time\ndef main():\n    time.sleep(0.15)\n    return 1\n"
+    result = StressTester(CONFIGS, slow, slow, workers=1, case_timeout=0.5, seed=1).run(max_cases=6)
+    status = "✓" if result['status'] == 'passed' and result['cases'] == 6 else "✗"
+    print(f"   {status} 每组约 0.3 秒（两份代码各 0.15 秒）、超时 0.5 秒：{result['status']}，{result['cases']} 组")
+
+    result = StressTester(CONFIGS, slow.replace("0.15", "2"), REFERENCE, workers=1, case_timeout=0.5,
+                          seed=1).run(max_cases=3, shrink=False)
+    status = "✓" if result['status'] == 'timeout' else "✗"
+    print(f"   {status} 每组 2 秒：{result['status']}")
+
+
+if __name__ == "__main__":
+    test_stress_tester()
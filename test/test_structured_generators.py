@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试树、图、排列的结构化生成
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_generator_core import DataGeneratorCore
+from core.structured_generators import TREE_SHAPES
+
+
+def is_tree(n, edges):
+    """用并查集检查 n-1 条边是否构成树"""
+    parent = list(range(n + 1))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for u, v in edges:
+        ru, rv = find(u), find(v)
+        if ru == rv:
+            return False
+        parent[ru] = rv
+    return len(edges) == n - 1
+
+
+def parse_edges(text):
+    return [tuple(map(int, line.split())) for line in text.split('\n') if line]
+
+
+def test_structured_generators():
+    """测试各种形态的树、图和排列"""
+    print("=== 测试结构化生成 ===")
+
+    generator = DataGeneratorCore()
+
+    print("\n1. 各种形态的树（边列表）")
+    for shape in TREE_SHAPES:
+        configs = [
+            {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+             'min_value': '50', 'max_value': '60', 'loop_count': 1},
+            {'name': 'edges', 'data_type': '整数', 'source_type': '树', 'separator': '换行',
+             'node_count': 'n', 'tree_shape': shape},
+        ]
+        lines = generator.generate_test_data(configs, 1)[0].split('\n', 1)
+        n = int(lines[0])
+        status = "✓" if is_tree(n, parse_edges(lines[1])) else "✗"
+        print(f"   {shape}: n = {n} {status}")
+
+    print("\n2. 父节点数组")
+    config = {'name': 'p', 'data_type': '整数', 'source_type': '树', 'separator': '空格',
+              'node_count': 8, 'tree_format': '父节点数组'}
+    data = generator.generate_test_data([config], 1)[0]
+    parents = list(map(int, data.split()))
+    status = "✓" if is_tree(8, [(p, i + 2) for i, p in enumerate(parents)]) else "✗"
+    print(f"   {data} {status}")
+
+    print("\n3. 连通图和有向无环图")
+    for graph_type in ["简单图", "连通图", "有向无环图"]:
+        config = {'name': 'g', 'data_type': '整数', 'source_type': '图', 'separator': '换行',
+                  'node_count': 30, 'edge_count': 60, 'graph_type': graph_type}
+        edges = parse_edges(generator.generate_test_data([config], 1)[0])
+        simple = len(set(frozenset(edge) for edge in edges)) == 60 and all(u != v for u, v in edges)
+        print(f"   {graph_type}: {len(edges)} 条边，无自环无重边 {'✓' if simple else '✗'}")
+
+    print("\n4. 排列（循环2次生成两个排列）")
+    config = {'name': 'p', 'data_type': '整数', 'source_type': '排列', 'separator': '空格',
+              'node_count': 5, 'loop_count': 2}
+    values = list(map(int, generator.generate_test_data([config], 1)[0].split()))
+    status = "✓" if sorted(values[:5]) == sorted(values[5:]) == [1, 2, 3, 4, 5] else "✗"
+    print(f"   {values} {status}")
+
+    print("\n5. 边数超过上限时报错")
+    try:
+        generator.generate_test_data([{'name': 'g', 'data_type': '整数', 'source_type': '图', 'separator': '换行',
+                                       'node_count': 4, 'edge_count': 7}], 1)
+        print("   ✗ 没有报错")
+    except ValueError as e:
+        print(f"   ✓ {e}")
+
+    print("\n6. 大规模耗时")
+    for config in [
+        {'name': 't', 'data_type': '整数', 'source_type': '树', 'separator': '换行', 'node_count': 200000},
+        {'name': 'g', 'data_type': '整数', 'source_type': '图', 'separator': '换行',
+         'node_count': 100000, 'edge_count': 200000, 'graph_type': '连通图'},
+        {'name': 'p', 'data_type': '整数', 'source_type': '排列', 'separator': '空格', 'node_count': 1000000},
+    ]:
+        start = time.perf_counter()
+        generator.generate_test_data([config], 1)
+        print(f"   {config['source_type']} n = {config['node_count']}: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    test_structured_generators()
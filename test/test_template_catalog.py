@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试用户模板目录索引和增量刷新
+"""
+
+import sys
+import os
+import json
+import time
+import shutil
+import tempfile
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from templates.template_manager import TemplateManager, CATALOG_FILE_NAME
+
+
+def make_manager(temp_dir):
+    """创建使用临时目录的模板管理器"""
+    manager = TemplateManager()
+    manager.user_templates_dir = Path(temp_dir)
+    manager.catalog_file = Path(temp_dir) / CATALOG_FILE_NAME
+    return manager
+
+
+def test_template_catalog():
+    """测试目录索引的建立、复用和增量刷新"""
+    print("=== 测试模板目录索引 ===")
+
+    temp_dir = tempfile.mkdtemp()
+    template_count = 2000
+
+    try:
+        variables = [
+            {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'separator': '换行',
+             'min_value': '1', 'max_value': '100000', 'loop_count': 1},
+            {'name': 'arr', 'data_type': '整数', 'source_type': '数据范围', 'separator': '空格',
+             'min_value': '1', 'max_value': '1000000000', 'loop_count': 'n'}
+        ]
+        for i in range(template_count):
+            with open(os.path.join(temp_dir, f"template_{i:04d}.json"), 'w', encoding='utf-8') as f:
+                json.dump({'name': f"模板{i}", 'description': f"第{i}个模板", 'variables': variables}, f)
+
+        manager = make_manager(temp_dir)
+
+        start = time.perf_counter()
+        catalog = manager.get_user_catalog()
+        print(f"\n1. 首次建立索引: {len(catalog)} 个模板，耗时 {(time.perf_counter() - start) * 1000:.1f} ms")
+        print(f"   索引文件已生成: {(Path(temp_dir) / CATALOG_FILE_NAME).exists()}")
+        print(f"   条目示例: {catalog[0]['name']}, 变量数 {catalog[0]['variable_count']}")
+
+        new_manager = make_manager(temp_dir)
+        start = time.perf_counter()
+        catalog = new_manager.get_user_catalog()
+        print(f"\n2. 新实例读取索引: {len(catalog)} 个模板，耗时 {(time.perf_counter() - start) * 1000:.1f} ms")
+        print(f"   完整模板缓存数量（应为0）: {len(new_manager._template_cache)}")
+
+        print("\n3. 修改一个模板、删除一个模板后增量刷新")
+        time.sleep(0.01)
+        with open(os.path.join(temp_dir, "template_0001.json"), 'w', encoding='utf-8') as f:
+            json.dump({'name': "修改后的模板", 'description': "已修改", 'variables': variables[:1]}, f)
+        os.remove(os.path.join(temp_dir, "template_0002.json"))
+
+        catalog = new_manager.get_user_catalog()
+        names = [entry['name'] for entry in catalog]
+        status = "✓" if "修改后的模板" in names and "模板2" not in names else "✗"
+        print(f"   模板数量: {len(catalog)}，修改与删除已反映: {status}")
+
+        print("\n4. 选中时按需加载完整变量")
+        detail = new_manager.load_template_detail(catalog[0])
+        print(f"   {detail['name']}: {len(detail['variables'])} 个变量")
+        print(f"   已加载的完整模板数量（应为1）: {len(new_manager._template_cache)}")
+
+        print("\n5. 返回的是副本，修改不影响缓存")
+        catalog[0]['name'] = "被调用方改掉"
+        detail['variables'].clear()
+        again = new_manager.get_user_catalog()[0]
+        detail = new_manager.load_template_detail(again)
+        status = "✓" if again['name'] != "被调用方改掉" and len(detail['variables']) > 0 else "✗"
+        print(f"   {status} {again['name']}: {len(detail['variables'])} 个变量")
+
+        print("\n6. 移动模板目录后索引仍然可用")
+        moved_dir = temp_dir + "_moved"
+        shutil.move(temp_dir, moved_dir)
+        try:
+            moved = make_manager(moved_dir)
+            detail = moved.get_template_by_name("模板10")
+            status = "✓" if detail and detail['file_path'].startswith(moved_dir) else "✗"
+            print(f"   {status} 从新位置加载: {detail and os.path.basename(detail['file_path'])}")
+        finally:
+            shutil.move(moved_dir, temp_dir)
+
+    finally:
+        shutil.rmtree(temp_dir)
+        print(f"\n已清理临时目录: {temp_dir}")
+
+
+if __name__ == "__main__":
+    test_template_catalog()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试模板搜索索引
+"""
+
+import sys
+import os
+import time
+import random
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from templates.template_manager import TemplateManager
+from templates.template_search import TemplateSearchIndex, tokenize
+
+
+def test_tokenize():
+    """测试分词和数字归一化"""
+    print("=== 测试分词 ===")
+    for text in ["tree with n up to 1e5", "数组长度+数组元素", "max:10^9 type:整数", "0.5 -3"]:
+        print(f"{text!r} -> {tokenize(text)}")
+
+
+def test_template_search():
+    """测试默认模板上的搜索结果"""
+    print("\n=== 测试默认模板搜索 ===")
+    manager = TemplateManager()
+    index = TemplateSearchIndex()
+    index.build([('default', template) for template in manager.load_default_templates()])
+
+    for query in ["数组", "矩阵", "graph", "type:浮点数", "source:字符集合", "loop:n", "max:1e2", "坐"]:
+        results = index.search(query)
+        print(f"{query!r}: {[template['name'] for _, template in results[:3]]}")
+
+
+def test_search_latency():
+    """测试大量模板时的搜索延迟"""
+    print("\n=== 测试搜索延迟 ===")
+    rng = random.Random(1)
+    words = ["树", "图", "数组", "字符串", "矩阵", "排列", "区间", "查询", "tree", "graph", "query"]
+    documents = []
+    for i in range(5000):
+        n_max = rng.choice(["100", "1000", "100000", "1000000000"])
+        documents.append(('user', {
+            'name': f"{rng.choice(words)}{rng.choice(words)} {i}",
+            'description': f"{rng.choice(words)} n 最大 {n_max}",
+            'variable_summary': [
+                {'name': 'n', 'data_type': '整数', 'source_type': '数据范围', 'min_value': '1', 'max_value': n_max},
+                {'name': 'arr', 'data_type': rng.choice(['整数', '字符串']), 'source_type': '数据范围',
+                 'min_value': '1', 'max_value': '1000000000', 'loop_count': 'n'},
+            ]
+        }))
+
+    index = TemplateSearchIndex()
+    start = time.perf_counter()
+    index.build(documents)
+    print(f"建立 {len(documents)} 个模板的索引耗时: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    query = "tree with n up to 1e5"
+    for length in range(1, len(query) + 1):
+        partial = query[:length]
+        start = time.perf_counter()
+        results = index.search(partial)
+        elapsed = (time.perf_counter() - start) * 1000
+        if length % 5 == 0 or length == len(query):
+            print(f"{partial!r}: {len(results)} 个结果，耗时 {elapsed:.2f} ms")
+    print(f"最佳结果: {results[0][1]['name']}, {results[0][1]['description']}")
+
+
+if __name__ == "__main__":
+    test_tokenize()
+    test_template_search()
+    test_search_latency()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试时间限制标定：多次运行统计、建议时间限制和报告导出
+"""
+
+import sys
+import os
+import csv
+import json
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.file_manager_core import FileManagerCore
+from core.time_calibration import percentile, suggest_time_limit, format_report
+from gui.func.solution_executor import SolutionExecutor
+from core.solution_runner import BuildCache
+
+# 用时随 n 增长的标程
+CODE = """def main():
+    n = int(input_data)
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+"""
+
+
+def test_time_calibration():
+    """测试统计函数、标定报告和导出文件"""
+    print("=== 测试时间限制标定 ===")
+
+    print("\n1. 统计函数")
+    status = "✓" if percentile([1, 2, 3, 4], 50) == 2.5 and percentile([5], 99) == 5 else "✗"
+    print(f"   {status} 分位数")
+    limits = [suggest_time_limit(t) for t in (0.01, 0.42, 1.0)]
+    status = "✓" if limits == [0.5, 0.9, 2.0] else "✗"
+    print(f"   {status} 建议时间限制 {limits}")
+
+    print("\n2. 标定")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = SolutionExecutor(FileManagerCore())
+        executor.build_cache = BuildCache(os.path.join(temp_dir, 'cache'))
+        progress = []
+        report = executor.calibrate_time_limit(CODE, ["10", "1000", "3000000"], temp_dir, repeats=3,
+                                               progress_callback=lambda done, total: progress.append(done))
+        cases = report['cases']
+        status = "✓" if (len(cases) == 3 and all(len(case['wall']) == 3 for case in cases)
+                         and report['slowest_case'] == "test03.in" and progress[-1] == 9) else "✗"
+        print(f"   {status} 最慢用例 {report['slowest_case']}，进度 {progress[-1]}/9")
+        for line in format_report(report).splitlines():
+            print(f"      {line}")
+
+        print("\n3. 导出")
+        with open(os.path.join(temp_dir, 'timing.json'), encoding='utf-8') as f:
+            saved = json.load(f)
+        with open(os.path.join(temp_dir, 'timing.csv'), encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        status = "✓" if saved['suggested_time_limit'] == report['suggested_time_limit'] and len(rows) == 4 else "✗"
+        print(f"   {status} timing.json 和 timing.csv（{len(rows) - 1} 行）")
+
+        print("\n4. 标程运行出错")
+        try:
+            executor.calibrate_time_limit("def main():\n    return 1 // 0\n", ["1"], temp_dir, repeats=1)
+            print("   ✗ 没有报错")
+        except ValueError as e:
+            print(f"   ✓ {str(e).splitlines()[0]}")
+
+
+if __name__ == "__main__":
+    test_time_calibration()
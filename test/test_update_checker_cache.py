@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试更新检查的间隔缓存和条件请求
+使用本地HTTP服务代替GitHub
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.update_checker import UpdateChecker
+
+REMOTE_DATA = {
+    "level": "9.9.9",
+    "update_time": "2025-01-20",
+    "update_content": ["本地HTTP服务模拟的更新"]
+}
+ETAG = '"tktool-test-etag"'
+
+
+class UpdateHandler(BaseHTTPRequestHandler):
+    """模拟 raw.githubusercontent.com，支持 ETag 条件请求"""
+    requests_log = []
+
+    def do_GET(self):
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match == ETAG:
+            UpdateHandler.requests_log.append(304)
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = json.dumps(REMOTE_DATA).encode('utf-8')
+        UpdateHandler.requests_log.append(200)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_update_checker_cache():
+    """测试检查间隔、ETag条件请求和磁盘缓存"""
+    print("=== 测试更新检查缓存 ===")
+
+    server = HTTPServer(('127.0.0.1', 0), UpdateHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        config_file = os.path.join(temp_dir, 'update_config.json')
+        with open(config_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "github_raw_url": f"http://127.0.0.1:{server.server_port}/update.json",
+                "github_page_url": "https://example.com",
+                "timeout": 5,
+                "check_interval_hours": 24
+            }, f)
+
+        local_file = os.path.join(temp_dir, 'update.json')
+        state_file = os.path.join(temp_dir, 'update_state.json')
+        with open(local_file, 'w', encoding='utf-8') as f:
+            json.dump({"level": "1.0.0", "update_time": "2025-01-01"}, f)
+
+        checker = UpdateChecker(local_update_file=local_file, config_file=config_file, state_file=state_file)
+
+        print("\n1. 首次检查（应下载完整文件）")
+        print(f"结果: {checker.check_for_updates()}")
+        print(f"服务器响应: {UpdateHandler.requests_log}")
+
+        print("\n2. 间隔内再次检查（不应访问网络）")
+        print(f"结果: {checker.check_for_updates()}")
+        print(f"服务器响应: {UpdateHandler.requests_log}")
+        status = "✓" if UpdateHandler.requests_log == [200] else "✗"
+        print(f"间隔内未发出请求: {status}")
+
+        print("\n3. 强制检查（应发送If-None-Match并得到304）")
+        print(f"结果: {checker.check_for_updates(force=True)}")
+        print(f"服务器响应: {UpdateHandler.requests_log}")
+        status = "✓" if UpdateHandler.requests_log == [200, 304] else "✗"
+        print(f"条件请求返回304: {status}")
+
+        print("\n4. 新实例读取磁盘缓存（不访问网络）")
+        new_checker = UpdateChecker(local_update_file=local_file, config_file=config_file, state_file=state_file)
+        print(f"缓存结果: {new_checker.get_cached_result()}")
+        print(f"上次检查仍在间隔内: {new_checker.is_check_fresh()}")
+
+    finally:
+        server.shutdown()
+        shutil.rmtree(temp_dir)
+        print(f"\n已清理临时目录: {temp_dir}")
+
+
+if __name__ == "__main__":
+    test_update_checker_cache()
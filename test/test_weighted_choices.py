@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试带权重的选择列表
+"""
+
+import sys
+import os
+import time
+from collections import Counter
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_generator_core import DataGeneratorCore
+from core.generation_plan import parse_choices
+
+
+def test_weighted_choices():
+    """测试权重解析、抽样比例和批量抽取耗时"""
+    print("=== 测试带权重的选择列表 ===")
+
+    print("\n1. 解析选项")
+    for choices, data_type in [(["0:90%", "1:10%"], "整数"), (["a:3", "b:1"], "字符")]:
+        values, cum_weights = parse_choices(choices, data_type, weighted=True)
+        print(f"   {choices} -> 值 {values}，累积权重 {cum_weights}")
+
+    print("\n2. 未勾选按权重时选项按原样使用")
+    for choices, data_type in [(["1", "2", "3"], "整数"), (["12:30", "1:2", "a:5"], "字符串")]:
+        values, cum_weights = parse_choices(choices, data_type)
+        status = "✓" if values == [type(values[0])(c) for c in choices] and cum_weights is None else "✗"
+        print(f"   {status} {choices} -> 值 {values}")
+    try:
+        parse_choices(["0:90%", "1"], "整数", "bit", weighted=True)
+        print("   ✗ 缺少权重的选项没有报错")
+    except ValueError as e:
+        print(f"   ✓ {e}")
+
+    print("\n3. 抽样比例（10^6 次）")
+    generator = DataGeneratorCore()
+    config = {'name': 'bit', 'data_type': '整数', 'source_type': '选择列表', 'separator': '空格',
+              'choices': ["0:90%", "1:10%"], 'weighted': True, 'loop_count': 1000000}
+    start = time.perf_counter()
+    data = generator.generate_test_data([config], 1)[0]
+    elapsed = (time.perf_counter() - start) * 1000
+    counts = Counter(data.split())
+    ratio = counts['0'] / (counts['0'] + counts['1'])
+    status = "✓" if abs(ratio - 0.9) < 0.01 else "✗"
+    print(f"   0 的比例 {ratio:.4f} {status}，耗时 {elapsed:.0f} ms")
+
+    print("\n4. 大量选项")
+    config = dict(config, choices=[f"{i}:{i % 7 + 1}" for i in range(10000)], loop_count=100000)
+    start = time.perf_counter()
+    values = generator.generate_test_data([config], 1)[0].split()
+    print(f"   10000 个选项抽取 {len(values)} 次，耗时 {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    print("\n5. 权重之和为0时报错")
+    try:
+        generator.generate_test_data([dict(config, choices=["0:0", "1:0%"])], 1)
+        print("   ✗ 没有报错")
+    except ValueError as e:
+        print(f"   ✓ {e}")
+
+
+if __name__ == "__main__":
+    test_weighted_choices()